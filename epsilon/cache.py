@@ -0,0 +1,163 @@
+# Epsilon
+# Copyright (C) 2018
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import array
+import hashlib
+import os
+import tempfile
+from . import dfa
+from . import ucd
+from . import version
+
+_MAGIC = b"epsilon-automaton2\n"
+
+def digest(items, codespace, minimize = False):
+    """Return the cache key of a section.
+
+    The key covers the Unicode version, as classes such as \\w and
+    \\p{...} and case folding are compiled from the Unicode database.
+
+    :param items: the (key, value) pairs of the section, interpolated.
+    :param codespace: the codepoints over which the section is compiled.
+    :param minimize: whether the automaton is minimized.
+    :return: a hexadecimal string.
+    """
+    h = hashlib.sha256(_MAGIC)
+    h.update(repr((version.VERSION, ucd.version, tuple(codespace),
+            bool(minimize), tuple(items))).encode("utf-8"))
+    return h.hexdigest()
+
+def dumps(automaton):
+    """Serialize an automaton as bytes.
+
+    The automaton is serialized by dfa.dumpints(): the number of states,
+    the error state and then, for every state, its accepted token numbers
+    and its (first, last, nextstate) transitions, each preceded by a
+    count, followed by the token names.
+
+    :param automaton: an Automaton.
+    :return: bytes.
+    """
+    names = list(dict.fromkeys(
+            name for accepts in automaton.accepts for name in accepts))
+    numbers = {name: n for n, name in enumerate(names)}
+
+    ints = array.array("i", [len(automaton.transitions), automaton.error])
+    for edges, accepts in zip(automaton.transitions, automaton.accepts):
+        ints.append(len(accepts))
+        ints.extend(numbers[name] for name in accepts)
+        ints.append(len(edges))
+        for edge in edges:
+            ints.extend(edge)
+    return dfa.dumpints(_MAGIC, ints, names)
+
+def loads(data):
+    """Deserialize an automaton serialized by dumps().
+
+    :param data: bytes.
+    :return: an Automaton.
+    :raises ValueError: if data is not a serialized automaton.
+    """
+    ints, names = dfa.loadints(data, _MAGIC)
+    try:
+        nstates, error = ints[0], ints[1]
+        i = 2
+        transitions, accepts = [], []
+        for _ in range(nstates):
+            n = ints[i]
+            accepts.append([names[number] for number in ints[i + 1:i + 1 + n]])
+            i += 1 + n
+            n = ints[i]
+            transitions.append([tuple(ints[j:j + 3])
+                    for j in range(i + 1, i + 1 + 3 * n, 3)])
+            i += 1 + 3 * n
+    except IndexError:
+        raise ValueError("truncated automaton")
+    if i != len(ints):
+        raise ValueError("trailing data after automaton")
+    return dfa.Automaton(transitions, accepts, error)
+
+def default_directory():
+    """Return the default cache directory.
+
+    This is $EPSILON_CACHE, if set, and otherwise the epsilon directory
+    of $XDG_CACHE_HOME or ~/.cache.
+    """
+    directory = os.environ.get("EPSILON_CACHE")
+    if directory:
+        return directory
+    return os.path.join(os.environ.get("XDG_CACHE_HOME")
+            or os.path.join(os.path.expanduser("~"), ".cache"), "epsilon")
+
+class Cache:
+    """A directory of serialized automata, keyed by digest().
+
+    The cache is an optimization only: unreadable entries are misses and
+    failures to write are ignored. When the entries exceed maxsize bytes,
+    the least recently used are evicted.
+    """
+
+    def __init__(self, directory = None, maxsize = 64 << 20):
+        self.directory = directory or default_directory()
+        self.maxsize = maxsize
+
+    def _path(self, key):
+        return os.path.join(self.directory, key + ".automaton")
+
+    def get(self, key):
+        """Return the cached automaton for key, or None."""
+        path = self._path(key)
+        try:
+            with open(path, "rb") as stream:
+                automaton = loads(stream.read())
+            os.utime(path)
+        except (OSError, ValueError):
+            return None
+        return automaton
+
+    def put(self, key, automaton):
+        """Cache an automaton under key."""
+        try:
+            os.makedirs(self.directory, exist_ok = True)
+            fd, temp = tempfile.mkstemp(dir = self.directory)
+            try:
+                with os.fdopen(fd, "wb") as stream:
+                    stream.write(dumps(automaton))
+                os.replace(temp, self._path(key))
+            except BaseException:
+                os.unlink(temp)
+                raise
+            self.evict()
+        except OSError:
+            pass
+
+    def evict(self):
+        """Remove the least recently used entries beyond maxsize."""
+        entries = []
+        with os.scandir(self.directory) as scan:
+            for entry in scan:
+                if entry.name.endswith(".automaton"):
+                    stat = entry.stat()
+                    entries.append((stat.st_mtime, stat.st_size, entry.path))
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= self.maxsize:
+                break
+            try:
+                os.unlink(path)
+                total -= size
+            except OSError:
+                pass
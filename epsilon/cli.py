@@ -17,21 +17,33 @@
 import argparse
 import configparser
 import collections
+import concurrent.futures
+import itertools
 import os.path
 import re
 import sys
 import contextlib
+from . import cache
 from . import dfa
 from . import parse
+from . import regex
+from . import target_c
 from . import target_dot
 from . import target_execute
 from . import target_python
+from . import target_python_direct
+from . import target_tables
+from . import util
+from . import utf8
 from . import version
 
 _targets = collections.OrderedDict([
+        ("c", target_c.Target),
         ("dot", target_dot.Target),
         ("execute", target_execute.Target),
-        ("python", target_python.Target)])
+        ("python", target_python.Target),
+        ("python-direct", target_python_direct.Target),
+        ("tables", target_tables.Target)])
 
 class _Interpolation(configparser.Interpolation):
     _re_braces = re.compile(
@@ -73,7 +85,23 @@ class _Interpolation(configparser.Interpolation):
 
         return "".join(fragments)
 
-def _compile(paths, target):
+# Section flags, set by the _flags key of a section.
+_flags = frozenset("i")
+
+def _build(patterns, minimize = False, jobs = 1, flags = "", encode = False):
+    parser = parse.Parser(ignorecase = "i" in flags)
+    vector = dfa.ExpressionVector(
+            (token, parser.parse(pattern)) for token, pattern in patterns)
+    if encode:
+        vector = dfa.ExpressionVector(
+                (token, utf8.lower(expr)) for token, expr in vector)
+    automaton = dfa.construct(vector, jobs)
+    if minimize:
+        automaton = dfa.minimize(automaton)
+    return automaton
+
+def _compile(paths, target, minimize = False, automata = None, jobs = 1,
+        encode = False):
     config = configparser.ConfigParser(interpolation = _Interpolation())
     config.optionxform = str
     if paths:
@@ -85,25 +113,48 @@ def _compile(paths, target):
 
     target.emit_header()
 
+    # Sections are independent, so those which are not cached may be
+    # built by a pool of worker processes. They are still emitted in
+    # their original order. A single section is built by a pool instead.
+    # Encoded automata are keyed by their byte codespace.
+    namespace = utf8.octets if encode else regex.unicode
+    names, patterns, flags, keys = [], [], [], []
     for name in config.sections():
         section = config[name]
-        parser = parse.Parser()
         tokens = tuple(key for key in section if not key.startswith("_"))
         if tokens:
-            if 0:
-                for token in tokens:
-                    pat = section[token]
-                    parsed = parser.parse(pat.replace('\n', ''))
+            names.append(name)
+            patterns.append(tuple((token, section[token].replace("\n", ""))
+                    for token in tokens))
+            flags.append("".join(section.get("_flags", "").split()))
+            unknown = set(flags[-1]) - _flags
+            if unknown:
+                raise ValueError("[{}]: unknown flags '{}'".format(
+                        name, "".join(sorted(unknown))))
+            keys.append(cache.digest(
+                    patterns[-1] + (("_flags", flags[-1]),),
+                    namespace.codespace, minimize) if automata else None)
 
-                    print('T', token)
-                    print('PAT', pat)
-                    print('PARSED', parsed)
+    built = [automata.get(key) if automata else None for key in keys]
+    missing = [i for i, automaton in enumerate(built) if automaton is None]
+    if jobs > 1 and len(missing) > 1:
+        with concurrent.futures.ProcessPoolExecutor(jobs) as pool:
+            results = list(pool.map(_build,
+                    (patterns[i] for i in missing),
+                    itertools.repeat(minimize),
+                    itertools.repeat(1),
+                    (flags[i] for i in missing),
+                    itertools.repeat(encode)))
+    else:
+        results = [_build(patterns[i], minimize, jobs, flags[i], encode)
+                for i in missing]
+    for i, automaton in zip(missing, results):
+        built[i] = automaton
+        if automata:
+            automata.put(keys[i], automaton)
 
-            vector = dfa.ExpressionVector(
-                    (token, parser.parse(section[token].replace("\n", "")))
-                    for token in tokens)
-            automaton = dfa.construct(vector)
-            target.emit_automaton(name, automaton)
+    for name, automaton in zip(names, built):
+        target.emit_automaton(name, automaton)
 
     target.emit_trailer()
 
@@ -114,10 +165,27 @@ def main(argv = sys.argv):
             choices = _targets,
             default = "python",
             help = "target language (default = python)")
+    parser.add_argument("-j", "--jobs",
+            metavar = "N",
+            type = int,
+            default = 1,
+            help = "compile sections in N processes (default = 1)")
+    parser.add_argument("-m", "--minimize",
+            action = "store_true",
+            help = "minimize the number of automaton states")
+    parser.add_argument("--no-cache",
+            action = "store_true",
+            help = "do not use the cache of compiled automata")
     parser.add_argument("-o", "--output",
             metavar = "outfile",
             nargs = 1,
             help = "output file (default = standard output)")
+    parser.add_argument("-s", "--statistics",
+            action = "store_true",
+            help = "report derivative cache statistics on standard error")
+    parser.add_argument("-u", "--utf8",
+            action = "store_true",
+            help = "compile automata which scan UTF-8 encoded bytes")
     parser.add_argument("-v", "--version",
             action = "version",
             version = version.VERSION)
@@ -125,12 +193,21 @@ def main(argv = sys.argv):
     args = parser.parse_args(argv[1:])
 
     target = _targets[args.target](args)
+    automata = None if args.no_cache else cache.Cache()
     if args.output:
         with open(args.output[0], "w") as stream:
             with contextlib.redirect_stdout(stream):
-                _compile(args.paths, target)
+                _compile(args.paths, target, args.minimize, automata,
+                        args.jobs, args.utf8)
     else:
-        _compile(args.paths, target)
+        _compile(args.paths, target, args.minimize, automata, args.jobs,
+                args.utf8)
+
+    if args.statistics:
+        namespace = utf8.octets if args.utf8 else regex.unicode
+        info = namespace.derivative.cache_info()
+        util.log("derivatives: %d hits, %d misses, %d cached",
+                info.hits, info.misses, info.currsize)
 
 if __name__ == '__main__':
     main()
@@ -14,16 +14,28 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
+import array
 import bisect
 import collections
-import functools
-import time
+import concurrent.futures
+import itertools
+import mmap
+import sys
+import zlib
 from . import regex
 from . import util
 
 Automaton = collections.namedtuple("Automaton",
         ["transitions", "accepts", "error"])
 
+# The dense form of an automaton, used for scanning. Symbols map to
+# equivalence classes, via lowclasses for symbols below 256 and otherwise
+# via the sorted range starts in highstarts, and the next state is
+# transitions[state * nclasses + class].
+Table = collections.namedtuple("Table",
+        ["lowclasses", "highstarts", "highclasses", "nclasses",
+            "transitions", "accepts", "error"])
+
 class ExpressionVector(tuple):
     def __new__(cls, iterable):
         return super().__new__(cls, iterable)
@@ -40,50 +52,425 @@ class ExpressionVector(tuple):
                 (name, expr.derivative(symbol)) for name, expr in self)
   
     def derivative_classes(self):
-        return filter(None, functools.reduce(util.product_intersections, 
-                (expr.derivative_classes() for _, expr in self)))
+        return util.refine_partitions(
+                *(expr.derivative_classes() for _, expr in self))
+
+    def symbolsets(self):
+        return set().union(*(expr.symbolsets() for _, expr in self))
 
-def construct(expr):
+def _expand(states):
+    return [[(derivative_class, state.derivative(derivative_class[0][0]))
+                for derivative_class in sorted(state.derivative_classes())]
+            for state in states]
+
+def construct(expr, jobs = 1):
     """Construct an automaton from a regular expression.
 
+    States are numbered breadth first. With more than one job, each
+    frontier of new states is split into batches whose derivatives are
+    computed by a pool of processes, and the result is identical to a
+    construction with one job.
+
     :param expr: a regular expression or a ExpressionVector.
-    :return: 
+    :param jobs: the number of processes to use.
+    :return: an Automaton.
     """
     states = {expr: 0}
     transitions = [[]]
 
-    start_time = time.time()
-    i = 0
-
-    stack = [expr]
-    while stack:
-        state = stack.pop()
-        number = states[state]
-        for derivative_class in state.derivative_classes():
-            symbol = derivative_class[0][0]
-            nextstate = state.derivative(symbol)
-            if nextstate not in states:
-                states[nextstate] = len(states)
-                transitions.append([])
-                stack.append(nextstate)
-            
-            nextnumber = states[nextstate]
-            for first, last in derivative_class:
-                transitions[number].append((first, last, nextnumber))
-
-                i += 1
-                if i % 5 == 0:
-                    #elapsed = time.time() - start_time
-                    #util.log('%d iterations in %.5f seconds', i, elapsed)
-                    pass
+    pool = concurrent.futures.ProcessPoolExecutor(jobs) if jobs > 1 else None
+    try:
+        frontier = [expr]
+        while frontier:
+            if pool and len(frontier) > 1:
+                size = -(-len(frontier) // jobs)
+                expansions = itertools.chain.from_iterable(pool.map(_expand,
+                        (frontier[i:i + size]
+                            for i in range(0, len(frontier), size))))
+            else:
+                expansions = _expand(frontier)
 
-        transitions[number].sort()
+            nextfrontier = []
+            for state, expansion in zip(frontier, expansions):
+                number = states[state]
+                for derivative_class, nextstate in expansion:
+                    if nextstate not in states:
+                        states[nextstate] = len(states)
+                        transitions.append([])
+                        nextfrontier.append(nextstate)
 
+                    nextnumber = states[nextstate]
+                    for first, last in derivative_class:
+                        transitions[number].append((first, last, nextnumber))
+                transitions[number].sort()
+            frontier = nextfrontier
+    finally:
+        if pool:
+            pool.shutdown()
 
     accepts = [state.nullable() for state in states]
     error = states[expr.NULL]
     return Automaton(transitions, accepts, error)
 
+def minimize(automaton):
+    """Return an equivalent automaton with the fewest states.
+
+    States are first partitioned by the list of tokens they accept, then
+    refined with Hopcroft's algorithm. The alphabet is the set of
+    elementary ranges between the transition boundaries of all states.
+
+    :param automaton: an Automaton, as returned by construct().
+    :return: a minimal Automaton. State 0 remains the start state.
+    """
+    transitions = automaton.transitions
+    nstates = len(transitions)
+
+    # Transitions of every state are constant over each elementary range,
+    # which we identify by its first symbol. Symbols without a transition
+    # lead to the error state.
+    starts = sorted(set(itertools.chain.from_iterable((first, last + 1)
+            for edges in transitions for first, last, _ in edges)))
+    nclasses = len(starts)
+    inverse = [collections.defaultdict(list) for _ in range(nclasses)]
+    for state, edges in enumerate(transitions):
+        c = 0
+        for first, last, nextstate in edges:
+            while starts[c] < first:
+                inverse[c][automaton.error].append(state)
+                c += 1
+            while starts[c] <= last:
+                inverse[c][nextstate].append(state)
+                c += 1
+        while c < nclasses:
+            inverse[c][automaton.error].append(state)
+            c += 1
+
+    partition = {}
+    for state, accepts in enumerate(automaton.accepts):
+        partition.setdefault(tuple(accepts), set()).add(state)
+    members = list(partition.values())
+    block = [0] * nstates
+    for b, states in enumerate(members):
+        for state in states:
+            block[state] = b
+
+    largest = max(range(len(members)), key = lambda b: len(members[b]))
+    pending = {(b, c) for b in range(len(members)) if b != largest
+            for c in range(nclasses)}
+    while pending:
+        b, c = pending.pop()
+        touched = collections.defaultdict(set)
+        for target in members[b]:
+            for source in inverse[c].get(target, ()):
+                touched[block[source]].add(source)
+
+        for split, inside in touched.items():
+            if len(inside) == len(members[split]):
+                continue
+            outside = members[split] - inside
+            small, large = (inside, outside)\
+                    if len(inside) <= len(outside) else (outside, inside)
+            members[split] = large
+            members.append(small)
+            for state in small:
+                block[state] = len(members) - 1
+            # Splitting by the smaller half is sufficient, and if
+            # (split, c) is still pending it now covers the larger half.
+            pending.update((len(members) - 1, c) for c in range(nclasses))
+
+    # Number the blocks by their least state, so the start state stays 0.
+    representatives = sorted(min(states) for states in members)
+    numbers = {block[state]: n for n, state in enumerate(representatives)}
+    minimal = []
+    for state in representatives:
+        edges = []
+        for first, last, nextstate in transitions[state]:
+            nextnumber = numbers[block[nextstate]]
+            if edges and edges[-1][1] + 1 == first\
+                    and edges[-1][2] == nextnumber:
+                edges[-1] = (edges[-1][0], last, nextnumber)
+            else:
+                edges.append((first, last, nextnumber))
+        minimal.append(edges)
+
+    accepts = [automaton.accepts[state] for state in representatives]
+    error = numbers[block[automaton.error]]
+    return Automaton(minimal, accepts, error)
+
+def tabulate(automaton):
+    """Return the dense Table form of an automaton.
+
+    Symbols are grouped into classes which lead to the same next state
+    from every state. Class 0 holds the symbols without any transition.
+
+    :param automaton: an Automaton.
+    :return: a Table.
+    """
+    transitions = automaton.transitions
+    nstates = len(transitions)
+    starts = sorted(set(itertools.chain([0, 256],
+            itertools.chain.from_iterable((first, last + 1)
+                for edges in transitions for first, last, _ in edges))))
+
+    # columns[i] lists the next state of every state for the symbols in
+    # [starts[i], starts[i + 1]).
+    columns = [[automaton.error] * nstates for _ in starts]
+    for state, edges in enumerate(transitions):
+        i = 0
+        for first, last, nextstate in edges:
+            i = bisect.bisect_left(starts, first, i)
+            while i < len(starts) and starts[i] <= last:
+                columns[i][state] = nextstate
+                i += 1
+
+    classes = {tuple(columns[-1]): 0}
+    numbers = [classes.setdefault(tuple(column), len(classes))
+            for column in columns]
+
+    lowclasses = array.array("i", bytes(4 * 256))
+    highstarts, highclasses = array.array("i"), array.array("i")
+    for i, start in enumerate(starts):
+        if start < 256:
+            for symbol in range(start, starts[i + 1]):
+                lowclasses[symbol] = numbers[i]
+        else:
+            highstarts.append(start)
+            highclasses.append(numbers[i])
+
+    table = array.array("i", bytes(4 * nstates * len(classes)))
+    for column, number in classes.items():
+        for state, nextstate in enumerate(column):
+            table[state * len(classes) + number] = nextstate
+
+    return Table(lowclasses, highstarts, highclasses, len(classes),
+            table, automaton.accepts, automaton.error)
+
+def dumpints(magic, ints, names):
+    """Serialize integers and names as bytes.
+
+    This is the format of every serialized automaton and table: a magic
+    string, the numbers of integers and of bytes of names, the integers,
+    all little endian 32 bit integers, and then the names, as newline
+    separated UTF-8.
+
+    :param magic: bytes which identify the format.
+    :param ints: an array of integers.
+    :param names: a sequence of strings.
+    :return: bytes, which loadints() deserializes.
+    """
+    header = "\n".join(names).encode("utf-8")
+    counts = array.array("i", [len(ints), len(header)])
+    if sys.byteorder != "little":
+        counts.byteswap()
+        ints = array.array("i", ints)
+        ints.byteswap()
+    return b"".join([magic, counts.tobytes(), ints.tobytes(), header])
+
+def loadints(data, magic):
+    """Deserialize the integers and names serialized by dumpints().
+
+    The integers are a view of data where possible, so mapped data is
+    neither read nor copied until it is used.
+
+    :param data: a bytes-like object.
+    :param magic: the bytes which identify the format.
+    :return: an (ints, names) pair.
+    :raises ValueError: if data is not in the format or is truncated.
+    """
+    view = memoryview(data)
+    offset = len(magic)
+    if view[:offset] != magic:
+        raise ValueError("unrecognized format")
+    nints = int.from_bytes(view[offset:offset + 4], "little")
+    size = int.from_bytes(view[offset + 4:offset + 8], "little")
+    offset += 8
+    if len(view) != offset + 4 * nints + size:
+        raise ValueError("truncated or trailing data")
+    ints = view[offset:offset + 4 * nints].cast("i")
+    if sys.byteorder != "little":
+        ints = array.array("i", ints)
+        ints.byteswap()
+    return ints, str(view[offset + 4 * nints:], "utf-8").split("\n")
+
+_TABLES_MAGIC = b"epsilon-tables2\n"
+
+def _dumptables(tables):
+    # The number of tables, and for each table nclasses, error, the
+    # numbers of highstarts, states and distinct accepts lists, then its
+    # arrays, the accepts list number of every state and the accepts
+    # lists, as counts followed by token numbers. The names are those of
+    # the tables and then of the tokens.
+    tokens = list(dict.fromkeys(token for _, table in tables
+            for accepts in table.accepts for token in accepts))
+    numbers = {token: n for n, token in enumerate(tokens)}
+
+    ints = array.array("i", [len(tables)])
+    for _, table in tables:
+        sets = {}
+        for accepts in table.accepts:
+            sets.setdefault(tuple(accepts), len(sets))
+        ints.extend([table.nclasses, table.error, len(table.highstarts),
+                len(table.accepts), len(sets)])
+        for values in (table.lowclasses, table.highstarts,
+                table.highclasses, table.transitions):
+            ints.extend(values)
+        ints.extend(sets[tuple(accepts)] for accepts in table.accepts)
+        for accepts in sets:
+            ints.append(len(accepts))
+            ints.extend(numbers[token] for token in accepts)
+    return dumpints(_TABLES_MAGIC, ints,
+            [name for name, _ in tables] + tokens)
+
+def _loadtables(data):
+    ints, names = loadints(data, _TABLES_MAGIC)
+    tables, i = {}, 1
+    for name in names[:ints[0]]:
+        nclasses, error, nhigh, nstates, nsets = ints[i:i + 5]
+        i += 5
+        lowclasses = ints[i:i + 256]
+        i += 256
+        highstarts = ints[i:i + nhigh]
+        highclasses = ints[i + nhigh:i + 2 * nhigh]
+        i += 2 * nhigh
+        transitions = ints[i:i + nstates * nclasses]
+        i += nstates * nclasses
+        numbers = ints[i:i + nstates]
+        i += nstates
+        sets = []
+        for _ in range(nsets):
+            n = ints[i]
+            sets.append([names[ints[0] + number]
+                    for number in ints[i + 1:i + 1 + n]])
+            i += 1 + n
+        tables[name] = Table(lowclasses, highstarts, highclasses, nclasses,
+                transitions, list(map(sets.__getitem__, numbers)), error)
+    return tables
+
+def dumptable(table, level = 9):
+    """Serialize a Table as zlib compressed bytes.
+
+    The Table is serialized as by writetables(), with an empty name.
+
+    :param table: a Table.
+    :param level: the zlib compression level, from 0 (none) to 9.
+    :return: bytes, which loadtable() deserializes.
+    """
+    return zlib.compress(_dumptables([("", table)]), level)
+
+def loadtable(data):
+    """Deserialize a Table serialized by dumptable()."""
+    table = _loadtables(zlib.decompress(data))[""]
+    # The table owns its arrays rather than viewing the data.
+    return table._replace(**{field: array.array("i",
+                bytes(getattr(table, field)))
+            for field in ("lowclasses", "highstarts", "highclasses",
+                "transitions")})
+
+def writetables(stream, tables):
+    """Write named Tables to a binary stream, for maptables().
+
+    The tables are serialized by dumpints(), under their own magic.
+
+    :param stream: a binary stream.
+    :param tables: a sequence of (name, Table) pairs.
+    """
+    stream.write(_dumptables(tables))
+
+def maptables(path):
+    """Map the Tables of a file written by writetables() into memory.
+
+    The arrays of the tables are views of a shared, read only mapping of
+    the file, so they are neither read nor copied until they are used,
+    and processes which map the same file share its pages.
+
+    :param path: the path of the file.
+    :return: a dict of Tables, by name.
+    :raises ValueError: if the file was not written by writetables().
+    """
+    with open(path, "rb") as stream:
+        mapping = mmap.mmap(stream.fileno(), 0, access = mmap.ACCESS_READ)
+    return _loadtables(mapping)
+
+class LazyAutomaton(Table):
+    """A Table whose states are constructed as scanning reaches them.
+
+    Transitions which have not been constructed yet are -1, and expand()
+    constructs them. Symbol classes are the coarsest refinement of the
+    SymbolSets of the expression, plus a last class for the symbols
+    outside the codespace. Once maxstates states exist, every state but
+    the start and error states is discarded and construction starts
+    over. The transitions and accepts are flushed in place, so scanners
+    may hold on to them.
+    """
+
+    def __new__(cls, expr, maxstates = 1 << 12):
+        classes = util.refine_partitions(
+                *(leaf.derivative_classes() for leaf in expr.symbolsets()))
+        outside = len(classes)
+        lowclasses = array.array("i", [outside]) * 256
+        highstarts = {256: outside}
+        for c, codepoints in enumerate(classes):
+            for first, last in codepoints:
+                for symbol in range(first, min(last + 1, 256)):
+                    lowclasses[symbol] = c
+                if last >= 256:
+                    highstarts.setdefault(last + 1, outside)
+        for c, codepoints in enumerate(classes):
+            for first, last in codepoints:
+                if last >= 256:
+                    highstarts[max(first, 256)] = c
+        highstarts = sorted(highstarts.items())
+
+        error = 0 if expr == expr.NULL else 1
+        self = super().__new__(cls, lowclasses,
+                array.array("i", (start for start, _ in highstarts)),
+                array.array("i", (c for _, c in highstarts)),
+                len(classes) + 1, array.array("i"), [], error)
+        self.representatives = [codepoints[0][0] for codepoints in classes]
+        self.maxstates = max(maxstates, 2)
+        self.flushes = 0
+        self._start = expr
+        self._states, self._exprs = {}, []
+        self._flush()
+        return self
+
+    def _add(self, expr):
+        number = len(self._exprs)
+        self._states[expr] = number
+        self._exprs.append(expr)
+        self.accepts.append(expr.nullable())
+        self.transitions.extend(array.array("i", [-1]) * (self.nclasses - 1))
+        self.transitions.append(self.error)
+        return number
+
+    def _flush(self):
+        self._states.clear()
+        del self._exprs[:], self.accepts[:], self.transitions[:]
+        self._add(self._start)
+        if self._start.NULL not in self._states:
+            self._add(self._start.NULL)
+        row = self.error * self.nclasses
+        self.transitions[row:row + self.nclasses] =\
+                array.array("i", [self.error]) * self.nclasses
+
+    def expand(self, state, c):
+        """Construct and return the next state of a state on a class.
+
+        If the state cache is full it is flushed first, which renumbers
+        every state but the start and error states.
+        """
+        nextexpr = self._exprs[state].derivative(self.representatives[c])
+        nextstate = self._states.get(nextexpr)
+        if nextstate is None:
+            if len(self._exprs) >= self.maxstates:
+                self._flush()
+                self.flushes += 1
+                nextstate = self._states.get(nextexpr)
+                return self._add(nextexpr) if nextstate is None else nextstate
+            nextstate = self._add(nextexpr)
+        self.transitions[state * self.nclasses + c] = nextstate
+        return nextstate
+
 class NoMatchError(Exception):
     def __init__(self, atoms):
         msg = "No match for input {}".format(atoms)
@@ -91,16 +478,19 @@ class NoMatchError(Exception):
 
 def scan(automaton, iterable,
         tosymbol = ord, pack = lambda atoms: "".join(atoms)):
+    if not isinstance(automaton, Table):
+        automaton = tabulate(automaton)
+    lowclasses, highstarts, highclasses, nclasses, transitions, accepts,\
+            error = automaton
+    expand = getattr(automaton, "expand", None)
+
     buffer, offset = [], 0
     state, accept, length = 0, False, 0
     atoms = iterable
 
-    start_time = time.time()
-
-    i = 0
     while True:
-        if automaton.accepts[state]:
-            accept = automaton.accepts[state]
+        if accepts[state]:
+            accept = accepts[state]
             length = offset
 
         if offset < len(buffer):
@@ -112,34 +502,183 @@ def scan(automaton, iterable,
 
         if atom is not None:
             symbol = tosymbol(atom)
-            transitions = automaton.transitions[state]
-
-            # This is similar to util.IntegerSet.has(), but doesn't call it?
-            i = bisect.bisect(transitions, (symbol,))
-            if i < len(transitions) and symbol == transitions[i][0]:
-                state = transitions[i][2]
-            elif i > 0 and transitions[i-1][0] <= symbol <= transitions[i-1][1]:
-                state = transitions[i-1][2]
+            if symbol < 256:
+                c = lowclasses[symbol]
             else:
-                state = automaton.error
+                c = highclasses[bisect.bisect(highstarts, symbol) - 1]
+            nextstate = transitions[state * nclasses + c]
+            if nextstate < 0:
+                nextstate = expand(state, c)
+            state = nextstate
             offset += 1
         else:
-            state = automaton.error
+            state = error
 
-        if state == automaton.error:
-            if accept:
+        if state == error:
+            if accept and length:
                 yield accept[0], pack(buffer[:length])
                 buffer, offset = buffer[length:], 0
                 state, accept, length = 0, False, 0
-
-                # ANDY FIX: Prevents infinite loop
-                break
             elif buffer:
                 raise NoMatchError(buffer)
             else:
                 break
-        i += 1
-        if i % 100 == 0:
-            #elapsed = time.time() - start_time
-            #util.log('%d iterations in %.5f seconds', 100, elapsed)
-            pass
+
+def stream(automaton, file, chunksize = 1 << 16):
+    """Generate the tokens of a file object as (token, match) pairs.
+
+    The file is read in chunks of chunksize, and only the unmatched tail
+    of a chunk is carried over to the next, so inputs of any size may be
+    scanned in bounded memory (unless a single token is unbounded). A
+    token which reaches the end of a chunk is resumed, not rescanned.
+
+    :param automaton: an Automaton or Table.
+    :param file: a text or binary file object.
+    :param chunksize: the number of characters or bytes read at a time.
+    :raises NoMatchError: if no token matches at some offset.
+    """
+    if not isinstance(automaton, Table):
+        automaton = tabulate(automaton)
+    lowclasses, highstarts, highclasses, nclasses, transitions, accepts,\
+            error = automaton
+    expand = getattr(automaton, "expand", None)
+
+    read = file.read
+    buffer = read(chunksize)
+    binary = not isinstance(buffer, str)
+    if binary:
+        buffer = bytearray(buffer)
+    tosymbol = int if binary else ord
+    eof = not buffer
+
+    start, end = 0, len(buffer)
+    state, accept, length, offset = 0, False, 0, 0
+    while True:
+        while True:
+            if accepts[state]:
+                accept, length = accepts[state], offset
+            if offset == end:
+                break
+            symbol = tosymbol(buffer[offset])
+            if symbol < 256:
+                c = lowclasses[symbol]
+            else:
+                c = highclasses[bisect.bisect(highstarts, symbol) - 1]
+            nextstate = transitions[state * nclasses + c]
+            if nextstate < 0:
+                nextstate = expand(state, c)
+            state = nextstate
+            if state == error:
+                break
+            offset += 1
+
+        if offset == end and not eof:
+            # The token may continue, so keep it and read on.
+            chunk = read(chunksize)
+            eof = not chunk
+            if binary:
+                del buffer[:start]
+                buffer += chunk
+            else:
+                buffer = buffer[start:] + chunk
+            length, offset = length - start, offset - start
+            start, end = 0, len(buffer)
+            continue
+
+        if start == end:
+            break
+        if not accept or length == start:
+            raise NoMatchError(buffer[start:offset + 1])
+        yield accept[0], bytes(buffer[start:length]) if binary\
+                else buffer[start:length]
+        start = offset = length
+        state, accept = 0, False
+
+def match(automaton, text, start = 0, end = None):
+    """Match the longest token of text which begins at start.
+
+    :param automaton: an Automaton or Table.
+    :param text: a str, bytes or memoryview.
+    :param start: the offset at which the match is anchored.
+    :param end: the offset at which to stop matching, or None for the end.
+    :return: a (token, end) pair, or None if no token matches.
+    """
+    if not isinstance(automaton, Table):
+        automaton = tabulate(automaton)
+    lowclasses, highstarts, highclasses, nclasses, transitions, accepts,\
+            error = automaton
+    expand = getattr(automaton, "expand", None)
+    tosymbol = ord if isinstance(text, str) else int
+    if end is None:
+        end = len(text)
+
+    state, accept, length = 0, False, start
+    offset = start
+    while True:
+        if accepts[state]:
+            accept, length = accepts[state], offset
+        if offset == end:
+            break
+        symbol = tosymbol(text[offset])
+        if symbol < 256:
+            c = lowclasses[symbol]
+        else:
+            c = highclasses[bisect.bisect(highstarts, symbol) - 1]
+        nextstate = transitions[state * nclasses + c]
+        if nextstate < 0:
+            nextstate = expand(state, c)
+        state = nextstate
+        if state == error:
+            break
+        offset += 1
+
+    return (accept[0], length) if accept else None
+
+def spans(automaton, text, start = 0, end = None):
+    """Generate the tokens of text as (token, start, end) spans.
+
+    The text is a str, bytes or memoryview which is walked by offset,
+    so matches are only sliced out by the caller when they are needed.
+    Scanning may be resumed at any offset by passing it as start.
+
+    :param automaton: an Automaton or Table.
+    :param text: the text to tokenize.
+    :param start: the offset at which to start scanning.
+    :param end: the offset at which to stop scanning, or None for the end.
+    :raises NoMatchError: if no token matches at some offset.
+    """
+    if not isinstance(automaton, Table):
+        automaton = tabulate(automaton)
+    lowclasses, highstarts, highclasses, nclasses, transitions, accepts,\
+            error = automaton
+    expand = getattr(automaton, "expand", None)
+    tosymbol = ord if isinstance(text, str) else int
+    if end is None:
+        end = len(text)
+
+    # The loop of match(), inlined to save a call per token.
+    while start < end:
+        state, accept, length = 0, False, start
+        offset = start
+        while True:
+            if accepts[state]:
+                accept, length = accepts[state], offset
+            if offset == end:
+                break
+            symbol = tosymbol(text[offset])
+            if symbol < 256:
+                c = lowclasses[symbol]
+            else:
+                c = highclasses[bisect.bisect(highstarts, symbol) - 1]
+            nextstate = transitions[state * nclasses + c]
+            if nextstate < 0:
+                nextstate = expand(state, c)
+            state = nextstate
+            if state == error:
+                break
+            offset += 1
+
+        if not accept or length == start:
+            raise NoMatchError(text[start:offset + 1])
+        yield accept[0], start, length
+        start = length
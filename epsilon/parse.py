@@ -14,6 +14,7 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
+import collections
 import functools
 import itertools
 from . import regex
@@ -56,28 +57,129 @@ class _Buffer(list):
                 raise SyntaxError("'{}' expected".format(wanted))
         return wanted
 
+def _loose(name):
+    """Return a name for loose matching, ignoring case, spaces,
+    underscores and hyphens.
+    """
+    return "".join(c for c in name.lower() if c not in " _-")
+
+def _lookup(properties, aliases, name):
+    """Return the codepoints of a loosely matched property, or None.
+
+    :param properties: a mapping of property names to IntegerSets.
+    :param aliases: a mapping of aliases to property names.
+    :param name: the property name or alias.
+    """
+    wanted = _loose(name)
+    for key in itertools.chain(properties, aliases):
+        if _loose(key) == wanted:
+            return properties[aliases.get(key, key)]
+    return None
+
 def _unicode_property_codepoints(name):
     """Return the codepoints comprising a unicode property.
 
+    The property is a general category, a script, a binary property, or
+    one of gc=, sc= (or script=) and scx= (or script_extensions=) followed
+    by a value. Scripts and binary properties match loosely, by name or
+    alias.
+
     :param name: the name of a property
     :return: an IntegerSet of codepoints
     """
-    if len(name) == 1:
+    if "=" in name:
+        key, _, value = name.partition("=")
+        key = _loose(key)
+        if key in ("gc", "generalcategory"):
+            return _unicode_property_codepoints(value)
+        elif key in ("sc", "script"):
+            properties = ucd.scripts
+        elif key in ("scx", "scriptextensions"):
+            properties = ucd.script_extensions
+        else:
+            raise SyntaxError("unknown unicode property '{}'".format(name))
+        codepoints = _lookup(properties, ucd.script_aliases, value)
+        if codepoints is None:
+            raise SyntaxError("unknown unicode script '{}'".format(value))
+        return codepoints
+    elif len(name) == 1:
         keys = [k for k in ucd.general_categories if k.startswith(name)]
         if not keys:
             raise SyntaxError("unknown unicode category '{}'".format(name))
-        elements = itertools.chain.from_iterable(
-                [ucd.general_categories[k] for k in keys])
+        sets = [ucd.general_categories[k] for k in keys]
     elif name == "L&":
-        elements = itertools.chain(
-                ucd.general_categories["Lu"],
+        sets = [ucd.general_categories["Lu"],
                 ucd.general_categories["Ll"],
-                ucd.general_categories["Lt"])
+                ucd.general_categories["Lt"]]
     elif name in ucd.general_categories:
-        elements = ucd.general_categories[name]
+        sets = [ucd.general_categories[name]]
+    else:
+        codepoints = _lookup(ucd.scripts, ucd.script_aliases, name)
+        if codepoints is None:
+            codepoints = _lookup(ucd.binary_properties,
+                    ucd.property_aliases, name)
+        if codepoints is None:
+            raise SyntaxError("unknown unicode property '{}'".format(name))
+        return codepoints
+    return util.IntegerSet().union(*sets)
+
+@functools.lru_cache(maxsize = None)
+def _unicode_case_orbits():
+    folding = ucd.case_folding()
+    if not folding:
+        # Otherwise case would silently not be ignored.
+        raise ValueError("the Unicode case folding table is empty,"
+                " regenerate ucd.py with mkucd.py")
+    return _case_orbits(folding)
+
+def _case_orbits(folding):
+    """Return the case equivalence classes of a case folding.
+
+    :param folding: a mapping of codepoints to their case folding.
+    :return: a dict mapping each codepoint which has other cases to the
+    IntegerSet of all of its cases.
+    """
+    orbits = collections.defaultdict(set)
+    for codepoint, folded in folding.items():
+        orbits[folded].update((codepoint, folded))
+    return {codepoint: cases
+            for cases in map(util.IntegerSet, orbits.values())
+            for first, last in cases
+            for codepoint in range(first, last + 1)}
+
+def _case_closure(codepoints, orbits):
+    """Return codepoints together with all of their other cases.
+
+    :param codepoints: an IntegerSet.
+    :param orbits: case equivalence classes, from _case_orbits().
+    """
+    if codepoints.cardinality() <= len(orbits):
+        members = (codepoint for first, last in codepoints
+                for codepoint in range(first, last + 1)
+                if codepoint in orbits)
     else:
-        raise SyntaxError("unknown unicode property '{}'".format(name))
-    return util.IntegerSet(elements)
+        members = (codepoint for codepoint in orbits
+                if codepoints.has(codepoint))
+    return codepoints.union(*{orbits[codepoint] for codepoint in members})
+
+class _Escapes(dict):
+    """Escaped character classes, some of which are built on first use.
+
+    :param escapes: a mapping of characters to IntegerSets.
+    :param builders: a mapping of characters to functions which return
+    an IntegerSet, given this mapping.
+    """
+
+    def __init__(self, escapes, builders):
+        super().__init__(escapes)
+        self._builders = builders
+
+    def __contains__(self, c):
+        return super().__contains__(c) or c in self._builders
+
+    def __missing__(self, c):
+        self[c] = self._builders[c](self)
+        return self[c]
 
 class Parser:
     r"""A regular expression parser.
@@ -133,6 +235,14 @@ class Parser:
         hex_digit = '0'..'9' | 'A'..'F' | 'a'..'f';
     """
 
+    def __init__(self, ignorecase = False):
+        """Return a new parser.
+
+        :param ignorecase: if True, every character also matches its other
+        cases, according to the Unicode simple case folding.
+        """
+        self._orbits = _unicode_case_orbits() if ignorecase else None
+
     def parse(self, iterable):
         buffer = _Buffer(iterable)
         expr = self._parse_logical_or(buffer)
@@ -151,30 +261,33 @@ class Parser:
     _vertical_space = util.IntegerSet(
             ((0x0a, 0x0d), 0x85, 0x2028, 0x2029))
 
-    _escapes = {
-        "a": util.IntegerSet((0x07,)),
-        "b": util.IntegerSet((0x08,)),
-        "e": util.IntegerSet((0x1b,)),
-        "f": util.IntegerSet((0x0c,)),
-        "n": util.IntegerSet((0x0a,)),
-        "r": util.IntegerSet((0x0d,)),
-        "t": util.IntegerSet((0x09,)),
-        "d": util.IntegerSet(ucd.general_categories["Nd"]),
-        "h": _horizontal_space,
-        "s": util.IntegerSet(itertools.chain(
-            _unicode_property_codepoints("Z"),
-            _horizontal_space,
-            _vertical_space)),
-        "v": _vertical_space,
-        "w": util.IntegerSet(itertools.chain(
-            _unicode_property_codepoints("L"),
-            _unicode_property_codepoints("N"),
-            (0x5f,)))}
-    _escapes["D"] = regex.unicode.codespace.difference(_escapes["d"])
-    _escapes["H"] = regex.unicode.codespace.difference(_escapes["h"])
-    _escapes["S"] = regex.unicode.codespace.difference(_escapes["s"])
-    _escapes["V"] = regex.unicode.codespace.difference(_escapes["v"])
-    _escapes["W"] = regex.unicode.codespace.difference(_escapes["w"])
+    # The Unicode classes are only built, and the Unicode database only
+    # loaded, when they are first used.
+    _escapes = _Escapes({
+            "a": util.IntegerSet((0x07,)),
+            "b": util.IntegerSet((0x08,)),
+            "e": util.IntegerSet((0x1b,)),
+            "f": util.IntegerSet((0x0c,)),
+            "n": util.IntegerSet((0x0a,)),
+            "r": util.IntegerSet((0x0d,)),
+            "t": util.IntegerSet((0x09,)),
+            "h": _horizontal_space,
+            "v": _vertical_space}, {
+            "d": lambda escapes: ucd.general_categories["Nd"],
+            "s": lambda escapes: _unicode_property_codepoints("Z").union(
+                escapes["h"], escapes["v"]),
+            "w": lambda escapes: _unicode_property_codepoints("L").union(
+                _unicode_property_codepoints("N"), (0x5f,)),
+            "D": lambda escapes: regex.unicode.codespace.difference(
+                escapes["d"]),
+            "H": lambda escapes: regex.unicode.codespace.difference(
+                escapes["h"]),
+            "S": lambda escapes: regex.unicode.codespace.difference(
+                escapes["s"]),
+            "V": lambda escapes: regex.unicode.codespace.difference(
+                escapes["v"]),
+            "W": lambda escapes: regex.unicode.codespace.difference(
+                escapes["w"])})
 
     def _parse_logical_or(self, buffer):
         expr = self._parse_logical_and(buffer)
@@ -230,20 +343,7 @@ class Parser:
                     regex.unicode.KleeneClosure(expr))
         elif c == "{":
             mincount, maxcount = self._parse_count(buffer)
-            expr = functools.reduce(
-                    lambda x, y: regex.unicode.Concatenation(x, y),
-                    itertools.repeat(expr, mincount),
-                    regex.unicode.Epsilon())
-            if maxcount is None:
-                expr = regex.unicode.Concatenation(expr,
-                        regex.unicode.KleeneClosure(expr))
-            else:
-                expr = functools.reduce(
-                        lambda x, y: regex.unicode.Concatenation(x,
-                            regex.unicode.LogicalOr(expr,
-                                regex.unicode.Epsilon())),
-                        itertools.repeat(expr, maxcount - mincount),
-                        expr)
+            expr = regex.unicode.Repetition(expr, mincount, maxcount)
         else:
             buffer.push(c)
         return expr
@@ -282,9 +382,9 @@ class Parser:
         elif c == "[":
             expr = self._parse_class(buffer)
         elif c == "\\":
-            expr = regex.unicode.SymbolSet(self._parse_quote(buffer))
+            expr = self._symbolset(self._parse_quote(buffer))
         elif c not in self._metacharacters:
-            expr = regex.unicode.SymbolSet([ord(c)])
+            expr = self._symbolset(util.IntegerSet([ord(c)]))
         else:
             expr = regex.unicode.Epsilon()
             buffer.push(c)
@@ -321,8 +421,20 @@ class Parser:
 
         codepoints = util.IntegerSet(itertools.chain.from_iterable(members))
         if complement:
-            codepoints = regex.unicode.codespace.difference(codepoints)
-        return regex.unicode.SymbolSet(codepoints)
+            # The complement of a set closed under case is closed too.
+            return regex.unicode.SymbolSet(regex.unicode.codespace.difference(
+                    self._fold(codepoints)))
+        return self._symbolset(codepoints)
+
+    def _fold(self, codepoints):
+        """Return an IntegerSet closed under case, if case is ignored."""
+        if self._orbits:
+            codepoints = _case_closure(codepoints, self._orbits)
+        return codepoints
+
+    def _symbolset(self, codepoints):
+        """Return a SymbolSet expression, ignoring case if required."""
+        return regex.unicode.SymbolSet(self._fold(codepoints))
 
     def _parse_range(self, buffer):
         """Return an IntegerSet of codepoints."""
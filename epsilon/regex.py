@@ -16,74 +16,174 @@
 
 import bisect
 import functools
-import itertools
+import weakref
 from . import util
 
-def expressions(codespace):
+# Namespaces are shared by codespace and cache size, so that unpickled
+# expressions are interned alongside those constructed locally.
+_namespaces = {}
+
+def _expression(codespace, cachesize, name, args):
+    return getattr(expressions(codespace, cachesize), name)(*args)
+
+def expressions(codespace, cachesize = 1 << 16):
+    """Return the namespace of regular expression classes over a codespace.
+
+    Expressions may be pickled, and are unpickled into the namespace of
+    the same codespace and cache size.
+
+    :param codespace: the codepoints over which expressions are defined.
+    :param cachesize: the maximum number of derivatives remembered.
+    """
     codespace = util.IntegerSet(codespace)
+    if (codespace, cachesize) in _namespaces:
+        return _namespaces[(codespace, cachesize)]
+
+    # Hash-consing table: every structurally distinct expression is
+    # constructed exactly once, so equality is identity. The table is weak, so
+    # expressions which are no longer referenced (such as the states
+    # flushed by a LazyAutomaton) are freed, and equal expressions
+    # constructed later are interned afresh.
+    nodes = weakref.WeakValueDictionary()
+
+    # Expressions are ordered by a structural key: the rank of their kind
+    # and then the keys of their fields. So the canonical order of terms,
+    # unlike their interning, does not depend on what was built before.
+    # The keys of children are shared, so comparisons of equal subterms
+    # are identity checks.
+    def sortkey(field):
+        if isinstance(field, Expression):
+            return field._key
+        elif isinstance(field, tuple):
+            return tuple(map(sortkey, field))
+        elif isinstance(field, util.IntegerSet):
+            return tuple(field)
+        elif field is None:
+            return float("inf")
+        return field
+
+    # Derivatives of compound expressions are memoized in a bounded table
+    # shared by every expression of the codespace. Its hit and miss
+    # counters are available via derivative.cache_info().
+    @functools.lru_cache(maxsize = cachesize)
+    def derivative(expr, symbol):
+        return expr._derivative(symbol)
 
     @functools.total_ordering
     class Expression:
+        def __new__(cls, *fields):
+            key = (cls,) + fields
+            self = nodes.get(key)
+            if self is None:
+                self = super().__new__(cls)
+                self._key = (cls._rank,) + sortkey(fields)
+                self._hash = hash(key)
+                self._fields = fields
+                nodes[key] = self
+            return self
+
         def __eq__(self, expr):
-            return self._orderby() == expr._orderby()
+            return self is expr
     
         def __lt__(self, expr):
-            return self._orderby() < expr._orderby()
+            return self._key < expr._key
     
         def __hash__(self):
-            return hash(self._orderby())
+            return self._hash
     
         def __repr__(self):
             return "<{}>".format(str(self))
+
+        # Unpickling calls the constructor again, which interns the result.
+        def __reduce__(self):
+            return _expression, (codespace, cachesize,
+                    self.__class__.__name__, self._args())
+
+        def _args(self):
+            return self._fields
     
+        # Nullability is computed once, when a node is constructed, from
+        # the already known nullability of its children.
+        def nu(self):
+            return self.EPSILON if self._nullable else self.NULL
+
         def nullable(self):
-            nu = self.nu()
-            assert nu == self.EPSILON or nu == self.NULL
-            return nu == self.EPSILON
+            return self._nullable
+
+        def derivative(self, symbol):
+            return derivative(self, symbol)
+
+        # Derivative classes depend only on the (immutable) expression,
+        # so they are computed at most once per node.
+        _classes = None
+
+        def derivative_classes(self):
+            if self._classes is None:
+                self._classes = tuple(self._derivative_classes())
+            return self._classes
+
+        def symbolsets(self):
+            """Return the set of SymbolSets which occur in the expression.
+
+            Derivatives are built from the same SymbolSets, so these
+            determine the symbol classes of every derivative.
+            """
+            symbolsets, seen, stack = set(), {self}, [self]
+            while stack:
+                expr = stack.pop()
+                if isinstance(expr, SymbolSet):
+                    symbolsets.add(expr)
+                    continue
+                for field in expr._fields:
+                    children = field if isinstance(field, tuple) else (field,)
+                    for child in children:
+                        if isinstance(child, Expression)\
+                                and child not in seen:
+                            seen.add(child)
+                            stack.append(child)
+            return symbolsets
     
     class SymbolSet(Expression):
-        def __init__(self, codepoints = ()):
-            self._codepoints = util.IntegerSet(codepoints)
-            if not codespace.issuperset(self._codepoints):
+        _nullable = False
+
+        def __new__(cls, codepoints = ()):
+            codepoints = util.IntegerSet(codepoints)
+            if not codespace.issuperset(codepoints):
                 raise ValueError("code point out of range")
+
+            self = super().__new__(cls, codepoints)
+            self._codepoints = codepoints
+            return self
     
         def __repr__(self):
             return "{}({})".format(self.__class__.__name__,
                     self._codepoints or "")
     
-        def _orderby(self):
-            return self.__class__.__name__, self._codepoints
-    
         @property
         def codepoints(self):
             return self._codepoints
     
-        def nu(self):
-            return self.NULL
-    
         def derivative(self, symbol):
             return self.EPSILON if self._codepoints.has(symbol) else self.NULL
     
-        def derivative_classes(self):
+        def _derivative_classes(self):
             return {self._codepoints, codespace.difference(self._codepoints)}
     
     class Epsilon(Expression):
+        _nullable = True
+
         def __repr__(self):
             return "{}()".format(self.__class__.__name__)
     
-        def _orderby(self):
-            return self.__class__.__name__,
-    
-        def nu(self):
-            return self
-    
         def derivative(self, symbol):
             return self.NULL
     
-        def derivative_classes(self):
+        def _derivative_classes(self):
             return {codespace}
     
     class KleeneClosure(Expression):
+        _nullable = True
+
         def __new__(cls, expr):
             if isinstance(expr, KleeneClosure):
                 return expr
@@ -91,52 +191,84 @@ def expressions(codespace):
                 return expr
             elif expr == cls.NULL:
                 return cls.EPSILON
+            elif isinstance(expr, LogicalOr) and cls.EPSILON in expr._terms:
+                return KleeneClosure(LogicalOr(
+                        *(term for term in expr._terms
+                            if term != cls.EPSILON)))
     
-            self = super().__new__(cls)
+            self = super().__new__(cls, expr)
             self._expr = expr
             return self
     
         def __repr__(self):
             return "{}({})".format(self.__class__.__name__, self._expr)
     
-        def _orderby(self):
-            return self.__class__.__name__, self._expr
+        def _derivative(self, symbol):
+            return Concatenation(self._expr.derivative(symbol), self)
     
-        def nu(self):
-            return self.EPSILON
+        def _derivative_classes(self):
+            return self._expr.derivative_classes()
     
-        def derivative(self, symbol):
-            return Concatenation(self._expr.derivative(symbol), self)
+    class Repetition(Expression):
+        """Between mincount and maxcount (None is unbounded) repetitions."""
+
+        def __new__(cls, expr, mincount, maxcount = None):
+            if expr._nullable:
+                mincount = 0
+
+            if maxcount == 0 or expr == cls.EPSILON:
+                return cls.EPSILON
+            elif expr == cls.NULL:
+                return cls.EPSILON if mincount == 0 else cls.NULL
+            elif mincount == 0 and maxcount is None:
+                return KleeneClosure(expr)
+            elif mincount == 1 and maxcount == 1:
+                return expr
     
-        def derivative_classes(self):
+            self = super().__new__(cls, expr, mincount, maxcount)
+            self._expr = expr
+            self._mincount = mincount
+            self._maxcount = maxcount
+            self._nullable = mincount == 0
+            return self
+    
+        def __repr__(self):
+            return "{}({}, {}, {})".format(self.__class__.__name__,
+                    self._expr, self._mincount, self._maxcount)
+    
+        def _derivative(self, symbol):
+            return Concatenation(self._expr.derivative(symbol),
+                    Repetition(self._expr,
+                        max(self._mincount - 1, 0),
+                        None if self._maxcount is None
+                            else self._maxcount - 1))
+    
+        def _derivative_classes(self):
             return self._expr.derivative_classes()
     
     class Complement(Expression):
         def __new__(cls, expr):
             if isinstance(expr, Complement):
                 return expr._expr
+            elif expr == cls.NULL:
+                return cls.UNIVERSE
+            elif expr == cls.UNIVERSE:
+                return cls.NULL
             elif isinstance(expr, SymbolSet):
                 return SymbolSet(codespace.difference(expr.codepoints))
     
-            self = super().__new__(cls)
+            self = super().__new__(cls, expr)
             self._expr = expr
+            self._nullable = not expr._nullable
             return self
     
         def __repr__(self):
             return "{}({})".format(self.__class__.__name__, self._expr)
     
-        def _orderby(self):
-            return self.__class__.__name__, self._expr
-    
-        def nu(self):
-            nu = self._expr.nu()
-            assert nu == self.EPSILON or nu == self.NULL
-            return self.NULL if nu == self.EPSILON else self.EPSILON
-    
-        def derivative(self, symbol):
+        def _derivative(self, symbol):
             return Complement(self._expr.derivative(symbol))
     
-        def derivative_classes(self):
+        def _derivative_classes(self):
             return self._expr.derivative_classes()
     
     class Concatenation(Expression):
@@ -153,132 +285,136 @@ def expressions(codespace):
             elif right == cls.EPSILON:
                 return left
     
-            self = super().__new__(cls)
+            self = super().__new__(cls, left, right)
             self._left = left
             self._right = right
+            self._nullable = left._nullable and right._nullable
             return self
     
         def __repr__(self):
             return "{}({}, {})".format(self.__class__.__name__,
                     self._left, self._right)
     
-        def _orderby(self):
-            return self.__class__.__name__, self._left, self._right
-    
-        def nu(self):
-            return LogicalAnd(self._left.nu(), self._right.nu())
-    
-        def derivative(self, symbol):
+        def _derivative(self, symbol):
             return LogicalOr(
                     Concatenation(self._left.derivative(symbol), self._right),
                     Concatenation(self._left.nu(),
                         self._right.derivative(symbol)))
     
-        def derivative_classes(self):
+        def _derivative_classes(self):
             return self._left.derivative_classes() if not self._left.nullable()\
-                    else filter(None, util.product_intersections(
+                    else util.refine_partitions(
                         self._left.derivative_classes(),
-                        self._right.derivative_classes()))
+                        self._right.derivative_classes())
     
+    # Alternation and intersection are n-ary. Nested terms are flattened
+    # into a set, so the operators are associative, commutative and
+    # idempotent, and the surviving terms are kept in a canonical order.
     class LogicalOr(Expression):
-        def __new__(cls, left, right):
-            if isinstance(left, SymbolSet) and isinstance(right, SymbolSet):
-                return SymbolSet(left.codepoints.union(right.codepoints))
-    
-            terms = set() 
-            stack = [left, right]
+        def __new__(cls, *exprs):
+            terms = set()
+            codepoints = []
+            stack = list(exprs)
             while stack:
                 expr = stack.pop()
                 if isinstance(expr, cls):
-                    stack.append(expr._left)
-                    stack.append(expr._right)
-                elif expr == cls.NULL:
-                    pass
-                elif expr == cls.SIGMA:
+                    stack.extend(expr._terms)
+                elif isinstance(expr, SymbolSet):
+                    codepoints.extend(expr.codepoints)
+                elif expr == cls.UNIVERSE:
                     return expr
                 else:
                     terms.add(expr)
+
+            if codepoints:
+                terms.add(SymbolSet(codepoints))
+            if cls.EPSILON in terms and any(
+                    term._nullable for term in terms if term != cls.EPSILON):
+                terms.remove(cls.EPSILON)
     
             if not terms:
                 return cls.NULL
+            elif len(terms) == 1:
+                return terms.pop()
     
-            new = super().__new__
-            def construct(left, right):
-                self = new(cls)
-                self._left, self._right = left, right
-                return self
-            return functools.reduce(construct, sorted(terms, reverse = True))
+            terms = tuple(sorted(terms, reverse = True))
+            self = super().__new__(cls, terms)
+            self._terms = terms
+            self._nullable = any(term._nullable for term in terms)
+            return self
     
         def __repr__(self):
-            return "{}({}, {})".format(self.__class__.__name__,
-                    self._left, self._right)
-    
-        def _orderby(self):
-            return self.__class__.__name__, self._left, self._right
-    
-        def nu(self):
-            return LogicalOr(self._left.nu(), self._right.nu())
+            return "{}({})".format(self.__class__.__name__,
+                    ", ".join(map(str, self._terms)))
+
+        def _args(self):
+            return self._terms
     
-        def derivative(self, symbol):
+        def _derivative(self, symbol):
             return LogicalOr(
-                    self._left.derivative(symbol),
-                    self._right.derivative(symbol))
+                    *(term.derivative(symbol) for term in self._terms))
     
-        def derivative_classes(self):
-            return filter(None, util.product_intersections(
-                    self._left.derivative_classes(),
-                    self._right.derivative_classes()))
+        def _derivative_classes(self):
+            return util.refine_partitions(
+                    *(term.derivative_classes() for term in self._terms))
     
     class LogicalAnd(Expression):
-        def __new__(cls, left, right):
+        def __new__(cls, *exprs):
             terms = set() 
-            stack = [left, right]
+            stack = list(exprs)
             while stack:
                 expr = stack.pop()
                 if isinstance(expr, cls):
-                    stack.append(expr._left)
-                    stack.append(expr._right)
+                    stack.extend(expr._terms)
                 elif expr == cls.NULL:
                     return expr
-                elif expr == cls.SIGMA:
+                elif expr == cls.UNIVERSE:
                     pass
                 else:
                     terms.add(expr)
+
+            if cls.EPSILON in terms:
+                return cls.EPSILON if all(term._nullable for term in terms)\
+                        else cls.NULL
     
             if not terms:
-                return cls.SIGMA
-    
-            new = super().__new__
-            def construct(left, right):
-                self = new(cls)
-                self._left, self._right = left, right
-                return self
-            return functools.reduce(construct, sorted(terms, reverse = True))
+                return cls.UNIVERSE
+            elif len(terms) == 1:
+                return terms.pop()
+    
+            terms = tuple(sorted(terms, reverse = True))
+            self = super().__new__(cls, terms)
+            self._terms = terms
+            self._nullable = all(term._nullable for term in terms)
+            return self
     
         def __repr__(self):
-            return "{}({}, {})".format(self.__class__.__name__,
-                    self._left, self._right)
-    
-        def _orderby(self):
-            return self.__class__.__name__, self._left, self._right
-    
-        def nu(self):
-            return LogicalAnd(self._left.nu(), self._right.nu())
+            return "{}({})".format(self.__class__.__name__,
+                    ", ".join(map(str, self._terms)))
+
+        def _args(self):
+            return self._terms
     
-        def derivative(self, symbol):
+        def _derivative(self, symbol):
             return LogicalAnd(
-                    self._left.derivative(symbol),
-                    self._right.derivative(symbol))
+                    *(term.derivative(symbol) for term in self._terms))
     
-        def derivative_classes(self):
-            return filter(None, util.product_intersections(
-                    self._left.derivative_classes(),
-                    self._right.derivative_classes()))
+        def _derivative_classes(self):
+            return util.refine_partitions(
+                    *(term.derivative_classes() for term in self._terms))
+
+    # Expressions of different kinds order by kind name, then by fields.
+    for rank, cls in enumerate(sorted(Expression.__subclasses__(),
+            key = lambda cls: cls.__name__)):
+        cls._rank = rank
+    del rank, cls
 
-        Expression.EPSILON = Epsilon()
-        Expression.NULL = SymbolSet()
-        Expression.SIGMA = SymbolSet(codespace)
+    Expression.EPSILON = Epsilon()
+    Expression.NULL = SymbolSet()
+    Expression.SIGMA = SymbolSet(codespace)
+    Expression.UNIVERSE = KleeneClosure(Expression.SIGMA)
 
-    return type("Regex", (object,), locals())
+    _namespaces[(codespace, cachesize)] = type("Regex", (object,), locals())
+    return _namespaces[(codespace, cachesize)]
 
 unicode = expressions(((0, 0x10ffff),))
@@ -0,0 +1,198 @@
+# Epsilon
+# Copyright (C) 2018
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import re
+from . import dfa
+from . import target
+from . import version
+
+def _identifier(name):
+    identifier = re.sub(r"\W", "_", name, flags = re.ASCII)
+    return "_" + identifier if identifier[:1].isdigit() else identifier
+
+def _unique(name, used):
+    # Distinct token names may sanitize to the same identifier, or differ
+    # only in case, which enumerators do not keep, so later ones take the
+    # first free numeric suffix.
+    unique, n = name, 2
+    while unique.upper() in used:
+        unique, n = "{}_{}".format(name, n), n + 1
+    used.add(unique.upper())
+    return unique
+
+def _ctype(values):
+    low, high = min(values, default = 0), max(values, default = 0)
+    for bits in (8, 16):
+        if low >= 0 and high < 1 << bits:
+            return "uint{}_t".format(bits)
+        elif low >= -(1 << (bits - 1)) and high < 1 << (bits - 1):
+            return "int{}_t".format(bits)
+    return "int32_t"
+
+def pack(rows, default):
+    """Pack the rows of a sparse table by row displacement.
+
+    Rows are placed densest first, each at the first base at which its
+    entries other than default fall on free slots, and each slot records
+    the row which owns it. So row[c] is nextstates[base[r] + c] if
+    check[base[r] + c] is r, and is otherwise default.
+
+    :param rows: equal length sequences of integers.
+    :param default: the most common entry, which is not stored.
+    :return: a (base, nextstates, check) triple of lists. Unowned slots of
+        check hold len(rows).
+    """
+    width = len(rows[0]) if rows else 0
+    entries = [[(c, entry) for c, entry in enumerate(row) if entry != default]
+            for row in rows]
+    base = [0] * len(rows)
+    nextstates, check = [], []
+    occupied = bytearray()
+    for r in sorted(range(len(rows)), key = lambda r: -len(entries[r])):
+        if not entries[r]:
+            continue
+        # Only bases which put the first entry on a free slot can fit.
+        # Bases are never negative, as C indexes from an unsigned base.
+        first = entries[r][0][0]
+        offset = 0
+        while True:
+            slot = occupied.find(0, offset + first)
+            offset = max((len(occupied) if slot < 0 else slot) - first, 0)
+            if all(offset + c >= len(occupied) or not occupied[offset + c]
+                    for c, _ in entries[r]):
+                break
+            offset += 1
+        size = offset + width
+        if size > len(check):
+            nextstates.extend([default] * (size - len(nextstates)))
+            check.extend([len(rows)] * (size - len(check)))
+            occupied.extend(bytes(size - len(occupied)))
+        for c, entry in entries[r]:
+            nextstates[offset + c] = entry
+            check[offset + c] = r
+            occupied[offset + c] = 1
+        base[r] = offset
+    if len(check) < width:
+        nextstates.extend([default] * (width - len(nextstates)))
+        check.extend([len(rows)] * (width - len(check)))
+    return base, nextstates, check
+
+class Target(target.Target):
+    """Emit C scanners over bytes.
+
+    Each automaton becomes an enum of its tokens, equivalence classed
+    and row displacement packed transition tables, and a function
+    name_next_token(text, length, end) which returns the token of the
+    longest nonempty match at the start of text, and stores its length
+    in *end, or returns NAME_NONE if there is no match. Names which
+    would clash in C are given numeric suffixes. Automata compiled
+    with --utf8 scan UTF-8 text, and otherwise bytes are code points.
+    """
+
+    def __init__(self, args):
+        super().__init__(args)
+        self._prefixes = set()
+        self._enumerators = set()
+
+    def emit_header(self):
+        print("/* This file was generated by Epsilon {} */".format(
+                version.VERSION))
+        print()
+        print("#include <stddef.h>")
+        print("#include <stdint.h>")
+
+    def _emit_array(self, ctype, name, values):
+        print()
+        print("static const {} {}[{}] = {{".format(ctype, name, len(values)))
+        for i in range(0, len(values), 12):
+            print("    {},".format(", ".join(map(str, values[i:i + 12]))))
+        print("};")
+
+    def emit_automaton(self, name, automaton):
+        table = dfa.tabulate(automaton)
+        # Each automaton has its own prefix, and PREFIX_NONE, for no
+        # match, is reserved in the namespace of enumerators shared by
+        # all automata.
+        identifier = prefix = _identifier(name)
+        n = 2
+        while prefix.upper() in self._prefixes\
+                or prefix.upper() + "_NONE" in self._enumerators:
+            prefix, n = "{}_{}".format(identifier, n), n + 1
+        self._prefixes.add(prefix.upper())
+        self._enumerators.add(prefix.upper() + "_NONE")
+        nstates = len(table.accepts)
+
+        # Only the classes of bytes are needed, renumbered densely.
+        used = sorted(set(table.lowclasses))
+        numbers = {c: n for n, c in enumerate(used)}
+        classes = [numbers[c] for c in table.lowclasses]
+        rows = [[table.transitions[state * table.nclasses + c] for c in used]
+                for state in range(nstates)]
+        base, nextstates, check = pack(rows, table.error)
+
+        tokens = list(dict.fromkeys(
+                token for accepts in table.accepts for token in accepts))
+        ordinals = {token: n for n, token in enumerate(tokens)}
+        accepts = [ordinals[accepts[0]] if accepts else -1
+                for accepts in table.accepts]
+
+        # Enumerators which were given a suffix record their token name
+        # in a comment.
+        print()
+        print("enum {}_token {{".format(prefix))
+        print("    {}_NONE = -1,".format(prefix.upper()))
+        for token in tokens:
+            identifier = prefix.upper() + "_" + _identifier(token).upper()
+            enumerator = _unique(identifier, self._enumerators)
+            if enumerator == identifier:
+                print("    {},".format(enumerator))
+            else:
+                print("    {}, /* {} */".format(enumerator,
+                        token.replace("*/", "* /")))
+        print("};")
+
+        self._emit_array(_ctype(classes), prefix + "_classes", classes)
+        self._emit_array(_ctype(base), prefix + "_base", base)
+        self._emit_array(_ctype(nextstates), prefix + "_next", nextstates)
+        self._emit_array(_ctype(check), prefix + "_check", check)
+        self._emit_array(_ctype(accepts), prefix + "_accepts", accepts)
+
+        print()
+        print("int {}_next_token(const uint8_t *text, size_t length,"
+                " size_t *end)".format(prefix))
+        print("{")
+        print("    int token = {}_NONE;".format(prefix.upper()))
+        print("    size_t offset = 0;")
+        print("    unsigned state = 0;")
+        print("    *end = 0;")
+        print("    for (;;) {")
+        print("        size_t i;")
+        print("        if ({}_accepts[state] >= 0) {{".format(prefix))
+        print("            token = {}_accepts[state];".format(prefix))
+        print("            *end = offset;")
+        print("        }")
+        print("        if (offset == length)")
+        print("            break;")
+        print("        i = (size_t){0}_base[state]"
+                " + {0}_classes[text[offset]];".format(prefix))
+        print("        state = {0}_check[i] == state ? {0}_next[i] : {1};"
+                .format(prefix, table.error))
+        print("        if (state == {})".format(table.error))
+        print("            break;")
+        print("        offset++;")
+        print("    }")
+        print("    return *end ? token : {}_NONE;".format(prefix.upper()))
+        print("}")
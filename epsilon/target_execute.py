@@ -27,8 +27,11 @@ class Target(target.Target):
         self._automata.append(automaton)
 
     def emit_trailer(self):
-        if self._automata:
-            text = (c for line in sys.stdin for c in line)
-            for token, match in dfa.scan(self._automata[0], text):
+        if self._automata and self._args.utf8:
+            for token, match in dfa.stream(self._automata[0],
+                    sys.stdin.buffer):
+                print(token, repr(match.decode("utf-8")))
+        elif self._automata:
+            for token, match in dfa.stream(self._automata[0], sys.stdin):
                 print(token, repr(match))
 
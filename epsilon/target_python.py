@@ -14,7 +14,7 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
-import pprint
+import base64
 import inspect
 from . import dfa
 from . import target
@@ -27,27 +27,52 @@ class Target(target.Target):
 
     def emit_header(self):
         print("# This file was generated by Epsilon {}".format(version.VERSION))
-        print()
-        print("import collections")
-        print()
-        print("Automaton = collections.namedtuple('Automaton',")
-        print("        ['transitions', 'accepts', 'error'])")
 
     def emit_automaton(self, name, automaton):
-        print()
-        print("{} = {}".format(name, pprint.pformat(automaton)))
-        self._automata.append(name)
+        # Automata are emitted as compressed tables, which load quickly.
+        self._automata.append(
+                (name, dfa.dumptable(dfa.tabulate(automaton))))
 
     def emit_trailer(self):
         print()
+        print("import array")
+        print("import base64")
         print("import bisect")
+        print("import collections")
+        print("import itertools")
+        print("import mmap")
+        print("import sys")
+        print("import zlib")
+        print()
+        print("Table = collections.namedtuple('Table',")
+        print("        {!r})".format(list(dfa.Table._fields)))
         print()
+        print(inspect.getsource(dfa.loadints))
+        print("_TABLES_MAGIC = {!r}".format(dfa._TABLES_MAGIC))
+        print()
+        print(inspect.getsource(dfa._loadtables))
+        print(inspect.getsource(dfa.loadtable))
+        print(inspect.getsource(dfa.maptables))
         print(inspect.getsource(dfa.NoMatchError))
         print(inspect.getsource(dfa.scan))
+        print(inspect.getsource(dfa.stream))
+        print(inspect.getsource(dfa.match))
+        print(inspect.getsource(dfa.spans))
+        for name, data in self._automata:
+            encoded = base64.b85encode(data).decode("ascii")
+            print("{} = loadtable(base64.b85decode(".format(name))
+            for i in range(0, len(encoded), 72):
+                print("        \"{}\"".format(encoded[i:i + 72]))
+            print("        ))")
+        print()
         if self._automata:
             print("if __name__ == \"__main__\":")
             print("    import sys")
-            print("    text = (c for line in sys.stdin for c in line)")
-            print("    for token, match in scan({}, text):".format(
-                    self._automata[0]))
-            print("        print(token, repr(match))")
+            if self._args.utf8:
+                print("    for token, match in stream({}, sys.stdin.buffer):"
+                        .format(self._automata[0][0]))
+                print("        print(token, repr(match.decode(\"utf-8\")))")
+            else:
+                print("    for token, match in stream({}, sys.stdin):".format(
+                        self._automata[0][0]))
+                print("        print(token, repr(match))")
@@ -0,0 +1,224 @@
+# Epsilon
+# Copyright (C) 2018
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import inspect
+import re
+from . import dfa
+from . import target
+from . import version
+
+# The runtime of the generated module. An automaton is a generator
+# function of (text, start, end, once), which yields the spans of the
+# tokens or, if once is true, just the longest match at start, which may
+# be empty, or a None token if there is none.
+
+def match(automaton, text, start = 0, end = None):
+    """Match the longest token of text which begins at start.
+
+    :return: a (token, end) pair, or None if no token matches.
+    """
+    token, _, length = next(automaton(text, start,
+            len(text) if end is None else end, True))
+    return (token, length) if token is not None else None
+
+def spans(automaton, text, start = 0, end = None):
+    """Generate the tokens of text as (token, start, end) spans.
+
+    :raises NoMatchError: if no token matches at some offset.
+    """
+    return automaton(text, start, len(text) if end is None else end)
+
+class _Writer:
+    def __init__(self):
+        self.lines = []
+        self.depth = 0
+
+    def __call__(self, line):
+        self.lines.append("    " * self.depth + line)
+
+class Target(target.Target):
+    """Emit a Python scanner with a code path specialized to each state.
+
+    Each automaton becomes a generator of spans. States are selected by a
+    binary tree of comparisons, as are their transitions from the current
+    symbol, so no tables are consulted per symbol. Runs of a state's
+    self loop are consumed by a compiled re pattern. Scanners compiled
+    with --utf8 scan bytes, and otherwise they scan str.
+    """
+
+    def __init__(self, args):
+        super().__init__(args)
+        self._automata = []
+        self._limit = 0x100 if args.utf8 else 0x110000
+
+    def _literal(self, symbol):
+        return repr(symbol) if self._args.utf8 else repr(chr(symbol))
+
+    def _pattern(self, edges):
+        if self._args.utf8:
+            ranges = "".join("\\x{:02x}-\\x{:02x}".format(first, last)
+                    for first, last in edges)
+            return repr("[{}]*".format(ranges).encode("ascii"))
+        ranges = "".join(re.escape(chr(first)) if first == last
+                else "{}-{}".format(re.escape(chr(first)), re.escape(chr(last)))
+                for first, last in edges)
+        return repr("[{}]*".format(ranges))
+
+    def _emit_tree(self, write, variable, literal, intervals, emit_leaf):
+        # Intervals are (first, value) pairs sorted by first, and the
+        # value of a variable is that of the last interval at or before it.
+        if len(intervals) == 1:
+            emit_leaf(intervals[0][1])
+            return
+        middle = len(intervals) // 2
+        write("if {} < {}:".format(variable, literal(intervals[middle][0])))
+        write.depth += 1
+        self._emit_tree(write, variable, literal, intervals[:middle],
+                emit_leaf)
+        write.depth -= 1
+        write("else:")
+        write.depth += 1
+        self._emit_tree(write, variable, literal, intervals[middle:],
+                emit_leaf)
+        write.depth -= 1
+
+    def emit_header(self):
+        print("# This file was generated by Epsilon {}".format(version.VERSION))
+        print()
+        print("import re")
+
+    def emit_automaton(self, name, automaton):
+        write = _Writer()
+        error = automaton.error
+        states = [state for state in range(len(automaton.transitions))
+                if state != error]
+
+        runs = {}
+        for state in states:
+            edges = [(first, last) for first, last, nextstate
+                    in automaton.transitions[state] if nextstate == state]
+            if edges:
+                runs[state] = "_{}_run{}".format(name, state)
+                write("{} = re.compile({}).match".format(runs[state],
+                        self._pattern(edges)))
+
+        write("")
+        write("def {}(text, start, end, once = False):".format(name))
+        write.depth += 1
+        write("while start < end or once:")
+        write.depth += 1
+        write("state, accept, length, offset = 0, None, start, start")
+        write("while True:")
+        write.depth += 1
+
+        # States without transitions end the match, so entering them is
+        # coded as accepting straight away.
+        final = {state for state in states
+                if all(nextstate == error for _, _, nextstate
+                    in automaton.transitions[state])}
+
+        def emit_transition(nextstate):
+            if nextstate in final:
+                if automaton.accepts[nextstate]:
+                    write("accept, length = {!r}, offset + 1".format(
+                            automaton.accepts[nextstate][0]))
+                write("break")
+            elif nextstate == error:
+                write("break")
+            else:
+                write("state = {}".format(nextstate))
+
+        def emit_state(state):
+            if state in runs:
+                write("offset = {}(text, offset, end).end()".format(
+                        runs[state]))
+            if automaton.accepts[state]:
+                write("accept, length = {!r}, offset".format(
+                        automaton.accepts[state][0]))
+            if all(nextstate in (state, error)
+                    for _, _, nextstate in automaton.transitions[state]):
+                write("break")
+                return
+            write("if offset == end:")
+            write("    break")
+            write("c = text[offset]")
+
+            # Self loops were consumed above, so they lead to the error
+            # state here, as do symbols without a transition.
+            intervals, expected = [], 0
+            for first, last, nextstate in automaton.transitions[state]:
+                if nextstate == state:
+                    nextstate = error
+                if first > expected:
+                    intervals.append((expected, error))
+                intervals.append((first, nextstate))
+                expected = last + 1
+            if expected < self._limit:
+                intervals.append((expected, error))
+            merged = [interval for i, interval in enumerate(intervals)
+                    if i == 0 or interval[1] != intervals[i - 1][1]]
+            self._emit_tree(write, "c", self._literal, merged,
+                    emit_transition)
+
+        # Every token begins in the start state, so it is tested first.
+        if states and states[0] == 0:
+            write("if state == 0:")
+            write.depth += 1
+            emit_state(0)
+            write.depth -= 1
+            # Final states are never entered, see emit_transition().
+            others = [state for state in states[1:] if state not in final]
+            if others:
+                write("else:")
+                write.depth += 1
+                self._emit_tree(write, "state", str,
+                        [(state, state) for state in others], emit_state)
+                write.depth -= 1
+        else:
+            write("break")
+        write("offset += 1")
+        write.depth -= 1
+        write("if once:")
+        write("    yield accept, start, length")
+        write("    return")
+        write("if accept is None or length == start:")
+        write("    raise NoMatchError(text[start:offset + 1])")
+        write("yield accept, start, length")
+        write("start = length")
+
+        print()
+        print("\n".join(write.lines))
+        self._automata.append(name)
+
+    def emit_trailer(self):
+        print()
+        print(inspect.getsource(dfa.NoMatchError))
+        print(inspect.getsource(match))
+        print(inspect.getsource(spans))
+        if self._automata:
+            print("if __name__ == \"__main__\":")
+            print("    import sys")
+            if self._args.utf8:
+                print("    text = sys.stdin.buffer.read()")
+                print("    for token, start, end in spans({}, text):".format(
+                        self._automata[0]))
+                print("        print(token,"
+                        " repr(text[start:end].decode(\"utf-8\")))")
+            else:
+                print("    text = sys.stdin.read()")
+                print("    for token, start, end in spans({}, text):".format(
+                        self._automata[0]))
+                print("        print(token, repr(text[start:end]))")
@@ -0,0 +1,37 @@
+# Epsilon
+# Copyright (C) 2018
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import sys
+from . import dfa
+from . import target
+
+class Target(target.Target):
+    """Write the tables of all automata to a binary file, which
+    dfa.maptables() or the maptables() of a generated python scanner
+    maps into memory.
+    """
+
+    def __init__(self, args):
+        super().__init__(args)
+        self._tables = []
+
+    def emit_automaton(self, name, automaton):
+        self._tables.append((name, dfa.tabulate(automaton)))
+
+    def emit_trailer(self):
+        sys.stdout.flush()
+        dfa.writetables(sys.stdout.buffer, self._tables)
+        sys.stdout.buffer.flush()
@@ -0,0 +1,72 @@
+# Epsilon
+# Copyright (C) 2018
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import os
+import tempfile
+import unittest
+import unittest.mock
+from . import cache
+from . import dfa
+from . import parse
+from . import regex
+
+class TestCache(unittest.TestCase):
+    def _automaton(self):
+        parser = parse.Parser()
+        return dfa.construct(dfa.ExpressionVector([
+                ("word", parser.parse("[a-z\\u00e9]+")),
+                ("number", parser.parse("[0-9]+")),
+                ("both", parser.parse("[0-9a-z]"))]))
+
+    def test_digest(self):
+        codespace = regex.unicode.codespace
+        key = cache.digest([("a", "x+")], codespace)
+        self.assertEqual(key, cache.digest([("a", "x+")], codespace))
+        self.assertNotEqual(key, cache.digest([("a", "x*")], codespace))
+        self.assertNotEqual(key, cache.digest([("b", "x+")], codespace))
+        self.assertNotEqual(key, cache.digest([("a", "x+")], ((0, 255),)))
+        self.assertNotEqual(key,
+                cache.digest([("a", "x+")], codespace, minimize = True))
+        with unittest.mock.patch.object(cache.ucd, "version", "0.0.0"):
+            self.assertNotEqual(key, cache.digest([("a", "x+")], codespace))
+
+    def test_serialize(self):
+        automaton = self._automaton()
+        data = cache.dumps(automaton)
+        self.assertEqual(cache.loads(data), automaton)
+        with self.assertRaises(ValueError):
+            cache.loads(data[:-4])
+        with self.assertRaises(ValueError):
+            cache.loads(b"garbage")
+
+    def test_cache(self):
+        automaton = self._automaton()
+        with tempfile.TemporaryDirectory() as directory:
+            automata = cache.Cache(directory)
+            self.assertIsNone(automata.get("a"))
+            automata.put("a", automaton)
+            self.assertEqual(automata.get("a"), automaton)
+
+            # Only the most recently used entry fits.
+            size = len(cache.dumps(automaton))
+            automata.maxsize = size
+            os.utime(os.path.join(directory, "a.automaton"), (0, 0))
+            automata.put("b", automaton)
+            self.assertIsNone(automata.get("a"))
+            self.assertEqual(automata.get("b"), automaton)
+
+if __name__ == '__main__':
+    unittest.main()
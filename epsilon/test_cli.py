@@ -0,0 +1,59 @@
+# Epsilon
+# Copyright (C) 2018
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import os.path
+import tempfile
+import unittest
+from . import cli
+from . import dfa
+from . import target
+
+class _Automata(target.Target):
+    def __init__(self):
+        super().__init__(None)
+        self.automata = {}
+
+    def emit_automaton(self, name, automaton):
+        self.automata[name] = automaton
+
+class TestCli(unittest.TestCase):
+    SOURCE = """
+[sql]
+_flags = i
+select = select
+word = [a-z]+
+space = [ ]+
+
+[exact]
+select = select
+"""
+
+    def test_ignorecase(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "sql.epsilon")
+            with open(path, "w") as stream:
+                stream.write(self.SOURCE)
+            automata = _Automata()
+            cli._compile([path], automata)
+        sql, exact = automata.automata["sql"], automata.automata["exact"]
+        self.assertEqual(list(dfa.spans(sql, "SELECT Name")),
+                [("select", 0, 6), ("space", 6, 7), ("word", 7, 11)])
+        self.assertEqual(dfa.match(sql, "sElEcT"), ("select", 6))
+        self.assertEqual(dfa.match(exact, "select"), ("select", 6))
+        self.assertIsNone(dfa.match(exact, "SELECT"))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,315 @@
+# Epsilon
+# Copyright (C) 2018
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+
+import gc
+import io
+import itertools
+import os.path
+import random
+import tempfile
+import unittest
+from . import dfa
+from . import parse
+from . import regex
+
+def _run(automaton, text):
+    state = 0
+    for c in text:
+        state = next((nextstate
+                for first, last, nextstate in automaton.transitions[state]
+                if first <= ord(c) <= last), automaton.error)
+    return automaton.accepts[state]
+
+class TestDfa(unittest.TestCase):
+    def test_synthetic_rsc(self):
+        # a?{n}a{n} is the classic backtracking blowup. The number of
+        # derivative states must stay linear in n.
+        parser = parse.Parser()
+        for n in (5, 25, 50):
+            expr = parser.parse("a?" * n + "a" * n)
+            automaton = dfa.construct(dfa.ExpressionVector([("main", expr)]))
+            self.assertEqual(len(automaton.transitions), 2 * n + 2)
+            self.assertEqual(list(dfa.scan(automaton, iter("a" * n))),
+                    [("main", "a" * n)])
+
+    def test_minimize(self):
+        # Two equivalent accepting states (1 and 2) and an unreachable
+        # duplicate of the error state (4).
+        automaton = dfa.Automaton(
+                [[(0, 96, 3), (97, 97, 1), (98, 0x10ffff, 3)],
+                [(0, 96, 3), (97, 97, 2), (98, 0x10ffff, 3)],
+                [(0, 96, 4), (97, 97, 1), (98, 0x10ffff, 3)],
+                [(0, 0x10ffff, 3)],
+                [(0, 0x10ffff, 4)]],
+                [[], ["a"], ["a"], [], []], 3)
+        minimal = dfa.minimize(automaton)
+        self.assertEqual(minimal, dfa.Automaton(
+                [[(0, 96, 2), (97, 97, 1), (98, 0x10ffff, 2)],
+                [(0, 96, 2), (97, 97, 1), (98, 0x10ffff, 2)],
+                [(0, 0x10ffff, 2)]],
+                [[], ["a"], []], 2))
+
+    def test_minimize_lexer(self):
+        parser = parse.Parser()
+        vector = dfa.ExpressionVector([
+                ("dq", parser.parse(r'"([^\"]|\\.)*"')),
+                ("word", parser.parse("[a-z]+")),
+                ("ab", parser.parse("ab|ba")),
+                ("whitespace", parser.parse(r"\s+"))])
+        automaton = dfa.construct(vector)
+        minimal = dfa.minimize(automaton)
+        self.assertLessEqual(len(minimal.transitions),
+                len(automaton.transitions))
+        self.assertEqual(dfa.minimize(minimal), minimal)
+        for n in range(6):
+            for text in map("".join, itertools.product('ab"\\ ', repeat = n)):
+                self.assertEqual(_run(minimal, text), _run(automaton, text))
+
+    def test_tabulate(self):
+        parser = parse.Parser()
+        vector = dfa.ExpressionVector([
+                ("word", parser.parse(r"\w+")),
+                ("greek", parser.parse("[\u0391-\u03a9]+")),
+                ("other", parser.parse(".")),
+                ("crlf", parser.parse("\r\n"))])
+        automaton = dfa.construct(vector)
+        table = dfa.tabulate(automaton)
+        self.assertLess(table.nclasses, 20)
+        symbols = set([0, 255, 256, 0x10ffff])
+        for edges in automaton.transitions:
+            for first, last, _ in edges:
+                symbols.update((first - 1, first, last, last + 1))
+        symbols &= set(range(0x110000))
+        for state, edges in enumerate(automaton.transitions):
+            for symbol in symbols:
+                expected = next((nextstate for first, last, nextstate in edges
+                        if first <= symbol <= last), automaton.error)
+                if symbol < 256:
+                    c = table.lowclasses[symbol]
+                else:
+                    c = table.highclasses[
+                            dfa.bisect.bisect(table.highstarts, symbol) - 1]
+                self.assertEqual(
+                        table.transitions[state * table.nclasses + c],
+                        expected)
+
+    def test_dumptable(self):
+        parser = parse.Parser()
+        vector = dfa.ExpressionVector([
+                ("word", parser.parse(r"\w+")),
+                ("greek", parser.parse("[\u0391-\u03a9]+")),
+                ("κ", parser.parse("κ")),
+                ("other", parser.parse("."))])
+        table = dfa.tabulate(dfa.construct(vector))
+        for level in (0, 9):
+            self.assertEqual(dfa.loadtable(dfa.dumptable(table, level)),
+                    table)
+        empty = dfa.tabulate(dfa.construct(
+                dfa.ExpressionVector([("none", vector[0][1].NULL)])))
+        self.assertEqual(dfa.loadtable(dfa.dumptable(empty)), empty)
+
+    def test_dumpints(self):
+        ints = dfa.array.array("i", [0, -1, 1 << 30])
+        data = dfa.dumpints(b"magic\n", ints, ["a", "κ"])
+        loaded, names = dfa.loadints(data, b"magic\n")
+        self.assertEqual((list(loaded), names), ([0, -1, 1 << 30], ["a", "κ"]))
+        for bad in (data[:-1], data + b"\0", b"other\n" + data[6:]):
+            with self.assertRaises(ValueError):
+                dfa.loadints(bad, b"magic\n")
+
+    def test_maptables(self):
+        parser = parse.Parser()
+        vector = dfa.ExpressionVector([
+                ("word", parser.parse(r"\w+")),
+                ("greek", parser.parse("[\u0391-\u03a9]+")),
+                ("κ", parser.parse("κ")),
+                ("other", parser.parse("."))])
+        tables = [("lexer", dfa.tabulate(dfa.construct(vector))),
+                ("empty", dfa.tabulate(dfa.construct(
+                    dfa.ExpressionVector([("none", vector[0][1].NULL)]))))]
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "tables")
+            with open(path, "wb") as stream:
+                dfa.writetables(stream, tables)
+            mapped = dfa.maptables(path)
+            self.assertEqual(list(mapped), ["lexer", "empty"])
+            for name, table in tables:
+                self.assertEqual([list(field) if isinstance(field,
+                        memoryview) else field for field in mapped[name]],
+                        [list(field) if isinstance(field, dfa.array.array)
+                            else field for field in table])
+            text = "Ωμέγα κ 42"
+            self.assertEqual(list(dfa.spans(mapped["lexer"], text)),
+                    list(dfa.spans(tables[0][1], text)))
+            del mapped
+
+            with open(path, "wb") as stream:
+                stream.write(b"not a table file")
+            with self.assertRaises(ValueError):
+                dfa.maptables(path)
+
+    def test_spans(self):
+        parser = parse.Parser()
+        automaton = dfa.construct(dfa.ExpressionVector([
+                ("word", parser.parse("[a-z\u00e0-\u00ff]+")),
+                ("number", parser.parse("[0-9]+")),
+                ("space", parser.parse(" +"))]))
+        self.assertEqual(list(dfa.spans(automaton, "caf\u00e9 42")), [
+                ("word", 0, 4), ("space", 4, 5), ("number", 5, 7)])
+        self.assertEqual(list(dfa.spans(automaton, b"ab  12", 1, 5)), [
+                ("word", 1, 2), ("space", 2, 4), ("number", 4, 5)])
+        self.assertEqual(list(dfa.spans(automaton, memoryview(b"7 x"))), [
+                ("number", 0, 1), ("space", 1, 2), ("word", 2, 3)])
+        with self.assertRaises(dfa.NoMatchError):
+            list(dfa.spans(automaton, "ab!"))
+
+    def test_scan_all(self):
+        parser = parse.Parser()
+        automaton = dfa.construct(dfa.ExpressionVector([
+                ("word", parser.parse("[a-z]+")),
+                ("space", parser.parse(" *"))]))
+        self.assertEqual(list(dfa.scan(automaton, iter("ab cd  e"))), [
+                ("word", "ab"), ("space", " "), ("word", "cd"),
+                ("space", "  "), ("word", "e")])
+        with self.assertRaises(dfa.NoMatchError):
+            list(dfa.scan(automaton, iter("ab!")))
+
+    def test_stream(self):
+        parser = parse.Parser()
+        automaton = dfa.construct(dfa.ExpressionVector([
+                ("word", parser.parse("[a-zé]+")),
+                ("space", parser.parse(" *")),
+                ("arrow", parser.parse("->")),
+                ("minus", parser.parse("-"))]))
+        text = "ab cdé  e->-f - g" * 3
+        expected = [(token, text[start:end])
+                for token, start, end in dfa.spans(automaton, text)]
+        for chunksize in (1, 2, 3, 5, 1 << 16):
+            self.assertEqual(list(dfa.stream(automaton,
+                    io.StringIO(text), chunksize)), expected)
+            self.assertEqual([(token, match.decode("utf-8"))
+                    for token, match in dfa.stream(automaton,
+                        io.BytesIO(text.replace("é", "e").encode("utf-8")),
+                        chunksize)],
+                    [(token, match.replace("é", "e"))
+                        for token, match in expected])
+            with self.assertRaises(dfa.NoMatchError):
+                list(dfa.stream(automaton, io.StringIO("ab->!"), chunksize))
+        self.assertEqual(list(dfa.stream(automaton, io.StringIO(""))), [])
+
+    def test_match(self):
+        parser = parse.Parser()
+        automaton = dfa.construct(dfa.ExpressionVector([
+                ("main", parser.parse("a*b?"))]))
+        self.assertEqual(dfa.match(automaton, "aabx"), ("main", 3))
+        self.assertEqual(dfa.match(automaton, "xaab", 1), ("main", 4))
+        self.assertEqual(dfa.match(automaton, "x"), ("main", 0))
+        automaton = dfa.construct(dfa.ExpressionVector([
+                ("main", parser.parse("a+"))]))
+        self.assertIsNone(dfa.match(automaton, "b"))
+
+    def test_complement(self):
+        # A complement matches any string, of any length, which its
+        # operand does not.
+        parser = parse.Parser()
+        for pattern, matches, rejects in [
+                ("!()&a", ["a"], ["", "b"]),
+                ("!()&a*", ["a", "aaa"], [""]),
+                ("!(a*)&ab", ["ab"], ["a", "b"]),
+                ("!(a*)&[ab]*", ["b", "aab", "ba"], ["", "a", "aaa"]),
+                ("!(ab)&[ab]{2}", ["aa", "ba", "bb"], ["ab"]),
+                ("!(a|b*)&[ab]*", ["aa", "ab", "ba"], ["", "a", "b", "bb"])]:
+            automaton = dfa.construct(dfa.ExpressionVector([
+                    ("main", parser.parse(pattern))]))
+            for text in matches:
+                self.assertEqual(dfa.match(automaton, text),
+                        ("main", len(text)), (pattern, text))
+            for text in rejects:
+                self.assertNotEqual(dfa.match(automaton, text),
+                        ("main", len(text)), (pattern, text))
+
+        automaton = dfa.construct(dfa.ExpressionVector([
+                ("keyword", parser.parse("if|in")),
+                ("name", parser.parse("[a-z]+&!(if|in)")),
+                ("space", parser.parse(" +"))]))
+        self.assertEqual(list(dfa.spans(automaton, "if xif in x")), [
+                ("keyword", 0, 2), ("space", 2, 3), ("name", 3, 6),
+                ("space", 6, 7), ("keyword", 7, 9), ("space", 9, 10),
+                ("name", 10, 11)])
+
+    def test_lazy(self):
+        parser = parse.Parser()
+        vector = dfa.ExpressionVector([
+                ("word", parser.parse("[a-z]+")),
+                ("greek", parser.parse("[\u0391-\u03a9]+")),
+                ("space", parser.parse(" +"))])
+        text = "ab \u0391\u0392  cd"
+        expected = list(dfa.spans(dfa.construct(vector), text))
+        lazy = dfa.LazyAutomaton(vector)
+        self.assertEqual(list(dfa.spans(lazy, text)), expected)
+        self.assertEqual(lazy.flushes, 0)
+        self.assertEqual(list(dfa.spans(lazy, text)), expected)
+
+        # A tiny state cache must be flushed, but give the same tokens.
+        lazy = dfa.LazyAutomaton(vector, 3)
+        self.assertEqual(list(dfa.spans(lazy, text)), expected)
+        self.assertGreater(lazy.flushes, 0)
+        self.assertLessEqual(len(lazy.accepts), 3)
+        self.assertEqual(list(dfa.scan(lazy, iter(text))),
+                [(token, text[start:end]) for token, start, end in expected])
+        self.assertIsNone(dfa.match(lazy, "!"))
+
+    def test_lazy_only_constructs_reached_states(self):
+        parser = parse.Parser()
+        vector = dfa.ExpressionVector([
+                ("main", parser.parse("[ab]*a[ab]{10}"))])
+        lazy = dfa.LazyAutomaton(vector)
+        self.assertEqual(dfa.match(lazy, "a" * 12), ("main", 12))
+        self.assertLess(len(lazy.accepts), 20)
+
+    def test_lazy_flush_frees_expressions(self):
+        # Flushed states are only referenced by the intern table and the
+        # bounded derivative cache, so the number of interned expressions
+        # stays bounded however many states scanning visits.
+        namespace = regex.expressions(regex.unicode.codespace, 64)
+        a, b = namespace.SymbolSet(((97, 97),)), namespace.SymbolSet(((98, 98),))
+        either = namespace.LogicalOr(a, b)
+        expr = namespace.Concatenation(namespace.KleeneClosure(either),
+                namespace.Concatenation(a, namespace.Repetition(either, 10, 10)))
+        lazy = dfa.LazyAutomaton(dfa.ExpressionVector([("main", expr)]), 32)
+
+        random.seed(0)
+        counts = []
+        for _ in range(4):
+            text = "".join(random.choice("ab") for _ in range(5000))
+            dfa.match(lazy, text)
+            gc.collect()
+            counts.append(len(namespace.nodes))
+        self.assertGreater(lazy.flushes, 100)
+        self.assertLess(max(counts), 2000)
+        self.assertLess(counts[-1], 2 * counts[0])
+
+    def test_parallel_construct(self):
+        parser = parse.Parser()
+        vector = dfa.ExpressionVector([
+                ("main", parser.parse("[ab]*a[ab][ab][ab]")),
+                ("word", parser.parse(r"\w+"))])
+        self.assertEqual(dfa.construct(vector, jobs = 2),
+                dfa.construct(vector))
+
+if __name__ == '__main__':
+    unittest.main()
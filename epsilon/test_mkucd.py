@@ -0,0 +1,142 @@
+# Epsilon
+# Copyright (C) 2018
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import contextlib
+import io
+import os.path
+import tempfile
+import unittest
+import mkucd
+from . import util
+
+# Excerpts of the UCD files, in their own format.
+_FILES = {
+    "Scripts.txt": """# Scripts-14.0.0.txt
+0041..005A    ; Latin # L&  [26] LATIN CAPITAL LETTER A..
+0061..007A    ; Latin # L&  [26] LATIN SMALL LETTER A..
+0342          ; Inherited # Mn  COMBINING GREEK PERISPOMENI
+0391..03A1    ; Greek # L&  [17] GREEK CAPITAL LETTER ALPHA..
+03B1..03C1    ; Greek # L&  [17] GREEK SMALL LETTER ALPHA..
+0640          ; Common # Lm  ARABIC TATWEEL
+""",
+    "ScriptExtensions.txt": """# ScriptExtensions-14.0.0.txt
+0342          ; Grek # Mn  COMBINING GREEK PERISPOMENI
+0640          ; Adlm Arab # Lm  ARABIC TATWEEL
+""",
+    "PropertyAliases.txt": """# PropertyAliases-14.0.0.txt
+sc                       ; Script
+Alpha                    ; Alphabetic
+WSpace                   ; White_Space                 ; space
+""",
+    "PropertyValueAliases.txt": """# PropertyValueAliases-14.0.0.txt
+gc ; Lu                               ; Uppercase_Letter
+sc ; Adlm                             ; Adlam
+sc ; Arab                             ; Arabic
+sc ; Grek                             ; Greek
+sc ; Latn                             ; Latin
+sc ; Zinh                             ; Inherited                   ; Qaai
+sc ; Zyyy                             ; Common
+""",
+    "PropList.txt": """# PropList-14.0.0.txt
+0020          ; White_Space # Zs       SPACE
+""",
+    "DerivedCoreProperties.txt": """# DerivedCoreProperties-14.0.0.txt
+0041..005A    ; Alphabetic # L&  [26] LATIN CAPITAL LETTER A..
+0061..007A    ; Alphabetic # L&  [26] LATIN SMALL LETTER A..
+0041          ; InCB; Linker # a non-binary property
+""",
+    "CaseFolding.txt": """# CaseFolding-14.0.0.txt
+0041; C; 0061; # LATIN CAPITAL LETTER A
+00DF; F; 0073 0073; # LATIN SMALL LETTER SHARP S
+0130; T; 0069; # LATIN CAPITAL LETTER I WITH DOT ABOVE
+1E9E; F; 0073 0073; # LATIN CAPITAL LETTER SHARP S
+1E9E; S; 00DF; # LATIN CAPITAL LETTER SHARP S
+""",
+    os.path.join("extracted", "DerivedGeneralCategory.txt"):
+        """# DerivedGeneralCategory-14.0.0.txt
+0041..005A    ; Lu # [26] LATIN CAPITAL LETTER A..
+""",
+    }
+
+class TestMkucd(unittest.TestCase):
+    def setUp(self):
+        self._directory = tempfile.TemporaryDirectory()
+        self.directory = self._directory.name
+        os.mkdir(os.path.join(self.directory, "extracted"))
+        for name, text in _FILES.items():
+            with open(os.path.join(self.directory, name), "w",
+                    encoding = "utf-8") as stream:
+                stream.write(text)
+
+    def tearDown(self):
+        self._directory.cleanup()
+
+    def test_aliases(self):
+        scripts, properties = mkucd.aliases(self.directory)
+        self.assertEqual(scripts["Grek"], "Greek")
+        self.assertEqual(scripts["Qaai"], "Inherited")
+        self.assertNotIn("Lu", scripts)
+        self.assertEqual(properties, {"sc": "Script", "Alpha": "Alphabetic",
+                "WSpace": "White_Space", "space": "White_Space"})
+
+    def test_properties(self):
+        binary = mkucd.properties(self.directory,
+                "DerivedCoreProperties.txt", binary = True)
+        self.assertEqual(list(binary), ["Alphabetic"])
+        self.assertEqual(tuple(binary["Alphabetic"]), ((65, 90), (97, 122)))
+
+    def test_script_extensions(self):
+        scripts = mkucd.properties(self.directory, "Scripts.txt")
+        aliases, _ = mkucd.aliases(self.directory)
+        extensions = mkucd.script_extensions(self.directory, scripts,
+                aliases)
+        self.assertEqual(tuple(extensions["Greek"]),
+                ((0x342, 0x342), (0x391, 0x3a1), (0x3b1, 0x3c1)))
+        self.assertEqual(tuple(extensions["Inherited"]), ())
+        self.assertEqual(tuple(extensions["Common"]), ())
+        self.assertEqual(tuple(extensions["Arabic"]), ((0x640, 0x640),))
+        self.assertEqual(tuple(extensions["Adlam"]), ((0x640, 0x640),))
+        self.assertEqual(extensions["Latin"], scripts["Latin"])
+
+    def test_case_folding(self):
+        self.assertEqual(mkucd.case_folding(self.directory),
+                {0x41: 0x61, 0x1e9e: 0xdf})
+
+    def test_main(self):
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            mkucd.main(self.directory)
+        # The module imports util relative to its package.
+        namespace = {"util": util}
+        exec(output.getvalue().replace("from . import util", ""), namespace)
+        self.assertIn("Unicode 14.0.0", output.getvalue())
+        self.assertEqual(namespace["version"], "14.0.0")
+        self.assertEqual(tuple(namespace["scripts"]["Greek"]),
+                ((0x391, 0x3a1), (0x3b1, 0x3c1)))
+        self.assertEqual(namespace["case_folding"](),
+                {0x41: 0x61, 0x1e9e: 0xdf})
+
+    def test_empty(self):
+        # An empty table is an error, rather than a silently empty build.
+        with open(os.path.join(self.directory, "CaseFolding.txt"),
+                "w") as stream:
+            stream.write("# CaseFolding-14.0.0.txt\n")
+        with self.assertRaises(ValueError):
+            with contextlib.redirect_stdout(io.StringIO()):
+                mkucd.main(self.directory)
+
+if __name__ == '__main__':
+    unittest.main()
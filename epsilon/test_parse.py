@@ -16,6 +16,7 @@
 
 import random
 import unittest
+import unittest.mock
 from . import parse
 
 class TestIntegerSet(unittest.TestCase):
@@ -33,9 +34,9 @@ class TestIntegerSet(unittest.TestCase):
         ("a?", "LogicalOr(SymbolSet(((97, 97),)), Epsilon())"),
         ("a+", "Concatenation(SymbolSet(((97, 97),)), KleeneClosure(SymbolSet(((97, 97),))))"),
         ("a*", "KleeneClosure(SymbolSet(((97, 97),)))"),
-        ("a{3}", "Concatenation(SymbolSet(((97, 97),)), Concatenation(SymbolSet(((97, 97),)), SymbolSet(((97, 97),))))"),
-        ("a{3,}", "Concatenation(SymbolSet(((97, 97),)), Concatenation(SymbolSet(((97, 97),)), Concatenation(SymbolSet(((97, 97),)), KleeneClosure(Concatenation(SymbolSet(((97, 97),)), Concatenation(SymbolSet(((97, 97),)), SymbolSet(((97, 97),))))))))"),
-        ("a{3,5}", "Concatenation(SymbolSet(((97, 97),)), Concatenation(SymbolSet(((97, 97),)), Concatenation(SymbolSet(((97, 97),)), Concatenation(LogicalOr(Epsilon(), Concatenation(SymbolSet(((97, 97),)), Concatenation(SymbolSet(((97, 97),)), SymbolSet(((97, 97),))))), LogicalOr(Epsilon(), Concatenation(SymbolSet(((97, 97),)), Concatenation(SymbolSet(((97, 97),)), SymbolSet(((97, 97),)))))))))"),
+        ("a{3}", "Repetition(SymbolSet(((97, 97),)), 3, 3)"),
+        ("a{3,}", "Repetition(SymbolSet(((97, 97),)), 3, None)"),
+        ("a{3,5}", "Repetition(SymbolSet(((97, 97),)), 3, 5)"),
         ("a*|b*", "LogicalOr(KleeneClosure(SymbolSet(((98, 98),))), KleeneClosure(SymbolSet(((97, 97),))))"),
         ("a*&b*", "LogicalAnd(KleeneClosure(SymbolSet(((98, 98),))), KleeneClosure(SymbolSet(((97, 97),))))"),
         ("(ab*)", "Concatenation(SymbolSet(((97, 97),)), KleeneClosure(SymbolSet(((98, 98),))))"),
@@ -48,5 +49,63 @@ class TestIntegerSet(unittest.TestCase):
             expr = parser.parse(pattern)
             self.assertEqual(str(expr), expected)
 
+    def test_properties(self):
+        parser = parse.Parser()
+        self.assertIs(parser.parse("\\p{gc=Lu}"), parser.parse("\\p{Lu}"))
+        self.assertIs(parser.parse("\\p{General_Category=Nd}"),
+                parser.parse("\\d"))
+        greek = parser.parse("\\p{Greek}")
+        self.assertIs(parser.parse("\\p{sc=Grek}"), greek)
+        self.assertIs(parser.parse("\\p{Script=greek}"), greek)
+        self.assertTrue(greek.codepoints.has(0x3b1))
+        self.assertFalse(greek.codepoints.has(ord("a")))
+        # U+0342 COMBINING GREEK PERISPOMENI is Inherited, with the Greek
+        # script extension.
+        self.assertFalse(greek.codepoints.has(0x342))
+        self.assertTrue(parser.parse("\\p{scx=Grek}").codepoints.has(0x342))
+        alphabetic = parser.parse("\\p{Alphabetic}")
+        self.assertIs(parser.parse("\\p{Alpha}"), alphabetic)
+        for c in "aZ\u03b1\u05d0\u4e00":
+            self.assertTrue(alphabetic.codepoints.has(ord(c)), c)
+        for c in "1 -\u0300":
+            self.assertFalse(alphabetic.codepoints.has(ord(c)), c)
+        for pattern in ["\\p{Klingon}", "\\p{sc=Klingon}", "\\p{xx=Lu}"]:
+            with self.assertRaises(parse.SyntaxError):
+                parser.parse(pattern)
+
+    def test_ignorecase(self):
+        orbits = parse._case_orbits({65: 97, 66: 98, 75: 107, 0x212a: 107})
+        self.assertEqual(tuple(orbits[107]), ((75, 75), (107, 107),
+                (0x212a, 0x212a)))
+        parser = parse.Parser(ignorecase = True)
+        parser._orbits = orbits
+        self.assertEqual(str(parser.parse("ab")),
+                "Concatenation(SymbolSet(((65, 65), (97, 97))), "
+                "SymbolSet(((66, 66), (98, 98))))")
+        self.assertEqual(str(parser.parse("[k-l]")),
+                "SymbolSet(((75, 75), (107, 108), (8490, 8490)))")
+        self.assertEqual(str(parser.parse("[^a]")),
+                "SymbolSet(((0, 64), (66, 96), (98, 1114111)))")
+        self.assertEqual(str(parser.parse("c")), "SymbolSet(((99, 99),))")
+
+    def test_unicode_ignorecase(self):
+        parser = parse.Parser(ignorecase = True)
+        self.assertEqual(tuple(parser.parse("k").codepoints),
+                ((75, 75), (107, 107), (0x212a, 0x212a)))
+        self.assertEqual(tuple(parser.parse("\u03c3").codepoints),
+                ((0x3a3, 0x3a3), (0x3c2, 0x3c3)))
+        self.assertFalse(parser.parse("[^k]").codepoints.has(0x212a))
+        self.assertIs(parser.parse("[^\u212a]"), parser.parse("[^K]"))
+
+        # Without a case folding table, case cannot be ignored.
+        parse._unicode_case_orbits.cache_clear()
+        try:
+            with unittest.mock.patch.object(parse.ucd, "case_folding",
+                    dict):
+                with self.assertRaises(ValueError):
+                    parse.Parser(ignorecase = True)
+        finally:
+            parse._unicode_case_orbits.cache_clear()
+
 if __name__ == '__main__':
     unittest.main()
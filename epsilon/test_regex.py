@@ -0,0 +1,148 @@
+# Epsilon
+# Copyright (C) 2018
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+
+import itertools
+import pickle
+import unittest
+from . import dfa
+from . import parse
+from . import regex
+
+class TestExpression(unittest.TestCase):
+    def test_interning(self):
+        parser = parse.Parser()
+        x = parser.parse("(ab|c)*d")
+        y = parser.parse("(ab|c)*d")
+        self.assertIs(x, y)
+        self.assertEqual(hash(x), hash(y))
+        self.assertIs(regex.unicode.SymbolSet(), regex.unicode.Epsilon.NULL)
+        self.assertIs(regex.unicode.Epsilon(), regex.unicode.Epsilon.EPSILON)
+
+    def test_ordering(self):
+        parser = parse.Parser()
+        x, y = parser.parse("ab"), parser.parse("cd")
+        self.assertNotEqual(x, y)
+        self.assertTrue(x < y or y < x)
+        self.assertIs(regex.unicode.LogicalOr(x, y),
+                regex.unicode.LogicalOr(y, x))
+
+        # The order is structural, so it does not depend on the order in
+        # which expressions were first constructed.
+        strings = []
+        for cachesize, symbols in [(1, "ab"), (2, "ba")]:
+            namespace = regex.expressions(regex.unicode.codespace, cachesize)
+            stars = {symbol: namespace.KleeneClosure(
+                    namespace.SymbolSet(((ord(symbol), ord(symbol)),)))
+                    for symbol in symbols}
+            strings.append((str(namespace.LogicalOr(*stars.values())),
+                    str(namespace.LogicalAnd(*stars.values()))))
+        self.assertEqual(strings[0], strings[1])
+
+    def test_normal_form(self):
+        parser = parse.Parser()
+        self.assertIs(parser.parse("a|(b*|c*)"), parser.parse("(c*|a)|b*"))
+        self.assertIs(parser.parse("a|b*|a|b*"), parser.parse("b*|a"))
+        self.assertIs(parser.parse("a*&(b*&c*)"), parser.parse("(c*&a*)&b*"))
+        self.assertIs(parser.parse("b|a*|c"), parser.parse("[bc]|a*"))
+        self.assertIs(parser.parse("(|a*)"), parser.parse("a*"))
+        self.assertIs(parser.parse("(a?)*"), parser.parse("a*"))
+        self.assertIs(parser.parse("a*&"), parser.parse(""))
+        self.assertIs(parser.parse("a&"), regex.unicode.Epsilon.NULL)
+
+        # The complement of the empty language is the universal language.
+        universe = regex.unicode.Epsilon.UNIVERSE
+        self.assertIs(regex.unicode.Complement(regex.unicode.Epsilon.NULL),
+                universe)
+        self.assertIs(regex.unicode.Complement(universe),
+                regex.unicode.Epsilon.NULL)
+        self.assertIs(parser.parse("!(a*)&(.*)"), parser.parse("!(a*)"))
+
+        # Sigma is a single symbol, not the universal language.
+        self.assertIsNot(parser.parse(".|ab"), parser.parse("."))
+        self.assertIsNot(parser.parse(".&ab"), parser.parse("ab"))
+
+    def test_repetition(self):
+        parser = parse.Parser()
+        for counted, unrolled in [("a{3}", "aaa"), ("a{0}", ""),
+                ("a{2,4}", "aa(a(a)?)?"), ("(ab){2,}", "abab(ab)*"),
+                ("(a?b){1,2}", "a?b(a?b)?"), ("(a*){2,3}", "a*")]:
+            vector = dfa.ExpressionVector([
+                    ("counted", parser.parse(counted)),
+                    ("unrolled", parser.parse(unrolled))])
+            automaton = dfa.construct(vector)
+            for n in range(8):
+                for text in map("".join, itertools.product("ab", repeat = n)):
+                    state = 0
+                    for c in text:
+                        state = next(s for first, last, s
+                                in automaton.transitions[state]
+                                if first <= ord(c) <= last)
+                    accepts = automaton.accepts[state]
+                    self.assertEqual("counted" in accepts,
+                            "unrolled" in accepts, (counted, text))
+
+    def test_large_repetition(self):
+        parser = parse.Parser()
+        expr = parser.parse("[0-9]{1,1000}")
+        self.assertEqual(str(expr),
+                "Repetition(SymbolSet(((48, 57),)), 1, 1000)")
+        automaton = dfa.construct(dfa.ExpressionVector([("number", expr)]))
+        self.assertEqual(len(automaton.transitions), 1002)
+
+    def test_nullable(self):
+        parser = parse.Parser()
+        for pattern, nullable in [("", True), ("a", False), ("a*", True),
+                ("a?b?", True), ("a?b", False), ("a|b*", True),
+                ("a*&b*", True), ("a*&b", False), ("!(a*)", False),
+                ("!(ab)", True)]:
+            expr = parser.parse(pattern)
+            self.assertEqual(expr.nullable(), nullable, pattern)
+            self.assertIs(expr.nu(), expr.EPSILON if nullable else expr.NULL)
+
+    def test_symbolsets(self):
+        parser = parse.Parser()
+        expr = parser.parse("(ab)*|[a-c]{2,3}&b*")
+        self.assertEqual(
+                sorted(tuple(symbolset.codepoints)
+                    for symbolset in expr.symbolsets()),
+                [((97, 97),), ((97, 99),), ((98, 98),)])
+        self.assertEqual(parser.parse("").symbolsets(), set())
+
+    def test_pickle(self):
+        parser = parse.Parser()
+        expr = parser.parse("(ab|[c-e]){2,5}&!(abab)|x*")
+        exprs = [expr] + [expr.derivative(symbol) for symbol in b"abcx"]
+        for expr in exprs:
+            self.assertIs(pickle.loads(pickle.dumps(expr)), expr)
+
+    def test_derivative_cache(self):
+        ascii = regex.expressions(((0, 127),), cachesize = 2)
+        a = ascii.KleeneClosure(ascii.SymbolSet((97,)))
+        b = ascii.KleeneClosure(ascii.SymbolSet((98,)))
+        self.assertIs(a.derivative(97), a)
+        self.assertIs(a.derivative(97), a)
+        info = ascii.derivative.cache_info()
+        self.assertEqual((info.hits, info.misses), (1, 1))
+
+        self.assertIs(b.derivative(97), ascii.Epsilon.NULL)
+        self.assertIs(b.derivative(98), b)
+        a.derivative(97)
+        info = ascii.derivative.cache_info()
+        self.assertEqual((info.hits, info.misses, info.currsize), (1, 4, 2))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,134 @@
+# Epsilon
+# Copyright (C) 2018
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import contextlib
+import io
+import os.path
+import random
+import shutil
+import subprocess
+import tempfile
+import unittest
+from . import dfa
+from . import parse
+from . import target_c
+from . import utf8
+
+_MAIN = r"""
+#include <stdio.h>
+
+int main(void)
+{
+    static uint8_t text[1 << 16];
+    size_t length = fread(text, 1, sizeof text, stdin), offset = 0, end;
+    while (offset < length) {
+        int token = lexer_next_token(text + offset, length - offset, &end);
+        printf("%d %zu\n", token, end);
+        if (token == LEXER_NONE)
+            break;
+        offset += end;
+    }
+    return 0;
+}
+"""
+
+class TestTargetC(unittest.TestCase):
+    ITERATIONS = 100
+
+    def test_pack(self):
+        random.seed(0)
+        for _ in range(self.ITERATIONS):
+            rows = [[random.choice([0, 0, 0, random.randrange(10)])
+                    for _ in range(8)] for _ in range(10)]
+            base, nextstates, check = target_c.pack(rows, 0)
+            self.assertEqual(len(nextstates), len(check))
+            self.assertGreaterEqual(min(base), 0)
+            self.assertLessEqual(max(base) + len(rows[0]), len(check))
+            for r, row in enumerate(rows):
+                self.assertEqual(row, [nextstates[base[r] + c]
+                        if check[base[r] + c] == r else 0
+                        for c in range(len(row))])
+
+    def test_pack_base(self):
+        base, _, _ = target_c.pack([[1, 0, 1, 0, 0, 0, 0, 0],
+                [0, 0, 0, 2, 0, 0, 0, 0]], 0)
+        self.assertEqual(base, [0, 0])
+
+    @unittest.skipUnless(shutil.which("cc"), "no C compiler")
+    def test_compile(self):
+        parser = parse.Parser()
+        vector = dfa.ExpressionVector(
+                (token, utf8.lower(parser.parse(pattern)))
+                for token, pattern in [("word", r"\w+"), ("space", r"\s+"),
+                    ("number", r"[0-9]+"), ("other", r"[^\w\s]")])
+        automaton = dfa.construct(vector)
+        target = target_c.Target(None)
+        source = io.StringIO()
+        with contextlib.redirect_stdout(source):
+            target.emit_header()
+            target.emit_automaton("lexer", automaton)
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "lexer.c")
+            with open(path, "w") as stream:
+                stream.write(source.getvalue() + _MAIN)
+            program = os.path.join(directory, "lexer")
+            subprocess.run(["cc", "-std=c99", "-Wall", "-Werror",
+                    "-o", program, path], check = True)
+
+            text = "héllo 42 wörld, 日本語 \U0001f600\n".encode("utf-8")
+            output = subprocess.run([program], input = text,
+                    stdout = subprocess.PIPE, check = True).stdout
+        names = {}
+        for line in source.getvalue().splitlines():
+            if line.startswith("    LEXER_") and "=" not in line:
+                names[len(names)] = line.split(",")[0].strip()[6:].lower()
+        self.assertEqual([(names[int(token)], int(end))
+                for token, end in map(bytes.split, output.splitlines())],
+                [(token, end - start)
+                    for token, start, end in dfa.spans(automaton, text)])
+
+    @unittest.skipUnless(shutil.which("cc"), "no C compiler")
+    def test_compile_names(self):
+        # Token and automaton names which clash once sanitized, or
+        # which would redefine NAME_NONE, still compile.
+        parser = parse.Parser()
+        target = target_c.Target(None)
+        source = io.StringIO()
+        with contextlib.redirect_stdout(source):
+            target.emit_header()
+            for name, tokens in [("lexer", ["none", "a-b", "a_b", "Foo",
+                    "foo", "**", "*/"]), ("Lexer", ["x"]), ("lexer-2", ["x"])]:
+                target.emit_automaton(name, dfa.construct(
+                        dfa.ExpressionVector((token, parser.parse(pattern))
+                            for token, pattern in zip(tokens, "abcdefg"))))
+        text = source.getvalue()
+        for enumerator in ["LEXER_NONE = -1", "LEXER_NONE_2, /* none */",
+                "LEXER_A_B,", "LEXER_A_B_2, /* a_b */", "LEXER_FOO,",
+                "LEXER_FOO_2, /* foo */", "LEXER___,", "LEXER____2, /* * / */",
+                "LEXER_2_NONE = -1", "LEXER_2_2_NONE = -1"]:
+            self.assertIn("    " + enumerator, text)
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "lexer.c")
+            with open(path, "w") as stream:
+                stream.write(text)
+            subprocess.run(["cc", "-std=c99", "-Wall", "-Werror", "-c",
+                    "-o", os.path.join(directory, "lexer.o"), path],
+                    check = True)
+
+if __name__ == '__main__':
+    unittest.main()
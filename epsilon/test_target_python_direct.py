@@ -0,0 +1,107 @@
+# Epsilon
+# Copyright (C) 2018
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import argparse
+import contextlib
+import io
+import random
+import unittest
+from . import dfa
+from . import parse
+from . import target_python_direct
+from . import utf8
+
+def _collect(spans):
+    tokens = []
+    try:
+        tokens.extend(spans)
+    except Exception as e:
+        tokens.append(e.__class__.__name__)
+    return tokens
+
+class TestTargetPythonDirect(unittest.TestCase):
+    ITERATIONS = 100
+
+    PATTERNS = [("word", r"\w+"), ("number", r"[0-9]+"), ("space", r" +"),
+            ("string", r"'[^']*'"), ("arrow", r"->"), ("minus", r"-")]
+
+    def _generate(self, encode):
+        parser = parse.Parser()
+        vector = dfa.ExpressionVector(
+                (token, parser.parse(pattern))
+                for token, pattern in self.PATTERNS)
+        if encode:
+            vector = dfa.ExpressionVector(
+                    (token, utf8.lower(expr)) for token, expr in vector)
+        automaton = dfa.construct(vector)
+
+        target = target_python_direct.Target(
+                argparse.Namespace(utf8 = encode))
+        source = io.StringIO()
+        with contextlib.redirect_stdout(source):
+            target.emit_header()
+            target.emit_automaton("lexer", automaton)
+            target.emit_trailer()
+        namespace = {"__name__": "lexer"}
+        exec(source.getvalue(), namespace)
+        return automaton, namespace
+
+    def test_spans(self):
+        random.seed(0)
+        for encode in (False, True):
+            automaton, namespace = self._generate(encode)
+            lexer, spans = namespace["lexer"], namespace["spans"]
+            for _ in range(self.ITERATIONS):
+                text = "".join(random.choice(["a", "é", "9", " ", "'",
+                        "->", "-", "日"]) for _ in range(20))
+                if encode:
+                    text = text.encode("utf-8")
+                self.assertEqual(_collect(spans(lexer, text)),
+                        _collect(dfa.spans(automaton, text)))
+
+    def test_match(self):
+        _, namespace = self._generate(False)
+        lexer, match = namespace["lexer"], namespace["match"]
+        self.assertEqual(match(lexer, "abc def"), ("word", 3))
+        self.assertEqual(match(lexer, "abc def", 3), ("space", 4))
+        self.assertEqual(match(lexer, "'abc"), None)
+        self.assertEqual(match(lexer, ""), None)
+        with self.assertRaises(namespace["NoMatchError"]):
+            list(namespace["spans"](lexer, "ab 'c"))
+
+    def test_match_empty(self):
+        # Like dfa.match(), match() accepts an empty token.
+        parser = parse.Parser()
+        automaton = dfa.construct(dfa.ExpressionVector([
+                ("space", parser.parse(" *")), ("word", parser.parse("a+"))]))
+        target = target_python_direct.Target(argparse.Namespace(utf8 = False))
+        source = io.StringIO()
+        with contextlib.redirect_stdout(source):
+            target.emit_header()
+            target.emit_automaton("lexer", automaton)
+            target.emit_trailer()
+        namespace = {"__name__": "lexer"}
+        exec(source.getvalue(), namespace)
+        lexer, match = namespace["lexer"], namespace["match"]
+        for text, start in [("  a", 0), ("a", 0), ("b", 0), ("", 0),
+                ("ab", 2), ("a  ", 1)]:
+            self.assertEqual(match(lexer, text, start),
+                    dfa.match(automaton, text, start), (text, start))
+        self.assertEqual(_collect(namespace["spans"](lexer, "a b")),
+                _collect(dfa.spans(automaton, "a b")))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,87 @@
+# Epsilon
+# Copyright (C) 2018
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import itertools
+import random
+import unittest
+from . import dfa
+from . import parse
+from . import utf8
+
+class TestUtf8(unittest.TestCase):
+    RANGES = [(0, 0x10ffff), (0x7e, 0x801), (0xd7f0, 0xe010),
+            (0x10000, 0x10ffff), (0x12c, 0x11170), (0xe9, 0xe9)]
+
+    def test_sequences(self):
+        for first, last in self.RANGES:
+            encodings = sorted(bytes(encoding)
+                    for sequence in utf8.sequences(first, last)
+                    for encoding in itertools.product(
+                        *(range(low, high + 1) for low, high in sequence)))
+            self.assertEqual(encodings, sorted(chr(c).encode("utf-8")
+                    for c in range(first, last + 1)
+                    if not 0xd800 <= c <= 0xdfff))
+        self.assertEqual(list(utf8.sequences(0, 0x7ff)),
+                [((0, 0x7f),), ((0xc2, 0xdf), (0x80, 0xbf))])
+
+    def test_spans(self):
+        # Byte offsets of a lowered automaton are the encoded offsets of
+        # the code point automaton.
+        parser = parse.Parser()
+        patterns = [("word", r"\w+"), ("space", r"\s+"),
+                ("quoted", r"'(!(\p{Cc}|'))*'"), ("other", r"!(\w|\s)")]
+        vector = dfa.ExpressionVector(
+                (token, parser.parse(pattern)) for token, pattern in patterns)
+        codepoints = dfa.tabulate(dfa.construct(vector))
+        octets = dfa.tabulate(dfa.construct(dfa.ExpressionVector(
+                (token, utf8.lower(expr)) for token, expr in vector)))
+
+        alphabet = "ab é日 \U0001f600'\n"
+        random.seed(0)
+        for _ in range(100):
+            text = "".join(random.choice(alphabet) for _ in range(20))
+            encoded = text.encode("utf-8")
+            self.assertEqual(
+                    [(token, text[start:end]) for token, start, end
+                        in dfa.spans(codepoints, text)],
+                    [(token, encoded[start:end].decode("utf-8"))
+                        for token, start, end in dfa.spans(octets, encoded)])
+
+    def test_invalid(self):
+        vector = dfa.ExpressionVector(
+                [("other", utf8.lower(parse.Parser().parse("[^a]+")))])
+        automaton = dfa.construct(vector)
+        self.assertEqual(dfa.match(automaton, "b€a".encode("utf-8")),
+                ("other", 4))
+        self.assertEqual(dfa.match(automaton, b"b\xff"), ("other", 1))
+        self.assertEqual(dfa.match(automaton, b"\xed\xa0\x80"), None)
+
+    def test_unencodable(self):
+        # Surrogates have no encoding, so a set of them matches nothing
+        # in both automata, as does the NULL expression.
+        parser = parse.Parser()
+        for pattern in [r"a[\ud800-\udfff]b", r"a\x{dfff}b", "a(!.)b",
+                r"a[\ud800-\udfff]b|c", r"(a[\ud800-\udfff])*b"]:
+            vector = dfa.ExpressionVector([("t", parser.parse(pattern))])
+            codepoints = dfa.construct(vector)
+            octets = dfa.construct(dfa.ExpressionVector(
+                    (token, utf8.lower(expr)) for token, expr in vector))
+            for text in ["ab", "a", "b", "c", "", "abc"]:
+                self.assertEqual(dfa.match(octets, text.encode("utf-8")),
+                        dfa.match(codepoints, text), (pattern, text))
+
+if __name__ == '__main__':
+    unittest.main()
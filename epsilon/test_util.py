@@ -14,6 +14,7 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
+import pickle
 import random
 import unittest
 from . import util
@@ -30,6 +31,23 @@ class TestIntegerSet(unittest.TestCase):
             self.assertEqual(util.IntegerSet(x), x)
             self.assertEqual(x.cardinality(), len(a))
 
+    def test_sequence(self):
+        for i in range(self.ITERATIONS):
+            a = set(random.sample(range(self.RANGE), self.SAMPLES))
+            b = set(random.sample(range(self.RANGE), self.SAMPLES))
+            x, y = util.IntegerSet(a), util.IntegerSet(b)
+            ranges = tuple(x)
+            self.assertEqual(len(x), len(ranges))
+            self.assertEqual(x[0], ranges[0])
+            self.assertEqual(x[-1], ranges[-1])
+            self.assertEqual(repr(x), repr(ranges))
+            self.assertEqual(x < y, ranges < tuple(y))
+            self.assertEqual(pickle.loads(pickle.dumps(x)), x)
+            self.assertEqual(util.IntegerSet.frombytes(x.tobytes()), x)
+            self.assertEqual(hash(util.IntegerSet(ranges)), hash(x))
+        self.assertFalse(util.IntegerSet())
+        self.assertEqual(repr(util.IntegerSet()), "()")
+
     def test_has(self):
         for i in range(self.ITERATIONS):
             a = set(random.sample(range(self.RANGE), self.SAMPLES))
@@ -105,5 +123,39 @@ class TestIntegerSet(unittest.TestCase):
             self.assertEqual(x, util.IntegerSet(b).symmetric_difference(a))
             self.assertEqual(x, util.IntegerSet(c))
 
+    def test_latin1_boundary(self):
+        # Sets straddling 256 are split between the bitmask and the ranges.
+        for i in range(self.ITERATIONS // 10):
+            a = set(random.sample(range(200, 320), self.SAMPLES))
+            b = set(random.sample(range(200, 320), self.SAMPLES))
+            a.update(range(250, 262))
+            x, y = util.IntegerSet(a), util.IntegerSet(b)
+            self.assertEqual(x, util.IntegerSet(tuple(x)))
+            self.assertEqual(x.cardinality(), len(a))
+            for j in range(190, 330):
+                self.assertEqual(j in a, x.has(j))
+            self.assertEqual(x.union(y), util.IntegerSet(a | b))
+            self.assertEqual(x.intersection(y), util.IntegerSet(a & b))
+            self.assertEqual(x.difference(y), util.IntegerSet(a - b))
+            self.assertEqual(x.symmetric_difference(y), util.IntegerSet(a ^ b))
+            self.assertEqual(tuple(x.union(y)), tuple(util.IntegerSet(a | b)))
+
+    def test_refine_partitions(self):
+        universe = util.IntegerSet(((0, self.RANGE - 1),))
+        for i in range(self.ITERATIONS // 10):
+            partitions = []
+            for j in range(random.randint(1, 4)):
+                a = util.IntegerSet(random.sample(range(self.RANGE),
+                    random.randint(1, self.SAMPLES)))
+                partitions.append(list(filter(None,
+                    {a, universe.difference(a)})))
+            expected = set(filter(None,
+                util.product_intersections(*partitions)))
+            refined = util.refine_partitions(*partitions)
+            self.assertEqual(len(refined), len(expected))
+            self.assertEqual(set(refined), expected)
+            firsts = [block[0][0] for block in refined]
+            self.assertEqual(firsts, sorted(firsts))
+
 if __name__ == '__main__':
     unittest.main()
@@ -6,6 +6,7 @@ import time
 
 from . import dfa
 from . import parse
+from . import regex
 from . import target_execute
 from . import util
 
@@ -39,7 +40,8 @@ def main(argv):
     vector = dfa.ExpressionVector([(name, expr)])
     #log(vector)
 
-    automaton = dfa.construct(vector)
+    # Only the states which the input reaches are constructed.
+    automaton = dfa.LazyAutomaton(vector)
 
     elapsed = time.time() - start_time
     log('%.5f DFA', elapsed)
@@ -54,16 +56,15 @@ def main(argv):
     #text = (c for line in sys.stdin for c in line)
     #print(list(text))
 
-    # Must be an iterator
-    text = iter(s)
-    #log(text)
-
-    try:
-        for token, match in dfa.scan(automaton, text):
-            #print(token, repr(match))
-            print(match)
-    except dfa.NoMatchError:
+    result = dfa.match(automaton, s)
+    log('%d states constructed', len(automaton.accepts))
+    info = regex.unicode.derivative.cache_info()
+    log('%d derivative cache hits, %d misses', info.hits, info.misses)
+    if result is None:
         print('NOPE')
+    else:
+        token, end = result
+        print(s[:end])
 
     log('%.5f Matched', elapsed)
 
@@ -6,3704 +6,1186 @@
 # This file is automatically generated. *** DO NOT EDIT ***
 
 """
-Unicode 10.0.0 codepoint properties.
+Unicode 14.0.0 codepoint properties.
 """
 
-general_categories =\
-{'Cc': ((0, 31), (127, 159)),
- 'Cf': ((173, 173),
-        (1536, 1541),
-        (1564, 1564),
-        (1757, 1757),
-        (1807, 1807),
-        (2274, 2274),
-        (6158, 6158),
-        (8203, 8207),
-        (8234, 8238),
-        (8288, 8292),
-        (8294, 8303),
-        (65279, 65279),
-        (65529, 65531),
-        (69821, 69821),
-        (113824, 113827),
-        (119155, 119162),
-        (917505, 917505),
-        (917536, 917631)),
- 'Cn': ((888, 889),
-        (896, 899),
-        (907, 907),
-        (909, 909),
-        (930, 930),
-        (1328, 1328),
-        (1367, 1368),
-        (1376, 1376),
-        (1416, 1416),
-        (1419, 1420),
-        (1424, 1424),
-        (1480, 1487),
-        (1515, 1519),
-        (1525, 1535),
-        (1565, 1565),
-        (1806, 1806),
-        (1867, 1868),
-        (1970, 1983),
-        (2043, 2047),
-        (2094, 2095),
-        (2111, 2111),
-        (2140, 2141),
-        (2143, 2143),
-        (2155, 2207),
-        (2229, 2229),
-        (2238, 2259),
-        (2436, 2436),
-        (2445, 2446),
-        (2449, 2450),
-        (2473, 2473),
-        (2481, 2481),
-        (2483, 2485),
-        (2490, 2491),
-        (2501, 2502),
-        (2505, 2506),
-        (2511, 2518),
-        (2520, 2523),
-        (2526, 2526),
-        (2532, 2533),
-        (2558, 2560),
-        (2564, 2564),
-        (2571, 2574),
-        (2577, 2578),
-        (2601, 2601),
-        (2609, 2609),
-        (2612, 2612),
-        (2615, 2615),
-        (2618, 2619),
-        (2621, 2621),
-        (2627, 2630),
-        (2633, 2634),
-        (2638, 2640),
-        (2642, 2648),
-        (2653, 2653),
-        (2655, 2661),
-        (2678, 2688),
-        (2692, 2692),
-        (2702, 2702),
-        (2706, 2706),
-        (2729, 2729),
-        (2737, 2737),
-        (2740, 2740),
-        (2746, 2747),
-        (2758, 2758),
-        (2762, 2762),
-        (2766, 2767),
-        (2769, 2783),
-        (2788, 2789),
-        (2802, 2808),
-        (2816, 2816),
-        (2820, 2820),
-        (2829, 2830),
-        (2833, 2834),
-        (2857, 2857),
-        (2865, 2865),
-        (2868, 2868),
-        (2874, 2875),
-        (2885, 2886),
-        (2889, 2890),
-        (2894, 2901),
-        (2904, 2907),
-        (2910, 2910),
-        (2916, 2917),
-        (2936, 2945),
-        (2948, 2948),
-        (2955, 2957),
-        (2961, 2961),
-        (2966, 2968),
-        (2971, 2971),
-        (2973, 2973),
-        (2976, 2978),
-        (2981, 2983),
-        (2987, 2989),
-        (3002, 3005),
-        (3011, 3013),
-        (3017, 3017),
-        (3022, 3023),
-        (3025, 3030),
-        (3032, 3045),
-        (3067, 3071),
-        (3076, 3076),
-        (3085, 3085),
-        (3089, 3089),
-        (3113, 3113),
-        (3130, 3132),
-        (3141, 3141),
-        (3145, 3145),
-        (3150, 3156),
-        (3159, 3159),
-        (3163, 3167),
-        (3172, 3173),
-        (3184, 3191),
-        (3204, 3204),
-        (3213, 3213),
-        (3217, 3217),
-        (3241, 3241),
-        (3252, 3252),
-        (3258, 3259),
-        (3269, 3269),
-        (3273, 3273),
-        (3278, 3284),
-        (3287, 3293),
-        (3295, 3295),
-        (3300, 3301),
-        (3312, 3312),
-        (3315, 3327),
-        (3332, 3332),
-        (3341, 3341),
-        (3345, 3345),
-        (3397, 3397),
-        (3401, 3401),
-        (3408, 3411),
-        (3428, 3429),
-        (3456, 3457),
-        (3460, 3460),
-        (3479, 3481),
-        (3506, 3506),
-        (3516, 3516),
-        (3518, 3519),
-        (3527, 3529),
-        (3531, 3534),
-        (3541, 3541),
-        (3543, 3543),
-        (3552, 3557),
-        (3568, 3569),
-        (3573, 3584),
-        (3643, 3646),
-        (3676, 3712),
-        (3715, 3715),
-        (3717, 3718),
-        (3721, 3721),
-        (3723, 3724),
-        (3726, 3731),
-        (3736, 3736),
-        (3744, 3744),
-        (3748, 3748),
-        (3750, 3750),
-        (3752, 3753),
-        (3756, 3756),
-        (3770, 3770),
-        (3774, 3775),
-        (3781, 3781),
-        (3783, 3783),
-        (3790, 3791),
-        (3802, 3803),
-        (3808, 3839),
-        (3912, 3912),
-        (3949, 3952),
-        (3992, 3992),
-        (4029, 4029),
-        (4045, 4045),
-        (4059, 4095),
-        (4294, 4294),
-        (4296, 4300),
-        (4302, 4303),
-        (4681, 4681),
-        (4686, 4687),
-        (4695, 4695),
-        (4697, 4697),
-        (4702, 4703),
-        (4745, 4745),
-        (4750, 4751),
-        (4785, 4785),
-        (4790, 4791),
-        (4799, 4799),
-        (4801, 4801),
-        (4806, 4807),
-        (4823, 4823),
-        (4881, 4881),
-        (4886, 4887),
-        (4955, 4956),
-        (4989, 4991),
-        (5018, 5023),
-        (5110, 5111),
-        (5118, 5119),
-        (5789, 5791),
-        (5881, 5887),
-        (5901, 5901),
-        (5909, 5919),
-        (5943, 5951),
-        (5972, 5983),
-        (5997, 5997),
-        (6001, 6001),
-        (6004, 6015),
-        (6110, 6111),
-        (6122, 6127),
-        (6138, 6143),
-        (6159, 6159),
-        (6170, 6175),
-        (6264, 6271),
-        (6315, 6319),
-        (6390, 6399),
-        (6431, 6431),
-        (6444, 6447),
-        (6460, 6463),
-        (6465, 6467),
-        (6510, 6511),
-        (6517, 6527),
-        (6572, 6575),
-        (6602, 6607),
-        (6619, 6621),
-        (6684, 6685),
-        (6751, 6751),
-        (6781, 6782),
-        (6794, 6799),
-        (6810, 6815),
-        (6830, 6831),
-        (6847, 6911),
-        (6988, 6991),
-        (7037, 7039),
-        (7156, 7163),
-        (7224, 7226),
-        (7242, 7244),
-        (7305, 7359),
-        (7368, 7375),
-        (7418, 7423),
-        (7674, 7674),
-        (7958, 7959),
-        (7966, 7967),
-        (8006, 8007),
-        (8014, 8015),
-        (8024, 8024),
-        (8026, 8026),
-        (8028, 8028),
-        (8030, 8030),
-        (8062, 8063),
-        (8117, 8117),
-        (8133, 8133),
-        (8148, 8149),
-        (8156, 8156),
-        (8176, 8177),
-        (8181, 8181),
-        (8191, 8191),
-        (8293, 8293),
-        (8306, 8307),
-        (8335, 8335),
-        (8349, 8351),
-        (8384, 8399),
-        (8433, 8447),
-        (8588, 8591),
-        (9255, 9279),
-        (9291, 9311),
-        (11124, 11125),
-        (11158, 11159),
-        (11194, 11196),
-        (11209, 11209),
-        (11219, 11243),
-        (11248, 11263),
-        (11311, 11311),
-        (11359, 11359),
-        (11508, 11512),
-        (11558, 11558),
-        (11560, 11564),
-        (11566, 11567),
-        (11624, 11630),
-        (11633, 11646),
-        (11671, 11679),
-        (11687, 11687),
-        (11695, 11695),
-        (11703, 11703),
-        (11711, 11711),
-        (11719, 11719),
-        (11727, 11727),
-        (11735, 11735),
-        (11743, 11743),
-        (11850, 11903),
-        (11930, 11930),
-        (12020, 12031),
-        (12246, 12271),
-        (12284, 12287),
-        (12352, 12352),
-        (12439, 12440),
-        (12544, 12548),
-        (12591, 12592),
-        (12687, 12687),
-        (12731, 12735),
-        (12772, 12783),
-        (12831, 12831),
-        (13055, 13055),
-        (19894, 19903),
-        (40939, 40959),
-        (42125, 42127),
-        (42183, 42191),
-        (42540, 42559),
-        (42744, 42751),
-        (42927, 42927),
-        (42936, 42998),
-        (43052, 43055),
-        (43066, 43071),
-        (43128, 43135),
-        (43206, 43213),
-        (43226, 43231),
-        (43262, 43263),
-        (43348, 43358),
-        (43389, 43391),
-        (43470, 43470),
-        (43482, 43485),
-        (43519, 43519),
-        (43575, 43583),
-        (43598, 43599),
-        (43610, 43611),
-        (43715, 43738),
-        (43767, 43776),
-        (43783, 43784),
-        (43791, 43792),
-        (43799, 43807),
-        (43815, 43815),
-        (43823, 43823),
-        (43878, 43887),
-        (44014, 44015),
-        (44026, 44031),
-        (55204, 55215),
-        (55239, 55242),
-        (55292, 55295),
-        (64110, 64111),
-        (64218, 64255),
-        (64263, 64274),
-        (64280, 64284),
-        (64311, 64311),
-        (64317, 64317),
-        (64319, 64319),
-        (64322, 64322),
-        (64325, 64325),
-        (64450, 64466),
-        (64832, 64847),
-        (64912, 64913),
-        (64968, 65007),
-        (65022, 65023),
-        (65050, 65055),
-        (65107, 65107),
-        (65127, 65127),
-        (65132, 65135),
-        (65141, 65141),
-        (65277, 65278),
-        (65280, 65280),
-        (65471, 65473),
-        (65480, 65481),
-        (65488, 65489),
-        (65496, 65497),
-        (65501, 65503),
-        (65511, 65511),
-        (65519, 65528),
-        (65534, 65535),
-        (65548, 65548),
-        (65575, 65575),
-        (65595, 65595),
-        (65598, 65598),
-        (65614, 65615),
-        (65630, 65663),
-        (65787, 65791),
-        (65795, 65798),
-        (65844, 65846),
-        (65935, 65935),
-        (65948, 65951),
-        (65953, 65999),
-        (66046, 66175),
-        (66205, 66207),
-        (66257, 66271),
-        (66300, 66303),
-        (66340, 66348),
-        (66379, 66383),
-        (66427, 66431),
-        (66462, 66462),
-        (66500, 66503),
-        (66518, 66559),
-        (66718, 66719),
-        (66730, 66735),
-        (66772, 66775),
-        (66812, 66815),
-        (66856, 66863),
-        (66916, 66926),
-        (66928, 67071),
-        (67383, 67391),
-        (67414, 67423),
-        (67432, 67583),
-        (67590, 67591),
-        (67593, 67593),
-        (67638, 67638),
-        (67641, 67643),
-        (67645, 67646),
-        (67670, 67670),
-        (67743, 67750),
-        (67760, 67807),
-        (67827, 67827),
-        (67830, 67834),
-        (67868, 67870),
-        (67898, 67902),
-        (67904, 67967),
-        (68024, 68027),
-        (68048, 68049),
-        (68100, 68100),
-        (68103, 68107),
-        (68116, 68116),
-        (68120, 68120),
-        (68148, 68151),
-        (68155, 68158),
-        (68168, 68175),
-        (68185, 68191),
-        (68256, 68287),
-        (68327, 68330),
-        (68343, 68351),
-        (68406, 68408),
-        (68438, 68439),
-        (68467, 68471),
-        (68498, 68504),
-        (68509, 68520),
-        (68528, 68607),
-        (68681, 68735),
-        (68787, 68799),
-        (68851, 68857),
-        (68864, 69215),
-        (69247, 69631),
-        (69710, 69713),
-        (69744, 69758),
-        (69826, 69839),
-        (69865, 69871),
-        (69882, 69887),
-        (69941, 69941),
-        (69956, 69967),
-        (70007, 70015),
-        (70094, 70095),
-        (70112, 70112),
-        (70133, 70143),
-        (70162, 70162),
-        (70207, 70271),
-        (70279, 70279),
-        (70281, 70281),
-        (70286, 70286),
-        (70302, 70302),
-        (70314, 70319),
-        (70379, 70383),
-        (70394, 70399),
-        (70404, 70404),
-        (70413, 70414),
-        (70417, 70418),
-        (70441, 70441),
-        (70449, 70449),
-        (70452, 70452),
-        (70458, 70459),
-        (70469, 70470),
-        (70473, 70474),
-        (70478, 70479),
-        (70481, 70486),
-        (70488, 70492),
-        (70500, 70501),
-        (70509, 70511),
-        (70517, 70655),
-        (70746, 70746),
-        (70748, 70748),
-        (70750, 70783),
-        (70856, 70863),
-        (70874, 71039),
-        (71094, 71095),
-        (71134, 71167),
-        (71237, 71247),
-        (71258, 71263),
-        (71277, 71295),
-        (71352, 71359),
-        (71370, 71423),
-        (71450, 71452),
-        (71468, 71471),
-        (71488, 71839),
-        (71923, 71934),
-        (71936, 72191),
-        (72264, 72271),
-        (72324, 72325),
-        (72349, 72349),
-        (72355, 72383),
-        (72441, 72703),
-        (72713, 72713),
-        (72759, 72759),
-        (72774, 72783),
-        (72813, 72815),
-        (72848, 72849),
-        (72872, 72872),
-        (72887, 72959),
-        (72967, 72967),
-        (72970, 72970),
-        (73015, 73017),
-        (73019, 73019),
-        (73022, 73022),
-        (73032, 73039),
-        (73050, 73727),
-        (74650, 74751),
-        (74863, 74863),
-        (74869, 74879),
-        (75076, 77823),
-        (78895, 82943),
-        (83527, 92159),
-        (92729, 92735),
-        (92767, 92767),
-        (92778, 92781),
-        (92784, 92879),
-        (92910, 92911),
-        (92918, 92927),
-        (92998, 93007),
-        (93018, 93018),
-        (93026, 93026),
-        (93048, 93052),
-        (93072, 93951),
-        (94021, 94031),
-        (94079, 94094),
-        (94112, 94175),
-        (94178, 94207),
-        (100333, 100351),
-        (101107, 110591),
-        (110879, 110959),
-        (111356, 113663),
-        (113771, 113775),
-        (113789, 113791),
-        (113801, 113807),
-        (113818, 113819),
-        (113828, 118783),
-        (119030, 119039),
-        (119079, 119080),
-        (119273, 119295),
-        (119366, 119551),
-        (119639, 119647),
-        (119666, 119807),
-        (119893, 119893),
-        (119965, 119965),
-        (119968, 119969),
-        (119971, 119972),
-        (119975, 119976),
-        (119981, 119981),
-        (119994, 119994),
-        (119996, 119996),
-        (120004, 120004),
-        (120070, 120070),
-        (120075, 120076),
-        (120085, 120085),
-        (120093, 120093),
-        (120122, 120122),
-        (120127, 120127),
-        (120133, 120133),
-        (120135, 120137),
-        (120145, 120145),
-        (120486, 120487),
-        (120780, 120781),
-        (121484, 121498),
-        (121504, 121504),
-        (121520, 122879),
-        (122887, 122887),
-        (122905, 122906),
-        (122914, 122914),
-        (122917, 122917),
-        (122923, 124927),
-        (125125, 125126),
-        (125143, 125183),
-        (125259, 125263),
-        (125274, 125277),
-        (125280, 126463),
-        (126468, 126468),
-        (126496, 126496),
-        (126499, 126499),
-        (126501, 126502),
-        (126504, 126504),
-        (126515, 126515),
-        (126520, 126520),
-        (126522, 126522),
-        (126524, 126529),
-        (126531, 126534),
-        (126536, 126536),
-        (126538, 126538),
-        (126540, 126540),
-        (126544, 126544),
-        (126547, 126547),
-        (126549, 126550),
-        (126552, 126552),
-        (126554, 126554),
-        (126556, 126556),
-        (126558, 126558),
-        (126560, 126560),
-        (126563, 126563),
-        (126565, 126566),
-        (126571, 126571),
-        (126579, 126579),
-        (126584, 126584),
-        (126589, 126589),
-        (126591, 126591),
-        (126602, 126602),
-        (126620, 126624),
-        (126628, 126628),
-        (126634, 126634),
-        (126652, 126703),
-        (126706, 126975),
-        (127020, 127023),
-        (127124, 127135),
-        (127151, 127152),
-        (127168, 127168),
-        (127184, 127184),
-        (127222, 127231),
-        (127245, 127247),
-        (127279, 127279),
-        (127340, 127343),
-        (127405, 127461),
-        (127491, 127503),
-        (127548, 127551),
-        (127561, 127567),
-        (127570, 127583),
-        (127590, 127743),
-        (128725, 128735),
-        (128749, 128751),
-        (128761, 128767),
-        (128884, 128895),
-        (128981, 129023),
-        (129036, 129039),
-        (129096, 129103),
-        (129114, 129119),
-        (129160, 129167),
-        (129198, 129279),
-        (129292, 129295),
-        (129343, 129343),
-        (129357, 129359),
-        (129388, 129407),
-        (129432, 129471),
-        (129473, 129487),
-        (129511, 131071),
-        (173783, 173823),
-        (177973, 177983),
-        (178206, 178207),
-        (183970, 183983),
-        (191457, 194559),
-        (195102, 917504),
-        (917506, 917535),
-        (917632, 917759),
-        (918000, 983039),
-        (1048574, 1048575),
-        (1114110, 1114111)),
- 'Co': ((57344, 63743), (983040, 1048573), (1048576, 1114109)),
- 'Cs': ((55296, 57343),),
- 'Ll': ((97, 122),
-        (181, 181),
-        (223, 246),
-        (248, 255),
-        (257, 257),
-        (259, 259),
-        (261, 261),
-        (263, 263),
-        (265, 265),
-        (267, 267),
-        (269, 269),
-        (271, 271),
-        (273, 273),
-        (275, 275),
-        (277, 277),
-        (279, 279),
-        (281, 281),
-        (283, 283),
-        (285, 285),
-        (287, 287),
-        (289, 289),
-        (291, 291),
-        (293, 293),
-        (295, 295),
-        (297, 297),
-        (299, 299),
-        (301, 301),
-        (303, 303),
-        (305, 305),
-        (307, 307),
-        (309, 309),
-        (311, 312),
-        (314, 314),
-        (316, 316),
-        (318, 318),
-        (320, 320),
-        (322, 322),
-        (324, 324),
-        (326, 326),
-        (328, 329),
-        (331, 331),
-        (333, 333),
-        (335, 335),
-        (337, 337),
-        (339, 339),
-        (341, 341),
-        (343, 343),
-        (345, 345),
-        (347, 347),
-        (349, 349),
-        (351, 351),
-        (353, 353),
-        (355, 355),
-        (357, 357),
-        (359, 359),
-        (361, 361),
-        (363, 363),
-        (365, 365),
-        (367, 367),
-        (369, 369),
-        (371, 371),
-        (373, 373),
-        (375, 375),
-        (378, 378),
-        (380, 380),
-        (382, 384),
-        (387, 387),
-        (389, 389),
-        (392, 392),
-        (396, 397),
-        (402, 402),
-        (405, 405),
-        (409, 411),
-        (414, 414),
-        (417, 417),
-        (419, 419),
-        (421, 421),
-        (424, 424),
-        (426, 427),
-        (429, 429),
-        (432, 432),
-        (436, 436),
-        (438, 438),
-        (441, 442),
-        (445, 447),
-        (454, 454),
-        (457, 457),
-        (460, 460),
-        (462, 462),
-        (464, 464),
-        (466, 466),
-        (468, 468),
-        (470, 470),
-        (472, 472),
-        (474, 474),
-        (476, 477),
-        (479, 479),
-        (481, 481),
-        (483, 483),
-        (485, 485),
-        (487, 487),
-        (489, 489),
-        (491, 491),
-        (493, 493),
-        (495, 496),
-        (499, 499),
-        (501, 501),
-        (505, 505),
-        (507, 507),
-        (509, 509),
-        (511, 511),
-        (513, 513),
-        (515, 515),
-        (517, 517),
-        (519, 519),
-        (521, 521),
-        (523, 523),
-        (525, 525),
-        (527, 527),
-        (529, 529),
-        (531, 531),
-        (533, 533),
-        (535, 535),
-        (537, 537),
-        (539, 539),
-        (541, 541),
-        (543, 543),
-        (545, 545),
-        (547, 547),
-        (549, 549),
-        (551, 551),
-        (553, 553),
-        (555, 555),
-        (557, 557),
-        (559, 559),
-        (561, 561),
-        (563, 569),
-        (572, 572),
-        (575, 576),
-        (578, 578),
-        (583, 583),
-        (585, 585),
-        (587, 587),
-        (589, 589),
-        (591, 659),
-        (661, 687),
-        (881, 881),
-        (883, 883),
-        (887, 887),
-        (891, 893),
-        (912, 912),
-        (940, 974),
-        (976, 977),
-        (981, 983),
-        (985, 985),
-        (987, 987),
-        (989, 989),
-        (991, 991),
-        (993, 993),
-        (995, 995),
-        (997, 997),
-        (999, 999),
-        (1001, 1001),
-        (1003, 1003),
-        (1005, 1005),
-        (1007, 1011),
-        (1013, 1013),
-        (1016, 1016),
-        (1019, 1020),
-        (1072, 1119),
-        (1121, 1121),
-        (1123, 1123),
-        (1125, 1125),
-        (1127, 1127),
-        (1129, 1129),
-        (1131, 1131),
-        (1133, 1133),
-        (1135, 1135),
-        (1137, 1137),
-        (1139, 1139),
-        (1141, 1141),
-        (1143, 1143),
-        (1145, 1145),
-        (1147, 1147),
-        (1149, 1149),
-        (1151, 1151),
-        (1153, 1153),
-        (1163, 1163),
-        (1165, 1165),
-        (1167, 1167),
-        (1169, 1169),
-        (1171, 1171),
-        (1173, 1173),
-        (1175, 1175),
-        (1177, 1177),
-        (1179, 1179),
-        (1181, 1181),
-        (1183, 1183),
-        (1185, 1185),
-        (1187, 1187),
-        (1189, 1189),
-        (1191, 1191),
-        (1193, 1193),
-        (1195, 1195),
-        (1197, 1197),
-        (1199, 1199),
-        (1201, 1201),
-        (1203, 1203),
-        (1205, 1205),
-        (1207, 1207),
-        (1209, 1209),
-        (1211, 1211),
-        (1213, 1213),
-        (1215, 1215),
-        (1218, 1218),
-        (1220, 1220),
-        (1222, 1222),
-        (1224, 1224),
-        (1226, 1226),
-        (1228, 1228),
-        (1230, 1231),
-        (1233, 1233),
-        (1235, 1235),
-        (1237, 1237),
-        (1239, 1239),
-        (1241, 1241),
-        (1243, 1243),
-        (1245, 1245),
-        (1247, 1247),
-        (1249, 1249),
-        (1251, 1251),
-        (1253, 1253),
-        (1255, 1255),
-        (1257, 1257),
-        (1259, 1259),
-        (1261, 1261),
-        (1263, 1263),
-        (1265, 1265),
-        (1267, 1267),
-        (1269, 1269),
-        (1271, 1271),
-        (1273, 1273),
-        (1275, 1275),
-        (1277, 1277),
-        (1279, 1279),
-        (1281, 1281),
-        (1283, 1283),
-        (1285, 1285),
-        (1287, 1287),
-        (1289, 1289),
-        (1291, 1291),
-        (1293, 1293),
-        (1295, 1295),
-        (1297, 1297),
-        (1299, 1299),
-        (1301, 1301),
-        (1303, 1303),
-        (1305, 1305),
-        (1307, 1307),
-        (1309, 1309),
-        (1311, 1311),
-        (1313, 1313),
-        (1315, 1315),
-        (1317, 1317),
-        (1319, 1319),
-        (1321, 1321),
-        (1323, 1323),
-        (1325, 1325),
-        (1327, 1327),
-        (1377, 1415),
-        (5112, 5117),
-        (7296, 7304),
-        (7424, 7467),
-        (7531, 7543),
-        (7545, 7578),
-        (7681, 7681),
-        (7683, 7683),
-        (7685, 7685),
-        (7687, 7687),
-        (7689, 7689),
-        (7691, 7691),
-        (7693, 7693),
-        (7695, 7695),
-        (7697, 7697),
-        (7699, 7699),
-        (7701, 7701),
-        (7703, 7703),
-        (7705, 7705),
-        (7707, 7707),
-        (7709, 7709),
-        (7711, 7711),
-        (7713, 7713),
-        (7715, 7715),
-        (7717, 7717),
-        (7719, 7719),
-        (7721, 7721),
-        (7723, 7723),
-        (7725, 7725),
-        (7727, 7727),
-        (7729, 7729),
-        (7731, 7731),
-        (7733, 7733),
-        (7735, 7735),
-        (7737, 7737),
-        (7739, 7739),
-        (7741, 7741),
-        (7743, 7743),
-        (7745, 7745),
-        (7747, 7747),
-        (7749, 7749),
-        (7751, 7751),
-        (7753, 7753),
-        (7755, 7755),
-        (7757, 7757),
-        (7759, 7759),
-        (7761, 7761),
-        (7763, 7763),
-        (7765, 7765),
-        (7767, 7767),
-        (7769, 7769),
-        (7771, 7771),
-        (7773, 7773),
-        (7775, 7775),
-        (7777, 7777),
-        (7779, 7779),
-        (7781, 7781),
-        (7783, 7783),
-        (7785, 7785),
-        (7787, 7787),
-        (7789, 7789),
-        (7791, 7791),
-        (7793, 7793),
-        (7795, 7795),
-        (7797, 7797),
-        (7799, 7799),
-        (7801, 7801),
-        (7803, 7803),
-        (7805, 7805),
-        (7807, 7807),
-        (7809, 7809),
-        (7811, 7811),
-        (7813, 7813),
-        (7815, 7815),
-        (7817, 7817),
-        (7819, 7819),
-        (7821, 7821),
-        (7823, 7823),
-        (7825, 7825),
-        (7827, 7827),
-        (7829, 7837),
-        (7839, 7839),
-        (7841, 7841),
-        (7843, 7843),
-        (7845, 7845),
-        (7847, 7847),
-        (7849, 7849),
-        (7851, 7851),
-        (7853, 7853),
-        (7855, 7855),
-        (7857, 7857),
-        (7859, 7859),
-        (7861, 7861),
-        (7863, 7863),
-        (7865, 7865),
-        (7867, 7867),
-        (7869, 7869),
-        (7871, 7871),
-        (7873, 7873),
-        (7875, 7875),
-        (7877, 7877),
-        (7879, 7879),
-        (7881, 7881),
-        (7883, 7883),
-        (7885, 7885),
-        (7887, 7887),
-        (7889, 7889),
-        (7891, 7891),
-        (7893, 7893),
-        (7895, 7895),
-        (7897, 7897),
-        (7899, 7899),
-        (7901, 7901),
-        (7903, 7903),
-        (7905, 7905),
-        (7907, 7907),
-        (7909, 7909),
-        (7911, 7911),
-        (7913, 7913),
-        (7915, 7915),
-        (7917, 7917),
-        (7919, 7919),
-        (7921, 7921),
-        (7923, 7923),
-        (7925, 7925),
-        (7927, 7927),
-        (7929, 7929),
-        (7931, 7931),
-        (7933, 7933),
-        (7935, 7943),
-        (7952, 7957),
-        (7968, 7975),
-        (7984, 7991),
-        (8000, 8005),
-        (8016, 8023),
-        (8032, 8039),
-        (8048, 8061),
-        (8064, 8071),
-        (8080, 8087),
-        (8096, 8103),
-        (8112, 8116),
-        (8118, 8119),
-        (8126, 8126),
-        (8130, 8132),
-        (8134, 8135),
-        (8144, 8147),
-        (8150, 8151),
-        (8160, 8167),
-        (8178, 8180),
-        (8182, 8183),
-        (8458, 8458),
-        (8462, 8463),
-        (8467, 8467),
-        (8495, 8495),
-        (8500, 8500),
-        (8505, 8505),
-        (8508, 8509),
-        (8518, 8521),
-        (8526, 8526),
-        (8580, 8580),
-        (11312, 11358),
-        (11361, 11361),
-        (11365, 11366),
-        (11368, 11368),
-        (11370, 11370),
-        (11372, 11372),
-        (11377, 11377),
-        (11379, 11380),
-        (11382, 11387),
-        (11393, 11393),
-        (11395, 11395),
-        (11397, 11397),
-        (11399, 11399),
-        (11401, 11401),
-        (11403, 11403),
-        (11405, 11405),
-        (11407, 11407),
-        (11409, 11409),
-        (11411, 11411),
-        (11413, 11413),
-        (11415, 11415),
-        (11417, 11417),
-        (11419, 11419),
-        (11421, 11421),
-        (11423, 11423),
-        (11425, 11425),
-        (11427, 11427),
-        (11429, 11429),
-        (11431, 11431),
-        (11433, 11433),
-        (11435, 11435),
-        (11437, 11437),
-        (11439, 11439),
-        (11441, 11441),
-        (11443, 11443),
-        (11445, 11445),
-        (11447, 11447),
-        (11449, 11449),
-        (11451, 11451),
-        (11453, 11453),
-        (11455, 11455),
-        (11457, 11457),
-        (11459, 11459),
-        (11461, 11461),
-        (11463, 11463),
-        (11465, 11465),
-        (11467, 11467),
-        (11469, 11469),
-        (11471, 11471),
-        (11473, 11473),
-        (11475, 11475),
-        (11477, 11477),
-        (11479, 11479),
-        (11481, 11481),
-        (11483, 11483),
-        (11485, 11485),
-        (11487, 11487),
-        (11489, 11489),
-        (11491, 11492),
-        (11500, 11500),
-        (11502, 11502),
-        (11507, 11507),
-        (11520, 11557),
-        (11559, 11559),
-        (11565, 11565),
-        (42561, 42561),
-        (42563, 42563),
-        (42565, 42565),
-        (42567, 42567),
-        (42569, 42569),
-        (42571, 42571),
-        (42573, 42573),
-        (42575, 42575),
-        (42577, 42577),
-        (42579, 42579),
-        (42581, 42581),
-        (42583, 42583),
-        (42585, 42585),
-        (42587, 42587),
-        (42589, 42589),
-        (42591, 42591),
-        (42593, 42593),
-        (42595, 42595),
-        (42597, 42597),
-        (42599, 42599),
-        (42601, 42601),
-        (42603, 42603),
-        (42605, 42605),
-        (42625, 42625),
-        (42627, 42627),
-        (42629, 42629),
-        (42631, 42631),
-        (42633, 42633),
-        (42635, 42635),
-        (42637, 42637),
-        (42639, 42639),
-        (42641, 42641),
-        (42643, 42643),
-        (42645, 42645),
-        (42647, 42647),
-        (42649, 42649),
-        (42651, 42651),
-        (42787, 42787),
-        (42789, 42789),
-        (42791, 42791),
-        (42793, 42793),
-        (42795, 42795),
-        (42797, 42797),
-        (42799, 42801),
-        (42803, 42803),
-        (42805, 42805),
-        (42807, 42807),
-        (42809, 42809),
-        (42811, 42811),
-        (42813, 42813),
-        (42815, 42815),
-        (42817, 42817),
-        (42819, 42819),
-        (42821, 42821),
-        (42823, 42823),
-        (42825, 42825),
-        (42827, 42827),
-        (42829, 42829),
-        (42831, 42831),
-        (42833, 42833),
-        (42835, 42835),
-        (42837, 42837),
-        (42839, 42839),
-        (42841, 42841),
-        (42843, 42843),
-        (42845, 42845),
-        (42847, 42847),
-        (42849, 42849),
-        (42851, 42851),
-        (42853, 42853),
-        (42855, 42855),
-        (42857, 42857),
-        (42859, 42859),
-        (42861, 42861),
-        (42863, 42863),
-        (42865, 42872),
-        (42874, 42874),
-        (42876, 42876),
-        (42879, 42879),
-        (42881, 42881),
-        (42883, 42883),
-        (42885, 42885),
-        (42887, 42887),
-        (42892, 42892),
-        (42894, 42894),
-        (42897, 42897),
-        (42899, 42901),
-        (42903, 42903),
-        (42905, 42905),
-        (42907, 42907),
-        (42909, 42909),
-        (42911, 42911),
-        (42913, 42913),
-        (42915, 42915),
-        (42917, 42917),
-        (42919, 42919),
-        (42921, 42921),
-        (42933, 42933),
-        (42935, 42935),
-        (43002, 43002),
-        (43824, 43866),
-        (43872, 43877),
-        (43888, 43967),
-        (64256, 64262),
-        (64275, 64279),
-        (65345, 65370),
-        (66600, 66639),
-        (66776, 66811),
-        (68800, 68850),
-        (71872, 71903),
-        (119834, 119859),
-        (119886, 119892),
-        (119894, 119911),
-        (119938, 119963),
-        (119990, 119993),
-        (119995, 119995),
-        (119997, 120003),
-        (120005, 120015),
-        (120042, 120067),
-        (120094, 120119),
-        (120146, 120171),
-        (120198, 120223),
-        (120250, 120275),
-        (120302, 120327),
-        (120354, 120379),
-        (120406, 120431),
-        (120458, 120485),
-        (120514, 120538),
-        (120540, 120545),
-        (120572, 120596),
-        (120598, 120603),
-        (120630, 120654),
-        (120656, 120661),
-        (120688, 120712),
-        (120714, 120719),
-        (120746, 120770),
-        (120772, 120777),
-        (120779, 120779),
-        (125218, 125251)),
- 'Lm': ((688, 705),
-        (710, 721),
-        (736, 740),
-        (748, 748),
-        (750, 750),
-        (884, 884),
-        (890, 890),
-        (1369, 1369),
-        (1600, 1600),
-        (1765, 1766),
-        (2036, 2037),
-        (2042, 2042),
-        (2074, 2074),
-        (2084, 2084),
-        (2088, 2088),
-        (2417, 2417),
-        (3654, 3654),
-        (3782, 3782),
-        (4348, 4348),
-        (6103, 6103),
-        (6211, 6211),
-        (6823, 6823),
-        (7288, 7293),
-        (7468, 7530),
-        (7544, 7544),
-        (7579, 7615),
-        (8305, 8305),
-        (8319, 8319),
-        (8336, 8348),
-        (11388, 11389),
-        (11631, 11631),
-        (11823, 11823),
-        (12293, 12293),
-        (12337, 12341),
-        (12347, 12347),
-        (12445, 12446),
-        (12540, 12542),
-        (40981, 40981),
-        (42232, 42237),
-        (42508, 42508),
-        (42623, 42623),
-        (42652, 42653),
-        (42775, 42783),
-        (42864, 42864),
-        (42888, 42888),
-        (43000, 43001),
-        (43471, 43471),
-        (43494, 43494),
-        (43632, 43632),
-        (43741, 43741),
-        (43763, 43764),
-        (43868, 43871),
-        (65392, 65392),
-        (65438, 65439),
-        (92992, 92995),
-        (94099, 94111),
-        (94176, 94177)),
- 'Lo': ((170, 170),
-        (186, 186),
-        (443, 443),
-        (448, 451),
-        (660, 660),
-        (1488, 1514),
-        (1520, 1522),
-        (1568, 1599),
-        (1601, 1610),
-        (1646, 1647),
-        (1649, 1747),
-        (1749, 1749),
-        (1774, 1775),
-        (1786, 1788),
-        (1791, 1791),
-        (1808, 1808),
-        (1810, 1839),
-        (1869, 1957),
-        (1969, 1969),
-        (1994, 2026),
-        (2048, 2069),
-        (2112, 2136),
-        (2144, 2154),
-        (2208, 2228),
-        (2230, 2237),
-        (2308, 2361),
-        (2365, 2365),
-        (2384, 2384),
-        (2392, 2401),
-        (2418, 2432),
-        (2437, 2444),
-        (2447, 2448),
-        (2451, 2472),
-        (2474, 2480),
-        (2482, 2482),
-        (2486, 2489),
-        (2493, 2493),
-        (2510, 2510),
-        (2524, 2525),
-        (2527, 2529),
-        (2544, 2545),
-        (2556, 2556),
-        (2565, 2570),
-        (2575, 2576),
-        (2579, 2600),
-        (2602, 2608),
-        (2610, 2611),
-        (2613, 2614),
-        (2616, 2617),
-        (2649, 2652),
-        (2654, 2654),
-        (2674, 2676),
-        (2693, 2701),
-        (2703, 2705),
-        (2707, 2728),
-        (2730, 2736),
-        (2738, 2739),
-        (2741, 2745),
-        (2749, 2749),
-        (2768, 2768),
-        (2784, 2785),
-        (2809, 2809),
-        (2821, 2828),
-        (2831, 2832),
-        (2835, 2856),
-        (2858, 2864),
-        (2866, 2867),
-        (2869, 2873),
-        (2877, 2877),
-        (2908, 2909),
-        (2911, 2913),
-        (2929, 2929),
-        (2947, 2947),
-        (2949, 2954),
-        (2958, 2960),
-        (2962, 2965),
-        (2969, 2970),
-        (2972, 2972),
-        (2974, 2975),
-        (2979, 2980),
-        (2984, 2986),
-        (2990, 3001),
-        (3024, 3024),
-        (3077, 3084),
-        (3086, 3088),
-        (3090, 3112),
-        (3114, 3129),
-        (3133, 3133),
-        (3160, 3162),
-        (3168, 3169),
-        (3200, 3200),
-        (3205, 3212),
-        (3214, 3216),
-        (3218, 3240),
-        (3242, 3251),
-        (3253, 3257),
-        (3261, 3261),
-        (3294, 3294),
-        (3296, 3297),
-        (3313, 3314),
-        (3333, 3340),
-        (3342, 3344),
-        (3346, 3386),
-        (3389, 3389),
-        (3406, 3406),
-        (3412, 3414),
-        (3423, 3425),
-        (3450, 3455),
-        (3461, 3478),
-        (3482, 3505),
-        (3507, 3515),
-        (3517, 3517),
-        (3520, 3526),
-        (3585, 3632),
-        (3634, 3635),
-        (3648, 3653),
-        (3713, 3714),
-        (3716, 3716),
-        (3719, 3720),
-        (3722, 3722),
-        (3725, 3725),
-        (3732, 3735),
-        (3737, 3743),
-        (3745, 3747),
-        (3749, 3749),
-        (3751, 3751),
-        (3754, 3755),
-        (3757, 3760),
-        (3762, 3763),
-        (3773, 3773),
-        (3776, 3780),
-        (3804, 3807),
-        (3840, 3840),
-        (3904, 3911),
-        (3913, 3948),
-        (3976, 3980),
-        (4096, 4138),
-        (4159, 4159),
-        (4176, 4181),
-        (4186, 4189),
-        (4193, 4193),
-        (4197, 4198),
-        (4206, 4208),
-        (4213, 4225),
-        (4238, 4238),
-        (4304, 4346),
-        (4349, 4680),
-        (4682, 4685),
-        (4688, 4694),
-        (4696, 4696),
-        (4698, 4701),
-        (4704, 4744),
-        (4746, 4749),
-        (4752, 4784),
-        (4786, 4789),
-        (4792, 4798),
-        (4800, 4800),
-        (4802, 4805),
-        (4808, 4822),
-        (4824, 4880),
-        (4882, 4885),
-        (4888, 4954),
-        (4992, 5007),
-        (5121, 5740),
-        (5743, 5759),
-        (5761, 5786),
-        (5792, 5866),
-        (5873, 5880),
-        (5888, 5900),
-        (5902, 5905),
-        (5920, 5937),
-        (5952, 5969),
-        (5984, 5996),
-        (5998, 6000),
-        (6016, 6067),
-        (6108, 6108),
-        (6176, 6210),
-        (6212, 6263),
-        (6272, 6276),
-        (6279, 6312),
-        (6314, 6314),
-        (6320, 6389),
-        (6400, 6430),
-        (6480, 6509),
-        (6512, 6516),
-        (6528, 6571),
-        (6576, 6601),
-        (6656, 6678),
-        (6688, 6740),
-        (6917, 6963),
-        (6981, 6987),
-        (7043, 7072),
-        (7086, 7087),
-        (7098, 7141),
-        (7168, 7203),
-        (7245, 7247),
-        (7258, 7287),
-        (7401, 7404),
-        (7406, 7409),
-        (7413, 7414),
-        (8501, 8504),
-        (11568, 11623),
-        (11648, 11670),
-        (11680, 11686),
-        (11688, 11694),
-        (11696, 11702),
-        (11704, 11710),
-        (11712, 11718),
-        (11720, 11726),
-        (11728, 11734),
-        (11736, 11742),
-        (12294, 12294),
-        (12348, 12348),
-        (12353, 12438),
-        (12447, 12447),
-        (12449, 12538),
-        (12543, 12543),
-        (12549, 12590),
-        (12593, 12686),
-        (12704, 12730),
-        (12784, 12799),
-        (13312, 19893),
-        (19968, 40938),
-        (40960, 40980),
-        (40982, 42124),
-        (42192, 42231),
-        (42240, 42507),
-        (42512, 42527),
-        (42538, 42539),
-        (42606, 42606),
-        (42656, 42725),
-        (42895, 42895),
-        (42999, 42999),
-        (43003, 43009),
-        (43011, 43013),
-        (43015, 43018),
-        (43020, 43042),
-        (43072, 43123),
-        (43138, 43187),
-        (43250, 43255),
-        (43259, 43259),
-        (43261, 43261),
-        (43274, 43301),
-        (43312, 43334),
-        (43360, 43388),
-        (43396, 43442),
-        (43488, 43492),
-        (43495, 43503),
-        (43514, 43518),
-        (43520, 43560),
-        (43584, 43586),
-        (43588, 43595),
-        (43616, 43631),
-        (43633, 43638),
-        (43642, 43642),
-        (43646, 43695),
-        (43697, 43697),
-        (43701, 43702),
-        (43705, 43709),
-        (43712, 43712),
-        (43714, 43714),
-        (43739, 43740),
-        (43744, 43754),
-        (43762, 43762),
-        (43777, 43782),
-        (43785, 43790),
-        (43793, 43798),
-        (43808, 43814),
-        (43816, 43822),
-        (43968, 44002),
-        (44032, 55203),
-        (55216, 55238),
-        (55243, 55291),
-        (63744, 64109),
-        (64112, 64217),
-        (64285, 64285),
-        (64287, 64296),
-        (64298, 64310),
-        (64312, 64316),
-        (64318, 64318),
-        (64320, 64321),
-        (64323, 64324),
-        (64326, 64433),
-        (64467, 64829),
-        (64848, 64911),
-        (64914, 64967),
-        (65008, 65019),
-        (65136, 65140),
-        (65142, 65276),
-        (65382, 65391),
-        (65393, 65437),
-        (65440, 65470),
-        (65474, 65479),
-        (65482, 65487),
-        (65490, 65495),
-        (65498, 65500),
-        (65536, 65547),
-        (65549, 65574),
-        (65576, 65594),
-        (65596, 65597),
-        (65599, 65613),
-        (65616, 65629),
-        (65664, 65786),
-        (66176, 66204),
-        (66208, 66256),
-        (66304, 66335),
-        (66349, 66368),
-        (66370, 66377),
-        (66384, 66421),
-        (66432, 66461),
-        (66464, 66499),
-        (66504, 66511),
-        (66640, 66717),
-        (66816, 66855),
-        (66864, 66915),
-        (67072, 67382),
-        (67392, 67413),
-        (67424, 67431),
-        (67584, 67589),
-        (67592, 67592),
-        (67594, 67637),
-        (67639, 67640),
-        (67644, 67644),
-        (67647, 67669),
-        (67680, 67702),
-        (67712, 67742),
-        (67808, 67826),
-        (67828, 67829),
-        (67840, 67861),
-        (67872, 67897),
-        (67968, 68023),
-        (68030, 68031),
-        (68096, 68096),
-        (68112, 68115),
-        (68117, 68119),
-        (68121, 68147),
-        (68192, 68220),
-        (68224, 68252),
-        (68288, 68295),
-        (68297, 68324),
-        (68352, 68405),
-        (68416, 68437),
-        (68448, 68466),
-        (68480, 68497),
-        (68608, 68680),
-        (69635, 69687),
-        (69763, 69807),
-        (69840, 69864),
-        (69891, 69926),
-        (69968, 70002),
-        (70006, 70006),
-        (70019, 70066),
-        (70081, 70084),
-        (70106, 70106),
-        (70108, 70108),
-        (70144, 70161),
-        (70163, 70187),
-        (70272, 70278),
-        (70280, 70280),
-        (70282, 70285),
-        (70287, 70301),
-        (70303, 70312),
-        (70320, 70366),
-        (70405, 70412),
-        (70415, 70416),
-        (70419, 70440),
-        (70442, 70448),
-        (70450, 70451),
-        (70453, 70457),
-        (70461, 70461),
-        (70480, 70480),
-        (70493, 70497),
-        (70656, 70708),
-        (70727, 70730),
-        (70784, 70831),
-        (70852, 70853),
-        (70855, 70855),
-        (71040, 71086),
-        (71128, 71131),
-        (71168, 71215),
-        (71236, 71236),
-        (71296, 71338),
-        (71424, 71449),
-        (71935, 71935),
-        (72192, 72192),
-        (72203, 72242),
-        (72250, 72250),
-        (72272, 72272),
-        (72284, 72323),
-        (72326, 72329),
-        (72384, 72440),
-        (72704, 72712),
-        (72714, 72750),
-        (72768, 72768),
-        (72818, 72847),
-        (72960, 72966),
-        (72968, 72969),
-        (72971, 73008),
-        (73030, 73030),
-        (73728, 74649),
-        (74880, 75075),
-        (77824, 78894),
-        (82944, 83526),
-        (92160, 92728),
-        (92736, 92766),
-        (92880, 92909),
-        (92928, 92975),
-        (93027, 93047),
-        (93053, 93071),
-        (93952, 94020),
-        (94032, 94032),
-        (94208, 100332),
-        (100352, 101106),
-        (110592, 110878),
-        (110960, 111355),
-        (113664, 113770),
-        (113776, 113788),
-        (113792, 113800),
-        (113808, 113817),
-        (124928, 125124),
-        (126464, 126467),
-        (126469, 126495),
-        (126497, 126498),
-        (126500, 126500),
-        (126503, 126503),
-        (126505, 126514),
-        (126516, 126519),
-        (126521, 126521),
-        (126523, 126523),
-        (126530, 126530),
-        (126535, 126535),
-        (126537, 126537),
-        (126539, 126539),
-        (126541, 126543),
-        (126545, 126546),
-        (126548, 126548),
-        (126551, 126551),
-        (126553, 126553),
-        (126555, 126555),
-        (126557, 126557),
-        (126559, 126559),
-        (126561, 126562),
-        (126564, 126564),
-        (126567, 126570),
-        (126572, 126578),
-        (126580, 126583),
-        (126585, 126588),
-        (126590, 126590),
-        (126592, 126601),
-        (126603, 126619),
-        (126625, 126627),
-        (126629, 126633),
-        (126635, 126651),
-        (131072, 173782),
-        (173824, 177972),
-        (177984, 178205),
-        (178208, 183969),
-        (183984, 191456),
-        (194560, 195101)),
- 'Lt': ((453, 453),
-        (456, 456),
-        (459, 459),
-        (498, 498),
-        (8072, 8079),
-        (8088, 8095),
-        (8104, 8111),
-        (8124, 8124),
-        (8140, 8140),
-        (8188, 8188)),
- 'Lu': ((65, 90),
-        (192, 214),
-        (216, 222),
-        (256, 256),
-        (258, 258),
-        (260, 260),
-        (262, 262),
-        (264, 264),
-        (266, 266),
-        (268, 268),
-        (270, 270),
-        (272, 272),
-        (274, 274),
-        (276, 276),
-        (278, 278),
-        (280, 280),
-        (282, 282),
-        (284, 284),
-        (286, 286),
-        (288, 288),
-        (290, 290),
-        (292, 292),
-        (294, 294),
-        (296, 296),
-        (298, 298),
-        (300, 300),
-        (302, 302),
-        (304, 304),
-        (306, 306),
-        (308, 308),
-        (310, 310),
-        (313, 313),
-        (315, 315),
-        (317, 317),
-        (319, 319),
-        (321, 321),
-        (323, 323),
-        (325, 325),
-        (327, 327),
-        (330, 330),
-        (332, 332),
-        (334, 334),
-        (336, 336),
-        (338, 338),
-        (340, 340),
-        (342, 342),
-        (344, 344),
-        (346, 346),
-        (348, 348),
-        (350, 350),
-        (352, 352),
-        (354, 354),
-        (356, 356),
-        (358, 358),
-        (360, 360),
-        (362, 362),
-        (364, 364),
-        (366, 366),
-        (368, 368),
-        (370, 370),
-        (372, 372),
-        (374, 374),
-        (376, 377),
-        (379, 379),
-        (381, 381),
-        (385, 386),
-        (388, 388),
-        (390, 391),
-        (393, 395),
-        (398, 401),
-        (403, 404),
-        (406, 408),
-        (412, 413),
-        (415, 416),
-        (418, 418),
-        (420, 420),
-        (422, 423),
-        (425, 425),
-        (428, 428),
-        (430, 431),
-        (433, 435),
-        (437, 437),
-        (439, 440),
-        (444, 444),
-        (452, 452),
-        (455, 455),
-        (458, 458),
-        (461, 461),
-        (463, 463),
-        (465, 465),
-        (467, 467),
-        (469, 469),
-        (471, 471),
-        (473, 473),
-        (475, 475),
-        (478, 478),
-        (480, 480),
-        (482, 482),
-        (484, 484),
-        (486, 486),
-        (488, 488),
-        (490, 490),
-        (492, 492),
-        (494, 494),
-        (497, 497),
-        (500, 500),
-        (502, 504),
-        (506, 506),
-        (508, 508),
-        (510, 510),
-        (512, 512),
-        (514, 514),
-        (516, 516),
-        (518, 518),
-        (520, 520),
-        (522, 522),
-        (524, 524),
-        (526, 526),
-        (528, 528),
-        (530, 530),
-        (532, 532),
-        (534, 534),
-        (536, 536),
-        (538, 538),
-        (540, 540),
-        (542, 542),
-        (544, 544),
-        (546, 546),
-        (548, 548),
-        (550, 550),
-        (552, 552),
-        (554, 554),
-        (556, 556),
-        (558, 558),
-        (560, 560),
-        (562, 562),
-        (570, 571),
-        (573, 574),
-        (577, 577),
-        (579, 582),
-        (584, 584),
-        (586, 586),
-        (588, 588),
-        (590, 590),
-        (880, 880),
-        (882, 882),
-        (886, 886),
-        (895, 895),
-        (902, 902),
-        (904, 906),
-        (908, 908),
-        (910, 911),
-        (913, 929),
-        (931, 939),
-        (975, 975),
-        (978, 980),
-        (984, 984),
-        (986, 986),
-        (988, 988),
-        (990, 990),
-        (992, 992),
-        (994, 994),
-        (996, 996),
-        (998, 998),
-        (1000, 1000),
-        (1002, 1002),
-        (1004, 1004),
-        (1006, 1006),
-        (1012, 1012),
-        (1015, 1015),
-        (1017, 1018),
-        (1021, 1071),
-        (1120, 1120),
-        (1122, 1122),
-        (1124, 1124),
-        (1126, 1126),
-        (1128, 1128),
-        (1130, 1130),
-        (1132, 1132),
-        (1134, 1134),
-        (1136, 1136),
-        (1138, 1138),
-        (1140, 1140),
-        (1142, 1142),
-        (1144, 1144),
-        (1146, 1146),
-        (1148, 1148),
-        (1150, 1150),
-        (1152, 1152),
-        (1162, 1162),
-        (1164, 1164),
-        (1166, 1166),
-        (1168, 1168),
-        (1170, 1170),
-        (1172, 1172),
-        (1174, 1174),
-        (1176, 1176),
-        (1178, 1178),
-        (1180, 1180),
-        (1182, 1182),
-        (1184, 1184),
-        (1186, 1186),
-        (1188, 1188),
-        (1190, 1190),
-        (1192, 1192),
-        (1194, 1194),
-        (1196, 1196),
-        (1198, 1198),
-        (1200, 1200),
-        (1202, 1202),
-        (1204, 1204),
-        (1206, 1206),
-        (1208, 1208),
-        (1210, 1210),
-        (1212, 1212),
-        (1214, 1214),
-        (1216, 1217),
-        (1219, 1219),
-        (1221, 1221),
-        (1223, 1223),
-        (1225, 1225),
-        (1227, 1227),
-        (1229, 1229),
-        (1232, 1232),
-        (1234, 1234),
-        (1236, 1236),
-        (1238, 1238),
-        (1240, 1240),
-        (1242, 1242),
-        (1244, 1244),
-        (1246, 1246),
-        (1248, 1248),
-        (1250, 1250),
-        (1252, 1252),
-        (1254, 1254),
-        (1256, 1256),
-        (1258, 1258),
-        (1260, 1260),
-        (1262, 1262),
-        (1264, 1264),
-        (1266, 1266),
-        (1268, 1268),
-        (1270, 1270),
-        (1272, 1272),
-        (1274, 1274),
-        (1276, 1276),
-        (1278, 1278),
-        (1280, 1280),
-        (1282, 1282),
-        (1284, 1284),
-        (1286, 1286),
-        (1288, 1288),
-        (1290, 1290),
-        (1292, 1292),
-        (1294, 1294),
-        (1296, 1296),
-        (1298, 1298),
-        (1300, 1300),
-        (1302, 1302),
-        (1304, 1304),
-        (1306, 1306),
-        (1308, 1308),
-        (1310, 1310),
-        (1312, 1312),
-        (1314, 1314),
-        (1316, 1316),
-        (1318, 1318),
-        (1320, 1320),
-        (1322, 1322),
-        (1324, 1324),
-        (1326, 1326),
-        (1329, 1366),
-        (4256, 4293),
-        (4295, 4295),
-        (4301, 4301),
-        (5024, 5109),
-        (7680, 7680),
-        (7682, 7682),
-        (7684, 7684),
-        (7686, 7686),
-        (7688, 7688),
-        (7690, 7690),
-        (7692, 7692),
-        (7694, 7694),
-        (7696, 7696),
-        (7698, 7698),
-        (7700, 7700),
-        (7702, 7702),
-        (7704, 7704),
-        (7706, 7706),
-        (7708, 7708),
-        (7710, 7710),
-        (7712, 7712),
-        (7714, 7714),
-        (7716, 7716),
-        (7718, 7718),
-        (7720, 7720),
-        (7722, 7722),
-        (7724, 7724),
-        (7726, 7726),
-        (7728, 7728),
-        (7730, 7730),
-        (7732, 7732),
-        (7734, 7734),
-        (7736, 7736),
-        (7738, 7738),
-        (7740, 7740),
-        (7742, 7742),
-        (7744, 7744),
-        (7746, 7746),
-        (7748, 7748),
-        (7750, 7750),
-        (7752, 7752),
-        (7754, 7754),
-        (7756, 7756),
-        (7758, 7758),
-        (7760, 7760),
-        (7762, 7762),
-        (7764, 7764),
-        (7766, 7766),
-        (7768, 7768),
-        (7770, 7770),
-        (7772, 7772),
-        (7774, 7774),
-        (7776, 7776),
-        (7778, 7778),
-        (7780, 7780),
-        (7782, 7782),
-        (7784, 7784),
-        (7786, 7786),
-        (7788, 7788),
-        (7790, 7790),
-        (7792, 7792),
-        (7794, 7794),
-        (7796, 7796),
-        (7798, 7798),
-        (7800, 7800),
-        (7802, 7802),
-        (7804, 7804),
-        (7806, 7806),
-        (7808, 7808),
-        (7810, 7810),
-        (7812, 7812),
-        (7814, 7814),
-        (7816, 7816),
-        (7818, 7818),
-        (7820, 7820),
-        (7822, 7822),
-        (7824, 7824),
-        (7826, 7826),
-        (7828, 7828),
-        (7838, 7838),
-        (7840, 7840),
-        (7842, 7842),
-        (7844, 7844),
-        (7846, 7846),
-        (7848, 7848),
-        (7850, 7850),
-        (7852, 7852),
-        (7854, 7854),
-        (7856, 7856),
-        (7858, 7858),
-        (7860, 7860),
-        (7862, 7862),
-        (7864, 7864),
-        (7866, 7866),
-        (7868, 7868),
-        (7870, 7870),
-        (7872, 7872),
-        (7874, 7874),
-        (7876, 7876),
-        (7878, 7878),
-        (7880, 7880),
-        (7882, 7882),
-        (7884, 7884),
-        (7886, 7886),
-        (7888, 7888),
-        (7890, 7890),
-        (7892, 7892),
-        (7894, 7894),
-        (7896, 7896),
-        (7898, 7898),
-        (7900, 7900),
-        (7902, 7902),
-        (7904, 7904),
-        (7906, 7906),
-        (7908, 7908),
-        (7910, 7910),
-        (7912, 7912),
-        (7914, 7914),
-        (7916, 7916),
-        (7918, 7918),
-        (7920, 7920),
-        (7922, 7922),
-        (7924, 7924),
-        (7926, 7926),
-        (7928, 7928),
-        (7930, 7930),
-        (7932, 7932),
-        (7934, 7934),
-        (7944, 7951),
-        (7960, 7965),
-        (7976, 7983),
-        (7992, 7999),
-        (8008, 8013),
-        (8025, 8025),
-        (8027, 8027),
-        (8029, 8029),
-        (8031, 8031),
-        (8040, 8047),
-        (8120, 8123),
-        (8136, 8139),
-        (8152, 8155),
-        (8168, 8172),
-        (8184, 8187),
-        (8450, 8450),
-        (8455, 8455),
-        (8459, 8461),
-        (8464, 8466),
-        (8469, 8469),
-        (8473, 8477),
-        (8484, 8484),
-        (8486, 8486),
-        (8488, 8488),
-        (8490, 8493),
-        (8496, 8499),
-        (8510, 8511),
-        (8517, 8517),
-        (8579, 8579),
-        (11264, 11310),
-        (11360, 11360),
-        (11362, 11364),
-        (11367, 11367),
-        (11369, 11369),
-        (11371, 11371),
-        (11373, 11376),
-        (11378, 11378),
-        (11381, 11381),
-        (11390, 11392),
-        (11394, 11394),
-        (11396, 11396),
-        (11398, 11398),
-        (11400, 11400),
-        (11402, 11402),
-        (11404, 11404),
-        (11406, 11406),
-        (11408, 11408),
-        (11410, 11410),
-        (11412, 11412),
-        (11414, 11414),
-        (11416, 11416),
-        (11418, 11418),
-        (11420, 11420),
-        (11422, 11422),
-        (11424, 11424),
-        (11426, 11426),
-        (11428, 11428),
-        (11430, 11430),
-        (11432, 11432),
-        (11434, 11434),
-        (11436, 11436),
-        (11438, 11438),
-        (11440, 11440),
-        (11442, 11442),
-        (11444, 11444),
-        (11446, 11446),
-        (11448, 11448),
-        (11450, 11450),
-        (11452, 11452),
-        (11454, 11454),
-        (11456, 11456),
-        (11458, 11458),
-        (11460, 11460),
-        (11462, 11462),
-        (11464, 11464),
-        (11466, 11466),
-        (11468, 11468),
-        (11470, 11470),
-        (11472, 11472),
-        (11474, 11474),
-        (11476, 11476),
-        (11478, 11478),
-        (11480, 11480),
-        (11482, 11482),
-        (11484, 11484),
-        (11486, 11486),
-        (11488, 11488),
-        (11490, 11490),
-        (11499, 11499),
-        (11501, 11501),
-        (11506, 11506),
-        (42560, 42560),
-        (42562, 42562),
-        (42564, 42564),
-        (42566, 42566),
-        (42568, 42568),
-        (42570, 42570),
-        (42572, 42572),
-        (42574, 42574),
-        (42576, 42576),
-        (42578, 42578),
-        (42580, 42580),
-        (42582, 42582),
-        (42584, 42584),
-        (42586, 42586),
-        (42588, 42588),
-        (42590, 42590),
-        (42592, 42592),
-        (42594, 42594),
-        (42596, 42596),
-        (42598, 42598),
-        (42600, 42600),
-        (42602, 42602),
-        (42604, 42604),
-        (42624, 42624),
-        (42626, 42626),
-        (42628, 42628),
-        (42630, 42630),
-        (42632, 42632),
-        (42634, 42634),
-        (42636, 42636),
-        (42638, 42638),
-        (42640, 42640),
-        (42642, 42642),
-        (42644, 42644),
-        (42646, 42646),
-        (42648, 42648),
-        (42650, 42650),
-        (42786, 42786),
-        (42788, 42788),
-        (42790, 42790),
-        (42792, 42792),
-        (42794, 42794),
-        (42796, 42796),
-        (42798, 42798),
-        (42802, 42802),
-        (42804, 42804),
-        (42806, 42806),
-        (42808, 42808),
-        (42810, 42810),
-        (42812, 42812),
-        (42814, 42814),
-        (42816, 42816),
-        (42818, 42818),
-        (42820, 42820),
-        (42822, 42822),
-        (42824, 42824),
-        (42826, 42826),
-        (42828, 42828),
-        (42830, 42830),
-        (42832, 42832),
-        (42834, 42834),
-        (42836, 42836),
-        (42838, 42838),
-        (42840, 42840),
-        (42842, 42842),
-        (42844, 42844),
-        (42846, 42846),
-        (42848, 42848),
-        (42850, 42850),
-        (42852, 42852),
-        (42854, 42854),
-        (42856, 42856),
-        (42858, 42858),
-        (42860, 42860),
-        (42862, 42862),
-        (42873, 42873),
-        (42875, 42875),
-        (42877, 42878),
-        (42880, 42880),
-        (42882, 42882),
-        (42884, 42884),
-        (42886, 42886),
-        (42891, 42891),
-        (42893, 42893),
-        (42896, 42896),
-        (42898, 42898),
-        (42902, 42902),
-        (42904, 42904),
-        (42906, 42906),
-        (42908, 42908),
-        (42910, 42910),
-        (42912, 42912),
-        (42914, 42914),
-        (42916, 42916),
-        (42918, 42918),
-        (42920, 42920),
-        (42922, 42926),
-        (42928, 42932),
-        (42934, 42934),
-        (65313, 65338),
-        (66560, 66599),
-        (66736, 66771),
-        (68736, 68786),
-        (71840, 71871),
-        (119808, 119833),
-        (119860, 119885),
-        (119912, 119937),
-        (119964, 119964),
-        (119966, 119967),
-        (119970, 119970),
-        (119973, 119974),
-        (119977, 119980),
-        (119982, 119989),
-        (120016, 120041),
-        (120068, 120069),
-        (120071, 120074),
-        (120077, 120084),
-        (120086, 120092),
-        (120120, 120121),
-        (120123, 120126),
-        (120128, 120132),
-        (120134, 120134),
-        (120138, 120144),
-        (120172, 120197),
-        (120224, 120249),
-        (120276, 120301),
-        (120328, 120353),
-        (120380, 120405),
-        (120432, 120457),
-        (120488, 120512),
-        (120546, 120570),
-        (120604, 120628),
-        (120662, 120686),
-        (120720, 120744),
-        (120778, 120778),
-        (125184, 125217)),
- 'Mc': ((2307, 2307),
-        (2363, 2363),
-        (2366, 2368),
-        (2377, 2380),
-        (2382, 2383),
-        (2434, 2435),
-        (2494, 2496),
-        (2503, 2504),
-        (2507, 2508),
-        (2519, 2519),
-        (2563, 2563),
-        (2622, 2624),
-        (2691, 2691),
-        (2750, 2752),
-        (2761, 2761),
-        (2763, 2764),
-        (2818, 2819),
-        (2878, 2878),
-        (2880, 2880),
-        (2887, 2888),
-        (2891, 2892),
-        (2903, 2903),
-        (3006, 3007),
-        (3009, 3010),
-        (3014, 3016),
-        (3018, 3020),
-        (3031, 3031),
-        (3073, 3075),
-        (3137, 3140),
-        (3202, 3203),
-        (3262, 3262),
-        (3264, 3268),
-        (3271, 3272),
-        (3274, 3275),
-        (3285, 3286),
-        (3330, 3331),
-        (3390, 3392),
-        (3398, 3400),
-        (3402, 3404),
-        (3415, 3415),
-        (3458, 3459),
-        (3535, 3537),
-        (3544, 3551),
-        (3570, 3571),
-        (3902, 3903),
-        (3967, 3967),
-        (4139, 4140),
-        (4145, 4145),
-        (4152, 4152),
-        (4155, 4156),
-        (4182, 4183),
-        (4194, 4196),
-        (4199, 4205),
-        (4227, 4228),
-        (4231, 4236),
-        (4239, 4239),
-        (4250, 4252),
-        (6070, 6070),
-        (6078, 6085),
-        (6087, 6088),
-        (6435, 6438),
-        (6441, 6443),
-        (6448, 6449),
-        (6451, 6456),
-        (6681, 6682),
-        (6741, 6741),
-        (6743, 6743),
-        (6753, 6753),
-        (6755, 6756),
-        (6765, 6770),
-        (6916, 6916),
-        (6965, 6965),
-        (6971, 6971),
-        (6973, 6977),
-        (6979, 6980),
-        (7042, 7042),
-        (7073, 7073),
-        (7078, 7079),
-        (7082, 7082),
-        (7143, 7143),
-        (7146, 7148),
-        (7150, 7150),
-        (7154, 7155),
-        (7204, 7211),
-        (7220, 7221),
-        (7393, 7393),
-        (7410, 7411),
-        (7415, 7415),
-        (12334, 12335),
-        (43043, 43044),
-        (43047, 43047),
-        (43136, 43137),
-        (43188, 43203),
-        (43346, 43347),
-        (43395, 43395),
-        (43444, 43445),
-        (43450, 43451),
-        (43453, 43456),
-        (43567, 43568),
-        (43571, 43572),
-        (43597, 43597),
-        (43643, 43643),
-        (43645, 43645),
-        (43755, 43755),
-        (43758, 43759),
-        (43765, 43765),
-        (44003, 44004),
-        (44006, 44007),
-        (44009, 44010),
-        (44012, 44012),
-        (69632, 69632),
-        (69634, 69634),
-        (69762, 69762),
-        (69808, 69810),
-        (69815, 69816),
-        (69932, 69932),
-        (70018, 70018),
-        (70067, 70069),
-        (70079, 70080),
-        (70188, 70190),
-        (70194, 70195),
-        (70197, 70197),
-        (70368, 70370),
-        (70402, 70403),
-        (70462, 70463),
-        (70465, 70468),
-        (70471, 70472),
-        (70475, 70477),
-        (70487, 70487),
-        (70498, 70499),
-        (70709, 70711),
-        (70720, 70721),
-        (70725, 70725),
-        (70832, 70834),
-        (70841, 70841),
-        (70843, 70846),
-        (70849, 70849),
-        (71087, 71089),
-        (71096, 71099),
-        (71102, 71102),
-        (71216, 71218),
-        (71227, 71228),
-        (71230, 71230),
-        (71340, 71340),
-        (71342, 71343),
-        (71350, 71350),
-        (71456, 71457),
-        (71462, 71462),
-        (72199, 72200),
-        (72249, 72249),
-        (72279, 72280),
-        (72343, 72343),
-        (72751, 72751),
-        (72766, 72766),
-        (72873, 72873),
-        (72881, 72881),
-        (72884, 72884),
-        (94033, 94078),
-        (119141, 119142),
-        (119149, 119154)),
- 'Me': ((1160, 1161), (6846, 6846), (8413, 8416), (8418, 8420), (42608, 42610)),
- 'Mn': ((768, 879),
-        (1155, 1159),
-        (1425, 1469),
-        (1471, 1471),
-        (1473, 1474),
-        (1476, 1477),
-        (1479, 1479),
-        (1552, 1562),
-        (1611, 1631),
-        (1648, 1648),
-        (1750, 1756),
-        (1759, 1764),
-        (1767, 1768),
-        (1770, 1773),
-        (1809, 1809),
-        (1840, 1866),
-        (1958, 1968),
-        (2027, 2035),
-        (2070, 2073),
-        (2075, 2083),
-        (2085, 2087),
-        (2089, 2093),
-        (2137, 2139),
-        (2260, 2273),
-        (2275, 2306),
-        (2362, 2362),
-        (2364, 2364),
-        (2369, 2376),
-        (2381, 2381),
-        (2385, 2391),
-        (2402, 2403),
-        (2433, 2433),
-        (2492, 2492),
-        (2497, 2500),
-        (2509, 2509),
-        (2530, 2531),
-        (2561, 2562),
-        (2620, 2620),
-        (2625, 2626),
-        (2631, 2632),
-        (2635, 2637),
-        (2641, 2641),
-        (2672, 2673),
-        (2677, 2677),
-        (2689, 2690),
-        (2748, 2748),
-        (2753, 2757),
-        (2759, 2760),
-        (2765, 2765),
-        (2786, 2787),
-        (2810, 2815),
-        (2817, 2817),
-        (2876, 2876),
-        (2879, 2879),
-        (2881, 2884),
-        (2893, 2893),
-        (2902, 2902),
-        (2914, 2915),
-        (2946, 2946),
-        (3008, 3008),
-        (3021, 3021),
-        (3072, 3072),
-        (3134, 3136),
-        (3142, 3144),
-        (3146, 3149),
-        (3157, 3158),
-        (3170, 3171),
-        (3201, 3201),
-        (3260, 3260),
-        (3263, 3263),
-        (3270, 3270),
-        (3276, 3277),
-        (3298, 3299),
-        (3328, 3329),
-        (3387, 3388),
-        (3393, 3396),
-        (3405, 3405),
-        (3426, 3427),
-        (3530, 3530),
-        (3538, 3540),
-        (3542, 3542),
-        (3633, 3633),
-        (3636, 3642),
-        (3655, 3662),
-        (3761, 3761),
-        (3764, 3769),
-        (3771, 3772),
-        (3784, 3789),
-        (3864, 3865),
-        (3893, 3893),
-        (3895, 3895),
-        (3897, 3897),
-        (3953, 3966),
-        (3968, 3972),
-        (3974, 3975),
-        (3981, 3991),
-        (3993, 4028),
-        (4038, 4038),
-        (4141, 4144),
-        (4146, 4151),
-        (4153, 4154),
-        (4157, 4158),
-        (4184, 4185),
-        (4190, 4192),
-        (4209, 4212),
-        (4226, 4226),
-        (4229, 4230),
-        (4237, 4237),
-        (4253, 4253),
-        (4957, 4959),
-        (5906, 5908),
-        (5938, 5940),
-        (5970, 5971),
-        (6002, 6003),
-        (6068, 6069),
-        (6071, 6077),
-        (6086, 6086),
-        (6089, 6099),
-        (6109, 6109),
-        (6155, 6157),
-        (6277, 6278),
-        (6313, 6313),
-        (6432, 6434),
-        (6439, 6440),
-        (6450, 6450),
-        (6457, 6459),
-        (6679, 6680),
-        (6683, 6683),
-        (6742, 6742),
-        (6744, 6750),
-        (6752, 6752),
-        (6754, 6754),
-        (6757, 6764),
-        (6771, 6780),
-        (6783, 6783),
-        (6832, 6845),
-        (6912, 6915),
-        (6964, 6964),
-        (6966, 6970),
-        (6972, 6972),
-        (6978, 6978),
-        (7019, 7027),
-        (7040, 7041),
-        (7074, 7077),
-        (7080, 7081),
-        (7083, 7085),
-        (7142, 7142),
-        (7144, 7145),
-        (7149, 7149),
-        (7151, 7153),
-        (7212, 7219),
-        (7222, 7223),
-        (7376, 7378),
-        (7380, 7392),
-        (7394, 7400),
-        (7405, 7405),
-        (7412, 7412),
-        (7416, 7417),
-        (7616, 7673),
-        (7675, 7679),
-        (8400, 8412),
-        (8417, 8417),
-        (8421, 8432),
-        (11503, 11505),
-        (11647, 11647),
-        (11744, 11775),
-        (12330, 12333),
-        (12441, 12442),
-        (42607, 42607),
-        (42612, 42621),
-        (42654, 42655),
-        (42736, 42737),
-        (43010, 43010),
-        (43014, 43014),
-        (43019, 43019),
-        (43045, 43046),
-        (43204, 43205),
-        (43232, 43249),
-        (43302, 43309),
-        (43335, 43345),
-        (43392, 43394),
-        (43443, 43443),
-        (43446, 43449),
-        (43452, 43452),
-        (43493, 43493),
-        (43561, 43566),
-        (43569, 43570),
-        (43573, 43574),
-        (43587, 43587),
-        (43596, 43596),
-        (43644, 43644),
-        (43696, 43696),
-        (43698, 43700),
-        (43703, 43704),
-        (43710, 43711),
-        (43713, 43713),
-        (43756, 43757),
-        (43766, 43766),
-        (44005, 44005),
-        (44008, 44008),
-        (44013, 44013),
-        (64286, 64286),
-        (65024, 65039),
-        (65056, 65071),
-        (66045, 66045),
-        (66272, 66272),
-        (66422, 66426),
-        (68097, 68099),
-        (68101, 68102),
-        (68108, 68111),
-        (68152, 68154),
-        (68159, 68159),
-        (68325, 68326),
-        (69633, 69633),
-        (69688, 69702),
-        (69759, 69761),
-        (69811, 69814),
-        (69817, 69818),
-        (69888, 69890),
-        (69927, 69931),
-        (69933, 69940),
-        (70003, 70003),
-        (70016, 70017),
-        (70070, 70078),
-        (70090, 70092),
-        (70191, 70193),
-        (70196, 70196),
-        (70198, 70199),
-        (70206, 70206),
-        (70367, 70367),
-        (70371, 70378),
-        (70400, 70401),
-        (70460, 70460),
-        (70464, 70464),
-        (70502, 70508),
-        (70512, 70516),
-        (70712, 70719),
-        (70722, 70724),
-        (70726, 70726),
-        (70835, 70840),
-        (70842, 70842),
-        (70847, 70848),
-        (70850, 70851),
-        (71090, 71093),
-        (71100, 71101),
-        (71103, 71104),
-        (71132, 71133),
-        (71219, 71226),
-        (71229, 71229),
-        (71231, 71232),
-        (71339, 71339),
-        (71341, 71341),
-        (71344, 71349),
-        (71351, 71351),
-        (71453, 71455),
-        (71458, 71461),
-        (71463, 71467),
-        (72193, 72198),
-        (72201, 72202),
-        (72243, 72248),
-        (72251, 72254),
-        (72263, 72263),
-        (72273, 72278),
-        (72281, 72283),
-        (72330, 72342),
-        (72344, 72345),
-        (72752, 72758),
-        (72760, 72765),
-        (72767, 72767),
-        (72850, 72871),
-        (72874, 72880),
-        (72882, 72883),
-        (72885, 72886),
-        (73009, 73014),
-        (73018, 73018),
-        (73020, 73021),
-        (73023, 73029),
-        (73031, 73031),
-        (92912, 92916),
-        (92976, 92982),
-        (94095, 94098),
-        (113821, 113822),
-        (119143, 119145),
-        (119163, 119170),
-        (119173, 119179),
-        (119210, 119213),
-        (119362, 119364),
-        (121344, 121398),
-        (121403, 121452),
-        (121461, 121461),
-        (121476, 121476),
-        (121499, 121503),
-        (121505, 121519),
-        (122880, 122886),
-        (122888, 122904),
-        (122907, 122913),
-        (122915, 122916),
-        (122918, 122922),
-        (125136, 125142),
-        (125252, 125258),
-        (917760, 917999)),
- 'Nd': ((48, 57),
-        (1632, 1641),
-        (1776, 1785),
-        (1984, 1993),
-        (2406, 2415),
-        (2534, 2543),
-        (2662, 2671),
-        (2790, 2799),
-        (2918, 2927),
-        (3046, 3055),
-        (3174, 3183),
-        (3302, 3311),
-        (3430, 3439),
-        (3558, 3567),
-        (3664, 3673),
-        (3792, 3801),
-        (3872, 3881),
-        (4160, 4169),
-        (4240, 4249),
-        (6112, 6121),
-        (6160, 6169),
-        (6470, 6479),
-        (6608, 6617),
-        (6784, 6793),
-        (6800, 6809),
-        (6992, 7001),
-        (7088, 7097),
-        (7232, 7241),
-        (7248, 7257),
-        (42528, 42537),
-        (43216, 43225),
-        (43264, 43273),
-        (43472, 43481),
-        (43504, 43513),
-        (43600, 43609),
-        (44016, 44025),
-        (65296, 65305),
-        (66720, 66729),
-        (69734, 69743),
-        (69872, 69881),
-        (69942, 69951),
-        (70096, 70105),
-        (70384, 70393),
-        (70736, 70745),
-        (70864, 70873),
-        (71248, 71257),
-        (71360, 71369),
-        (71472, 71481),
-        (71904, 71913),
-        (72784, 72793),
-        (73040, 73049),
-        (92768, 92777),
-        (93008, 93017),
-        (120782, 120831),
-        (125264, 125273)),
- 'Nl': ((5870, 5872),
-        (8544, 8578),
-        (8581, 8584),
-        (12295, 12295),
-        (12321, 12329),
-        (12344, 12346),
-        (42726, 42735),
-        (65856, 65908),
-        (66369, 66369),
-        (66378, 66378),
-        (66513, 66517),
-        (74752, 74862)),
- 'No': ((178, 179),
-        (185, 185),
-        (188, 190),
-        (2548, 2553),
-        (2930, 2935),
-        (3056, 3058),
-        (3192, 3198),
-        (3416, 3422),
-        (3440, 3448),
-        (3882, 3891),
-        (4969, 4988),
-        (6128, 6137),
-        (6618, 6618),
-        (8304, 8304),
-        (8308, 8313),
-        (8320, 8329),
-        (8528, 8543),
-        (8585, 8585),
-        (9312, 9371),
-        (9450, 9471),
-        (10102, 10131),
-        (11517, 11517),
-        (12690, 12693),
-        (12832, 12841),
-        (12872, 12879),
-        (12881, 12895),
-        (12928, 12937),
-        (12977, 12991),
-        (43056, 43061),
-        (65799, 65843),
-        (65909, 65912),
-        (65930, 65931),
-        (66273, 66299),
-        (66336, 66339),
-        (67672, 67679),
-        (67705, 67711),
-        (67751, 67759),
-        (67835, 67839),
-        (67862, 67867),
-        (68028, 68029),
-        (68032, 68047),
-        (68050, 68095),
-        (68160, 68167),
-        (68221, 68222),
-        (68253, 68255),
-        (68331, 68335),
-        (68440, 68447),
-        (68472, 68479),
-        (68521, 68527),
-        (68858, 68863),
-        (69216, 69246),
-        (69714, 69733),
-        (70113, 70132),
-        (71482, 71483),
-        (71914, 71922),
-        (72794, 72812),
-        (93019, 93025),
-        (119648, 119665),
-        (125127, 125135),
-        (127232, 127244)),
- 'Pc': ((95, 95),
-        (8255, 8256),
-        (8276, 8276),
-        (65075, 65076),
-        (65101, 65103),
-        (65343, 65343)),
- 'Pd': ((45, 45),
-        (1418, 1418),
-        (1470, 1470),
-        (5120, 5120),
-        (6150, 6150),
-        (8208, 8213),
-        (11799, 11799),
-        (11802, 11802),
-        (11834, 11835),
-        (11840, 11840),
-        (12316, 12316),
-        (12336, 12336),
-        (12448, 12448),
-        (65073, 65074),
-        (65112, 65112),
-        (65123, 65123),
-        (65293, 65293)),
- 'Pe': ((41, 41),
-        (93, 93),
-        (125, 125),
-        (3899, 3899),
-        (3901, 3901),
-        (5788, 5788),
-        (8262, 8262),
-        (8318, 8318),
-        (8334, 8334),
-        (8969, 8969),
-        (8971, 8971),
-        (9002, 9002),
-        (10089, 10089),
-        (10091, 10091),
-        (10093, 10093),
-        (10095, 10095),
-        (10097, 10097),
-        (10099, 10099),
-        (10101, 10101),
-        (10182, 10182),
-        (10215, 10215),
-        (10217, 10217),
-        (10219, 10219),
-        (10221, 10221),
-        (10223, 10223),
-        (10628, 10628),
-        (10630, 10630),
-        (10632, 10632),
-        (10634, 10634),
-        (10636, 10636),
-        (10638, 10638),
-        (10640, 10640),
-        (10642, 10642),
-        (10644, 10644),
-        (10646, 10646),
-        (10648, 10648),
-        (10713, 10713),
-        (10715, 10715),
-        (10749, 10749),
-        (11811, 11811),
-        (11813, 11813),
-        (11815, 11815),
-        (11817, 11817),
-        (12297, 12297),
-        (12299, 12299),
-        (12301, 12301),
-        (12303, 12303),
-        (12305, 12305),
-        (12309, 12309),
-        (12311, 12311),
-        (12313, 12313),
-        (12315, 12315),
-        (12318, 12319),
-        (64830, 64830),
-        (65048, 65048),
-        (65078, 65078),
-        (65080, 65080),
-        (65082, 65082),
-        (65084, 65084),
-        (65086, 65086),
-        (65088, 65088),
-        (65090, 65090),
-        (65092, 65092),
-        (65096, 65096),
-        (65114, 65114),
-        (65116, 65116),
-        (65118, 65118),
-        (65289, 65289),
-        (65341, 65341),
-        (65373, 65373),
-        (65376, 65376),
-        (65379, 65379)),
- 'Pf': ((187, 187),
-        (8217, 8217),
-        (8221, 8221),
-        (8250, 8250),
-        (11779, 11779),
-        (11781, 11781),
-        (11786, 11786),
-        (11789, 11789),
-        (11805, 11805),
-        (11809, 11809)),
- 'Pi': ((171, 171),
-        (8216, 8216),
-        (8219, 8220),
-        (8223, 8223),
-        (8249, 8249),
-        (11778, 11778),
-        (11780, 11780),
-        (11785, 11785),
-        (11788, 11788),
-        (11804, 11804),
-        (11808, 11808)),
- 'Po': ((33, 35),
-        (37, 39),
-        (42, 42),
-        (44, 44),
-        (46, 47),
-        (58, 59),
-        (63, 64),
-        (92, 92),
-        (161, 161),
-        (167, 167),
-        (182, 183),
-        (191, 191),
-        (894, 894),
-        (903, 903),
-        (1370, 1375),
-        (1417, 1417),
-        (1472, 1472),
-        (1475, 1475),
-        (1478, 1478),
-        (1523, 1524),
-        (1545, 1546),
-        (1548, 1549),
-        (1563, 1563),
-        (1566, 1567),
-        (1642, 1645),
-        (1748, 1748),
-        (1792, 1805),
-        (2039, 2041),
-        (2096, 2110),
-        (2142, 2142),
-        (2404, 2405),
-        (2416, 2416),
-        (2557, 2557),
-        (2800, 2800),
-        (3572, 3572),
-        (3663, 3663),
-        (3674, 3675),
-        (3844, 3858),
-        (3860, 3860),
-        (3973, 3973),
-        (4048, 4052),
-        (4057, 4058),
-        (4170, 4175),
-        (4347, 4347),
-        (4960, 4968),
-        (5741, 5742),
-        (5867, 5869),
-        (5941, 5942),
-        (6100, 6102),
-        (6104, 6106),
-        (6144, 6149),
-        (6151, 6154),
-        (6468, 6469),
-        (6686, 6687),
-        (6816, 6822),
-        (6824, 6829),
-        (7002, 7008),
-        (7164, 7167),
-        (7227, 7231),
-        (7294, 7295),
-        (7360, 7367),
-        (7379, 7379),
-        (8214, 8215),
-        (8224, 8231),
-        (8240, 8248),
-        (8251, 8254),
-        (8257, 8259),
-        (8263, 8273),
-        (8275, 8275),
-        (8277, 8286),
-        (11513, 11516),
-        (11518, 11519),
-        (11632, 11632),
-        (11776, 11777),
-        (11782, 11784),
-        (11787, 11787),
-        (11790, 11798),
-        (11800, 11801),
-        (11803, 11803),
-        (11806, 11807),
-        (11818, 11822),
-        (11824, 11833),
-        (11836, 11839),
-        (11841, 11841),
-        (11843, 11849),
-        (12289, 12291),
-        (12349, 12349),
-        (12539, 12539),
-        (42238, 42239),
-        (42509, 42511),
-        (42611, 42611),
-        (42622, 42622),
-        (42738, 42743),
-        (43124, 43127),
-        (43214, 43215),
-        (43256, 43258),
-        (43260, 43260),
-        (43310, 43311),
-        (43359, 43359),
-        (43457, 43469),
-        (43486, 43487),
-        (43612, 43615),
-        (43742, 43743),
-        (43760, 43761),
-        (44011, 44011),
-        (65040, 65046),
-        (65049, 65049),
-        (65072, 65072),
-        (65093, 65094),
-        (65097, 65100),
-        (65104, 65106),
-        (65108, 65111),
-        (65119, 65121),
-        (65128, 65128),
-        (65130, 65131),
-        (65281, 65283),
-        (65285, 65287),
-        (65290, 65290),
-        (65292, 65292),
-        (65294, 65295),
-        (65306, 65307),
-        (65311, 65312),
-        (65340, 65340),
-        (65377, 65377),
-        (65380, 65381),
-        (65792, 65794),
-        (66463, 66463),
-        (66512, 66512),
-        (66927, 66927),
-        (67671, 67671),
-        (67871, 67871),
-        (67903, 67903),
-        (68176, 68184),
-        (68223, 68223),
-        (68336, 68342),
-        (68409, 68415),
-        (68505, 68508),
-        (69703, 69709),
-        (69819, 69820),
-        (69822, 69825),
-        (69952, 69955),
-        (70004, 70005),
-        (70085, 70089),
-        (70093, 70093),
-        (70107, 70107),
-        (70109, 70111),
-        (70200, 70205),
-        (70313, 70313),
-        (70731, 70735),
-        (70747, 70747),
-        (70749, 70749),
-        (70854, 70854),
-        (71105, 71127),
-        (71233, 71235),
-        (71264, 71276),
-        (71484, 71486),
-        (72255, 72262),
-        (72346, 72348),
-        (72350, 72354),
-        (72769, 72773),
-        (72816, 72817),
-        (74864, 74868),
-        (92782, 92783),
-        (92917, 92917),
-        (92983, 92987),
-        (92996, 92996),
-        (113823, 113823),
-        (121479, 121483),
-        (125278, 125279)),
- 'Ps': ((40, 40),
-        (91, 91),
-        (123, 123),
-        (3898, 3898),
-        (3900, 3900),
-        (5787, 5787),
-        (8218, 8218),
-        (8222, 8222),
-        (8261, 8261),
-        (8317, 8317),
-        (8333, 8333),
-        (8968, 8968),
-        (8970, 8970),
-        (9001, 9001),
-        (10088, 10088),
-        (10090, 10090),
-        (10092, 10092),
-        (10094, 10094),
-        (10096, 10096),
-        (10098, 10098),
-        (10100, 10100),
-        (10181, 10181),
-        (10214, 10214),
-        (10216, 10216),
-        (10218, 10218),
-        (10220, 10220),
-        (10222, 10222),
-        (10627, 10627),
-        (10629, 10629),
-        (10631, 10631),
-        (10633, 10633),
-        (10635, 10635),
-        (10637, 10637),
-        (10639, 10639),
-        (10641, 10641),
-        (10643, 10643),
-        (10645, 10645),
-        (10647, 10647),
-        (10712, 10712),
-        (10714, 10714),
-        (10748, 10748),
-        (11810, 11810),
-        (11812, 11812),
-        (11814, 11814),
-        (11816, 11816),
-        (11842, 11842),
-        (12296, 12296),
-        (12298, 12298),
-        (12300, 12300),
-        (12302, 12302),
-        (12304, 12304),
-        (12308, 12308),
-        (12310, 12310),
-        (12312, 12312),
-        (12314, 12314),
-        (12317, 12317),
-        (64831, 64831),
-        (65047, 65047),
-        (65077, 65077),
-        (65079, 65079),
-        (65081, 65081),
-        (65083, 65083),
-        (65085, 65085),
-        (65087, 65087),
-        (65089, 65089),
-        (65091, 65091),
-        (65095, 65095),
-        (65113, 65113),
-        (65115, 65115),
-        (65117, 65117),
-        (65288, 65288),
-        (65339, 65339),
-        (65371, 65371),
-        (65375, 65375),
-        (65378, 65378)),
- 'Sc': ((36, 36),
-        (162, 165),
-        (1423, 1423),
-        (1547, 1547),
-        (2546, 2547),
-        (2555, 2555),
-        (2801, 2801),
-        (3065, 3065),
-        (3647, 3647),
-        (6107, 6107),
-        (8352, 8383),
-        (43064, 43064),
-        (65020, 65020),
-        (65129, 65129),
-        (65284, 65284),
-        (65504, 65505),
-        (65509, 65510)),
- 'Sk': ((94, 94),
-        (96, 96),
-        (168, 168),
-        (175, 175),
-        (180, 180),
-        (184, 184),
-        (706, 709),
-        (722, 735),
-        (741, 747),
-        (749, 749),
-        (751, 767),
-        (885, 885),
-        (900, 901),
-        (8125, 8125),
-        (8127, 8129),
-        (8141, 8143),
-        (8157, 8159),
-        (8173, 8175),
-        (8189, 8190),
-        (12443, 12444),
-        (42752, 42774),
-        (42784, 42785),
-        (42889, 42890),
-        (43867, 43867),
-        (64434, 64449),
-        (65342, 65342),
-        (65344, 65344),
-        (65507, 65507),
-        (127995, 127999)),
- 'Sm': ((43, 43),
-        (60, 62),
-        (124, 124),
-        (126, 126),
-        (172, 172),
-        (177, 177),
-        (215, 215),
-        (247, 247),
-        (1014, 1014),
-        (1542, 1544),
-        (8260, 8260),
-        (8274, 8274),
-        (8314, 8316),
-        (8330, 8332),
-        (8472, 8472),
-        (8512, 8516),
-        (8523, 8523),
-        (8592, 8596),
-        (8602, 8603),
-        (8608, 8608),
-        (8611, 8611),
-        (8614, 8614),
-        (8622, 8622),
-        (8654, 8655),
-        (8658, 8658),
-        (8660, 8660),
-        (8692, 8959),
-        (8992, 8993),
-        (9084, 9084),
-        (9115, 9139),
-        (9180, 9185),
-        (9655, 9655),
-        (9665, 9665),
-        (9720, 9727),
-        (9839, 9839),
-        (10176, 10180),
-        (10183, 10213),
-        (10224, 10239),
-        (10496, 10626),
-        (10649, 10711),
-        (10716, 10747),
-        (10750, 11007),
-        (11056, 11076),
-        (11079, 11084),
-        (64297, 64297),
-        (65122, 65122),
-        (65124, 65126),
-        (65291, 65291),
-        (65308, 65310),
-        (65372, 65372),
-        (65374, 65374),
-        (65506, 65506),
-        (65513, 65516),
-        (120513, 120513),
-        (120539, 120539),
-        (120571, 120571),
-        (120597, 120597),
-        (120629, 120629),
-        (120655, 120655),
-        (120687, 120687),
-        (120713, 120713),
-        (120745, 120745),
-        (120771, 120771),
-        (126704, 126705)),
- 'So': ((166, 166),
-        (169, 169),
-        (174, 174),
-        (176, 176),
-        (1154, 1154),
-        (1421, 1422),
-        (1550, 1551),
-        (1758, 1758),
-        (1769, 1769),
-        (1789, 1790),
-        (2038, 2038),
-        (2554, 2554),
-        (2928, 2928),
-        (3059, 3064),
-        (3066, 3066),
-        (3199, 3199),
-        (3407, 3407),
-        (3449, 3449),
-        (3841, 3843),
-        (3859, 3859),
-        (3861, 3863),
-        (3866, 3871),
-        (3892, 3892),
-        (3894, 3894),
-        (3896, 3896),
-        (4030, 4037),
-        (4039, 4044),
-        (4046, 4047),
-        (4053, 4056),
-        (4254, 4255),
-        (5008, 5017),
-        (6464, 6464),
-        (6622, 6655),
-        (7009, 7018),
-        (7028, 7036),
-        (8448, 8449),
-        (8451, 8454),
-        (8456, 8457),
-        (8468, 8468),
-        (8470, 8471),
-        (8478, 8483),
-        (8485, 8485),
-        (8487, 8487),
-        (8489, 8489),
-        (8494, 8494),
-        (8506, 8507),
-        (8522, 8522),
-        (8524, 8525),
-        (8527, 8527),
-        (8586, 8587),
-        (8597, 8601),
-        (8604, 8607),
-        (8609, 8610),
-        (8612, 8613),
-        (8615, 8621),
-        (8623, 8653),
-        (8656, 8657),
-        (8659, 8659),
-        (8661, 8691),
-        (8960, 8967),
-        (8972, 8991),
-        (8994, 9000),
-        (9003, 9083),
-        (9085, 9114),
-        (9140, 9179),
-        (9186, 9254),
-        (9280, 9290),
-        (9372, 9449),
-        (9472, 9654),
-        (9656, 9664),
-        (9666, 9719),
-        (9728, 9838),
-        (9840, 10087),
-        (10132, 10175),
-        (10240, 10495),
-        (11008, 11055),
-        (11077, 11078),
-        (11085, 11123),
-        (11126, 11157),
-        (11160, 11193),
-        (11197, 11208),
-        (11210, 11218),
-        (11244, 11247),
-        (11493, 11498),
-        (11904, 11929),
-        (11931, 12019),
-        (12032, 12245),
-        (12272, 12283),
-        (12292, 12292),
-        (12306, 12307),
-        (12320, 12320),
-        (12342, 12343),
-        (12350, 12351),
-        (12688, 12689),
-        (12694, 12703),
-        (12736, 12771),
-        (12800, 12830),
-        (12842, 12871),
-        (12880, 12880),
-        (12896, 12927),
-        (12938, 12976),
-        (12992, 13054),
-        (13056, 13311),
-        (19904, 19967),
-        (42128, 42182),
-        (43048, 43051),
-        (43062, 43063),
-        (43065, 43065),
-        (43639, 43641),
-        (65021, 65021),
-        (65508, 65508),
-        (65512, 65512),
-        (65517, 65518),
-        (65532, 65533),
-        (65847, 65855),
-        (65913, 65929),
-        (65932, 65934),
-        (65936, 65947),
-        (65952, 65952),
-        (66000, 66044),
-        (67703, 67704),
-        (68296, 68296),
-        (71487, 71487),
-        (92988, 92991),
-        (92997, 92997),
-        (113820, 113820),
-        (118784, 119029),
-        (119040, 119078),
-        (119081, 119140),
-        (119146, 119148),
-        (119171, 119172),
-        (119180, 119209),
-        (119214, 119272),
-        (119296, 119361),
-        (119365, 119365),
-        (119552, 119638),
-        (120832, 121343),
-        (121399, 121402),
-        (121453, 121460),
-        (121462, 121475),
-        (121477, 121478),
-        (126976, 127019),
-        (127024, 127123),
-        (127136, 127150),
-        (127153, 127167),
-        (127169, 127183),
-        (127185, 127221),
-        (127248, 127278),
-        (127280, 127339),
-        (127344, 127404),
-        (127462, 127490),
-        (127504, 127547),
-        (127552, 127560),
-        (127568, 127569),
-        (127584, 127589),
-        (127744, 127994),
-        (128000, 128724),
-        (128736, 128748),
-        (128752, 128760),
-        (128768, 128883),
-        (128896, 128980),
-        (129024, 129035),
-        (129040, 129095),
-        (129104, 129113),
-        (129120, 129159),
-        (129168, 129197),
-        (129280, 129291),
-        (129296, 129342),
-        (129344, 129356),
-        (129360, 129387),
-        (129408, 129431),
-        (129472, 129472),
-        (129488, 129510)),
- 'Zl': ((8232, 8232),),
- 'Zp': ((8233, 8233),),
- 'Zs': ((32, 32),
-        (160, 160),
-        (5760, 5760),
-        (8192, 8202),
-        (8239, 8239),
-        (8287, 8287),
-        (12288, 12288))}
+import array
+import base64
+import collections.abc
+import sys
+import zlib
+from . import util
+
+_bounds = None
+
+def _load(start, end):
+    global _bounds
+    if _bounds is None:
+        _bounds = zlib.decompress(base64.b85decode("".join(_data)))
+    return _bounds[start:end]
+
+class _Properties(collections.abc.Mapping):
+    """A read only mapping of property names to IntegerSets."""
+
+    def __init__(self, index):
+        self._index = index
+        self._sets = {}
+
+    def __getitem__(self, name):
+        codepoints = self._sets.get(name)
+        if codepoints is None:
+            codepoints = util.IntegerSet.frombytes(_load(*self._index[name]))
+            self._sets[name] = codepoints
+        return codepoints
+
+    def __iter__(self):
+        return iter(self._index)
+
+    def __len__(self):
+        return len(self._index)
+
+_folding = None
+
+def case_folding():
+    """Return the simple case folding, a dict of codepoints to codepoints."""
+    global _folding
+    if _folding is None:
+        pairs = array.array("I")
+        pairs.frombytes(_load(*_case_folding))
+        if sys.byteorder != "little":
+            pairs.byteswap()
+        _folding = dict(zip(pairs[::2], pairs[1::2]))
+    return _folding
+
+version = '14.0.0'
+
+general_categories = _Properties({
+    'Cc': (0, 16),
+    'Cf': (16, 184),
+    'Cn': (184, 5768),
+    'Co': (5768, 5792),
+    'Cs': (5792, 5800),
+    'Ll': (5800, 11056),
+    'Lm': (11056, 11608),
+    'Lo': (11608, 15616),
+    'Lt': (15616, 15696),
+    'Lu': (15696, 20864),
+    'Mc': (20864, 22280),
+    'Me': (22280, 22320),
+    'Mn': (22320, 25008),
+    'Nd': (25008, 25504),
+    'Nl': (25504, 25600),
+    'No': (25600, 26168),
+    'Pc': (26168, 26216),
+    'Pd': (26216, 26368),
+    'Pe': (26368, 26976),
+    'Pf': (26976, 27056),
+    'Pi': (27056, 27144),
+    'Po': (27144, 28624),
+    'Ps': (28624, 29256),
+    'Sc': (29256, 29424),
+    'Sk': (29424, 29672),
+    'Sm': (29672, 30184),
+    'So': (30184, 31672),
+    'Zl': (31672, 31680),
+    'Zp': (31680, 31688),
+    'Zs': (31688, 31744),
+})
+
+scripts = _Properties({
+    'Adlam': (31744, 31768),
+    'Ahom': (31768, 31792),
+    'Anatolian_Hieroglyphs': (31792, 31800),
+    'Arabic': (31800, 32256),
+    'Armenian': (32256, 32288),
+    'Avestan': (32288, 32304),
+    'Balinese': (32304, 32320),
+    'Bamum': (32320, 32336),
+    'Bassa_Vah': (32336, 32352),
+    'Batak': (32352, 32368),
+    'Bengali': (32368, 32480),
+    'Bhaiksuki': (32480, 32512),
+    'Bopomofo': (32512, 32536),
+    'Brahmi': (32536, 32560),
+    'Braille': (32560, 32568),
+    'Buginese': (32568, 32584),
+    'Buhid': (32584, 32592),
+    'Canadian_Aboriginal': (32592, 32616),
+    'Carian': (32616, 32624),
+    'Caucasian_Albanian': (32624, 32640),
+    'Chakma': (32640, 32656),
+    'Cham': (32656, 32688),
+    'Cherokee': (32688, 32712),
+    'Chorasmian': (32712, 32720),
+    'Common': (32720, 34112),
+    'Coptic': (34112, 34136),
+    'Cuneiform': (34136, 34168),
+    'Cypriot': (34168, 34216),
+    'Cypro_Minoan': (34216, 34224),
+    'Cyrillic': (34224, 34288),
+    'Deseret': (34288, 34296),
+    'Devanagari': (34296, 34328),
+    'Dives_Akuru': (34328, 34392),
+    'Dogra': (34392, 34400),
+    'Duployan': (34400, 34440),
+    'Egyptian_Hieroglyphs': (34440, 34456),
+    'Elbasan': (34456, 34464),
+    'Elymaic': (34464, 34472),
+    'Ethiopic': (34472, 34760),
+    'Georgian': (34760, 34840),
+    'Glagolitic': (34840, 34888),
+    'Gothic': (34888, 34896),
+    'Grantha': (34896, 35016),
+    'Greek': (35016, 35304),
+    'Gujarati': (35304, 35416),
+    'Gunjala_Gondi': (35416, 35464),
+    'Gurmukhi': (35464, 35592),
+    'Han': (35592, 35752),
+    'Hangul': (35752, 35864),
+    'Hanifi_Rohingya': (35864, 35880),
+    'Hanunoo': (35880, 35888),
+    'Hatran': (35888, 35912),
+    'Hebrew': (35912, 35984),
+    'Hiragana': (35984, 36024),
+    'Imperial_Aramaic': (36024, 36040),
+    'Inherited': (36040, 36272),
+    'Inscriptional_Pahlavi': (36272, 36288),
+    'Inscriptional_Parthian': (36288, 36304),
+    'Javanese': (36304, 36328),
+    'Kaithi': (36328, 36344),
+    'Kannada': (36344, 36448),
+    'Katakana': (36448, 36552),
+    'Kayah_Li': (36552, 36568),
+    'Kharoshthi': (36568, 36632),
+    'Khitan_Small_Script': (36632, 36648),
+    'Khmer': (36648, 36680),
+    'Khojki': (36680, 36696),
+    'Khudawadi': (36696, 36712),
+    'Lao': (36712, 36800),
+    'Latin': (36800, 37104),
+    'Lepcha': (37104, 37128),
+    'Limbu': (37128, 37168),
+    'Linear_A': (37168, 37192),
+    'Linear_B': (37192, 37248),
+    'Lisu': (37248, 37264),
+    'Lycian': (37264, 37272),
+    'Lydian': (37272, 37288),
+    'Mahajani': (37288, 37296),
+    'Makasar': (37296, 37304),
+    'Malayalam': (37304, 37360),
+    'Mandaic': (37360, 37376),
+    'Manichaean': (37376, 37392),
+    'Marchen': (37392, 37416),
+    'Masaram_Gondi': (37416, 37472),
+    'Medefaidrin': (37472, 37480),
+    'Meetei_Mayek': (37480, 37504),
+    'Mende_Kikakui': (37504, 37520),
+    'Meroitic_Cursive': (37520, 37544),
+    'Meroitic_Hieroglyphs': (37544, 37552),
+    'Miao': (37552, 37576),
+    'Modi': (37576, 37592),
+    'Mongolian': (37592, 37640),
+    'Mro': (37640, 37664),
+    'Multani': (37664, 37704),
+    'Myanmar': (37704, 37728),
+    'Nabataean': (37728, 37744),
+    'Nandinagari': (37744, 37768),
+    'New_Tai_Lue': (37768, 37800),
+    'Newa': (37800, 37816),
+    'Nko': (37816, 37832),
+    'Nushu': (37832, 37848),
+    'Nyiakeng_Puachue_Hmong': (37848, 37880),
+    'Ogham': (37880, 37888),
+    'Ol_Chiki': (37888, 37896),
+    'Old_Hungarian': (37896, 37920),
+    'Old_Italic': (37920, 37936),
+    'Old_North_Arabian': (37936, 37944),
+    'Old_Permic': (37944, 37952),
+    'Old_Persian': (37952, 37968),
+    'Old_Sogdian': (37968, 37976),
+    'Old_South_Arabian': (37976, 37984),
+    'Old_Turkic': (37984, 37992),
+    'Old_Uyghur': (37992, 38000),
+    'Oriya': (38000, 38112),
+    'Osage': (38112, 38128),
+    'Osmanya': (38128, 38144),
+    'Pahawh_Hmong': (38144, 38184),
+    'Palmyrene': (38184, 38192),
+    'Pau_Cin_Hau': (38192, 38200),
+    'Phags_Pa': (38200, 38208),
+    'Phoenician': (38208, 38224),
+    'Psalter_Pahlavi': (38224, 38248),
+    'Rejang': (38248, 38264),
+    'Runic': (38264, 38280),
+    'Samaritan': (38280, 38296),
+    'Saurashtra': (38296, 38312),
+    'Sharada': (38312, 38320),
+    'Shavian': (38320, 38328),
+    'Siddham': (38328, 38344),
+    'SignWriting': (38344, 38368),
+    'Sinhala': (38368, 38472),
+    'Sogdian': (38472, 38480),
+    'Sora_Sompeng': (38480, 38496),
+    'Soyombo': (38496, 38504),
+    'Sundanese': (38504, 38520),
+    'Syloti_Nagri': (38520, 38528),
+    'Syriac': (38528, 38560),
+    'Tagalog': (38560, 38576),
+    'Tagbanwa': (38576, 38600),
+    'Tai_Le': (38600, 38616),
+    'Tai_Tham': (38616, 38656),
+    'Tai_Viet': (38656, 38672),
+    'Takri': (38672, 38688),
+    'Tamil': (38688, 38832),
+    'Tangsa': (38832, 38848),
+    'Tangut': (38848, 38880),
+    'Telugu': (38880, 38984),
+    'Thaana': (38984, 38992),
+    'Thai': (38992, 39008),
+    'Tibetan': (39008, 39064),
+    'Tifinagh': (39064, 39088),
+    'Tirhuta': (39088, 39104),
+    'Toto': (39104, 39112),
+    'Ugaritic': (39112, 39128),
+    'Vai': (39128, 39136),
+    'Vithkuqi': (39136, 39200),
+    'Wancho': (39200, 39216),
+    'Warang_Citi': (39216, 39232),
+    'Yezidi': (39232, 39256),
+    'Yi': (39256, 39272),
+    'Zanabazar_Square': (39272, 39280),
+})
+
+script_extensions = _Properties({
+    'Adlam': (39280, 39320),
+    'Ahom': (39320, 39344),
+    'Anatolian_Hieroglyphs': (39344, 39352),
+    'Arabic': (39352, 39760),
+    'Armenian': (39760, 39792),
+    'Avestan': (39792, 39808),
+    'Balinese': (39808, 39824),
+    'Bamum': (39824, 39840),
+    'Bassa_Vah': (39840, 39856),
+    'Batak': (39856, 39872),
+    'Bengali': (39872, 40080),
+    'Bhaiksuki': (40080, 40112),
+    'Bopomofo': (40112, 40208),
+    'Brahmi': (40208, 40232),
+    'Braille': (40232, 40240),
+    'Buginese': (40240, 40264),
+    'Buhid': (40264, 40280),
+    'Canadian_Aboriginal': (40280, 40304),
+    'Carian': (40304, 40312),
+    'Caucasian_Albanian': (40312, 40328),
+    'Chakma': (40328, 40360),
+    'Cham': (40360, 40392),
+    'Cherokee': (40392, 40416),
+    'Chorasmian': (40416, 40424),
+    'Common': (40424, 41608),
+    'Coptic': (41608, 41640),
+    'Cuneiform': (41640, 41672),
+    'Cypriot': (41672, 41744),
+    'Cypro_Minoan': (41744, 41760),
+    'Cyrillic': (41760, 41832),
+    'Deseret': (41832, 41840),
+    'Devanagari': (41840, 41896),
+    'Dives_Akuru': (41896, 41960),
+    'Dogra': (41960, 41984),
+    'Duployan': (41984, 42024),
+    'Egyptian_Hieroglyphs': (42024, 42040),
+    'Elbasan': (42040, 42048),
+    'Elymaic': (42048, 42056),
+    'Ethiopic': (42056, 42344),
+    'Georgian': (42344, 42416),
+    'Glagolitic': (42416, 42496),
+    'Gothic': (42496, 42504),
+    'Grantha': (42504, 42704),
+    'Greek': (42704, 43008),
+    'Gujarati': (43008, 43144),
+    'Gunjala_Gondi': (43144, 43200),
+    'Gurmukhi': (43200, 43352),
+    'Han': (43352, 43648),
+    'Hangul': (43648, 43816),
+    'Hanifi_Rohingya': (43816, 43872),
+    'Hanunoo': (43872, 43880),
+    'Hatran': (43880, 43904),
+    'Hebrew': (43904, 43976),
+    'Hiragana': (43976, 44104),
+    'Imperial_Aramaic': (44104, 44120),
+    'Inherited': (44120, 44280),
+    'Inscriptional_Pahlavi': (44280, 44296),
+    'Inscriptional_Parthian': (44296, 44312),
+    'Javanese': (44312, 44336),
+    'Kaithi': (44336, 44368),
+    'Kannada': (44368, 44536),
+    'Katakana': (44536, 44688),
+    'Kayah_Li': (44688, 44696),
+    'Kharoshthi': (44696, 44760),
+    'Khitan_Small_Script': (44760, 44776),
+    'Khmer': (44776, 44808),
+    'Khojki': (44808, 44840),
+    'Khudawadi': (44840, 44872),
+    'Lao': (44872, 44960),
+    'Latin': (44960, 45328),
+    'Lepcha': (45328, 45352),
+    'Limbu': (45352, 45400),
+    'Linear_A': (45400, 45432),
+    'Linear_B': (45432, 45512),
+    'Lisu': (45512, 45528),
+    'Lycian': (45528, 45536),
+    'Lydian': (45536, 45552),
+    'Mahajani': (45552, 45576),
+    'Makasar': (45576, 45584),
+    'Malayalam': (45584, 45672),
+    'Mandaic': (45672, 45696),
+    'Manichaean': (45696, 45720),
+    'Marchen': (45720, 45744),
+    'Masaram_Gondi': (45744, 45808),
+    'Medefaidrin': (45808, 45816),
+    'Meetei_Mayek': (45816, 45840),
+    'Mende_Kikakui': (45840, 45856),
+    'Meroitic_Cursive': (45856, 45880),
+    'Meroitic_Hieroglyphs': (45880, 45888),
+    'Miao': (45888, 45912),
+    'Modi': (45912, 45936),
+    'Mongolian': (45936, 45976),
+    'Mro': (45976, 46000),
+    'Multani': (46000, 46048),
+    'Myanmar': (46048, 46080),
+    'Nabataean': (46080, 46096),
+    'Nandinagari': (46096, 46168),
+    'New_Tai_Lue': (46168, 46200),
+    'Newa': (46200, 46216),
+    'Nko': (46216, 46264),
+    'Nushu': (46264, 46280),
+    'Nyiakeng_Puachue_Hmong': (46280, 46312),
+    'Ogham': (46312, 46320),
+    'Ol_Chiki': (46320, 46328),
+    'Old_Hungarian': (46328, 46352),
+    'Old_Italic': (46352, 46368),
+    'Old_North_Arabian': (46368, 46376),
+    'Old_Permic': (46376, 46392),
+    'Old_Persian': (46392, 46408),
+    'Old_Sogdian': (46408, 46416),
+    'Old_South_Arabian': (46416, 46424),
+    'Old_Turkic': (46424, 46432),
+    'Old_Uyghur': (46432, 46456),
+    'Oriya': (46456, 46600),
+    'Osage': (46600, 46616),
+    'Osmanya': (46616, 46632),
+    'Pahawh_Hmong': (46632, 46672),
+    'Palmyrene': (46672, 46680),
+    'Pau_Cin_Hau': (46680, 46688),
+    'Phags_Pa': (46688, 46712),
+    'Phoenician': (46712, 46728),
+    'Psalter_Pahlavi': (46728, 46760),
+    'Rejang': (46760, 46776),
+    'Runic': (46776, 46792),
+    'Samaritan': (46792, 46808),
+    'Saurashtra': (46808, 46824),
+    'Sharada': (46824, 46872),
+    'Shavian': (46872, 46880),
+    'Siddham': (46880, 46896),
+    'SignWriting': (46896, 46920),
+    'Sinhala': (46920, 47032),
+    'Sogdian': (47032, 47048),
+    'Sora_Sompeng': (47048, 47064),
+    'Soyombo': (47064, 47072),
+    'Sundanese': (47072, 47088),
+    'Syloti_Nagri': (47088, 47112),
+    'Syriac': (47112, 47208),
+    'Tagalog': (47208, 47232),
+    'Tagbanwa': (47232, 47264),
+    'Tai_Le': (47264, 47288),
+    'Tai_Tham': (47288, 47328),
+    'Tai_Viet': (47328, 47344),
+    'Takri': (47344, 47376),
+    'Tamil': (47376, 47576),
+    'Tangsa': (47576, 47592),
+    'Tangut': (47592, 47624),
+    'Telugu': (47624, 47760),
+    'Thaana': (47760, 47816),
+    'Thai': (47816, 47832),
+    'Tibetan': (47832, 47888),
+    'Tifinagh': (47888, 47912),
+    'Tirhuta': (47912, 47960),
+    'Toto': (47960, 47968),
+    'Ugaritic': (47968, 47984),
+    'Vai': (47984, 47992),
+    'Vithkuqi': (47992, 48056),
+    'Wancho': (48056, 48072),
+    'Warang_Citi': (48072, 48088),
+    'Yezidi': (48088, 48144),
+    'Yi': (48144, 48200),
+    'Zanabazar_Square': (48200, 48208),
+})
+
+binary_properties = _Properties({
+    'ASCII_Hex_Digit': (48208, 48232),
+    'Alphabetic': (48232, 54008),
+    'Bidi_Control': (54008, 54040),
+    'Case_Ignorable': (54040, 57456),
+    'Cased': (57456, 58696),
+    'Changes_When_Casefolded': (58696, 63672),
+    'Changes_When_Casemapped': (63672, 64720),
+    'Changes_When_Lowercased': (64720, 69592),
+    'Changes_When_Titlecased': (69592, 74600),
+    'Changes_When_Uppercased': (74600, 79616),
+    'Dash': (79616, 79800),
+    'Default_Ignorable_Code_Point': (79800, 79936),
+    'Deprecated': (79936, 80000),
+    'Diacritic': (80000, 81536),
+    'Extender': (81536, 81800),
+    'Grapheme_Base': (81800, 88688),
+    'Grapheme_Extend': (88688, 91512),
+    'Hex_Digit': (91512, 91560),
+    'Hyphen': (91560, 91640),
+    'IDS_Binary_Operator': (91640, 91656),
+    'IDS_Trinary_Operator': (91656, 91664),
+    'ID_Continue': (91664, 97712),
+    'ID_Start': (97712, 102896),
+    'Ideographic': (102896, 103048),
+    'Join_Control': (103048, 103056),
+    'Logical_Order_Exception': (103056, 103112),
+    'Lowercase': (103112, 108456),
+    'Math': (108456, 109560),
+    'Noncharacter_Code_Point': (109560, 109704),
+    'Pattern_Syntax': (109704, 109928),
+    'Pattern_White_Space': (109928, 109968),
+    'Prepended_Concatenation_Mark': (109968, 110024),
+    'Quotation_Mark': (110024, 110128),
+    'Radical': (110128, 110152),
+    'Regional_Indicator': (110152, 110160),
+    'Sentence_Terminal': (110160, 110792),
+    'Soft_Dotted': (110792, 111048),
+    'Terminal_Punctuation': (111048, 111904),
+    'Unified_Ideograph': (111904, 112024),
+    'Uppercase': (112024, 117232),
+    'Variation_Selector': (117232, 117264),
+    'White_Space': (117264, 117344),
+    'XID_Continue': (117344, 123448),
+    'XID_Start': (123448, 128688),
+})
+
+_case_folding = (128688, 140320)
+
+script_aliases = {
+    'Adlm': 'Adlam',
+    'Aghb': 'Caucasian_Albanian',
+    'Ahom': 'Ahom',
+    'Arab': 'Arabic',
+    'Armi': 'Imperial_Aramaic',
+    'Armn': 'Armenian',
+    'Avst': 'Avestan',
+    'Bali': 'Balinese',
+    'Bamu': 'Bamum',
+    'Bass': 'Bassa_Vah',
+    'Batk': 'Batak',
+    'Beng': 'Bengali',
+    'Bhks': 'Bhaiksuki',
+    'Bopo': 'Bopomofo',
+    'Brah': 'Brahmi',
+    'Brai': 'Braille',
+    'Bugi': 'Buginese',
+    'Buhd': 'Buhid',
+    'Cakm': 'Chakma',
+    'Cans': 'Canadian_Aboriginal',
+    'Cari': 'Carian',
+    'Cham': 'Cham',
+    'Cher': 'Cherokee',
+    'Chrs': 'Chorasmian',
+    'Copt': 'Coptic',
+    'Cpmn': 'Cypro_Minoan',
+    'Cprt': 'Cypriot',
+    'Cyrl': 'Cyrillic',
+    'Deva': 'Devanagari',
+    'Diak': 'Dives_Akuru',
+    'Dogr': 'Dogra',
+    'Dsrt': 'Deseret',
+    'Dupl': 'Duployan',
+    'Egyp': 'Egyptian_Hieroglyphs',
+    'Elba': 'Elbasan',
+    'Elym': 'Elymaic',
+    'Ethi': 'Ethiopic',
+    'Geor': 'Georgian',
+    'Glag': 'Glagolitic',
+    'Gong': 'Gunjala_Gondi',
+    'Gonm': 'Masaram_Gondi',
+    'Goth': 'Gothic',
+    'Gran': 'Grantha',
+    'Grek': 'Greek',
+    'Gujr': 'Gujarati',
+    'Guru': 'Gurmukhi',
+    'Hang': 'Hangul',
+    'Hani': 'Han',
+    'Hano': 'Hanunoo',
+    'Hatr': 'Hatran',
+    'Hebr': 'Hebrew',
+    'Hira': 'Hiragana',
+    'Hluw': 'Anatolian_Hieroglyphs',
+    'Hmng': 'Pahawh_Hmong',
+    'Hmnp': 'Nyiakeng_Puachue_Hmong',
+    'Hrkt': 'Katakana_Or_Hiragana',
+    'Hung': 'Old_Hungarian',
+    'Ital': 'Old_Italic',
+    'Java': 'Javanese',
+    'Kali': 'Kayah_Li',
+    'Kana': 'Katakana',
+    'Khar': 'Kharoshthi',
+    'Khmr': 'Khmer',
+    'Khoj': 'Khojki',
+    'Kits': 'Khitan_Small_Script',
+    'Knda': 'Kannada',
+    'Kthi': 'Kaithi',
+    'Lana': 'Tai_Tham',
+    'Laoo': 'Lao',
+    'Latn': 'Latin',
+    'Lepc': 'Lepcha',
+    'Limb': 'Limbu',
+    'Lina': 'Linear_A',
+    'Linb': 'Linear_B',
+    'Lisu': 'Lisu',
+    'Lyci': 'Lycian',
+    'Lydi': 'Lydian',
+    'Mahj': 'Mahajani',
+    'Maka': 'Makasar',
+    'Mand': 'Mandaic',
+    'Mani': 'Manichaean',
+    'Marc': 'Marchen',
+    'Medf': 'Medefaidrin',
+    'Mend': 'Mende_Kikakui',
+    'Merc': 'Meroitic_Cursive',
+    'Mero': 'Meroitic_Hieroglyphs',
+    'Mlym': 'Malayalam',
+    'Modi': 'Modi',
+    'Mong': 'Mongolian',
+    'Mroo': 'Mro',
+    'Mtei': 'Meetei_Mayek',
+    'Mult': 'Multani',
+    'Mymr': 'Myanmar',
+    'Nand': 'Nandinagari',
+    'Narb': 'Old_North_Arabian',
+    'Nbat': 'Nabataean',
+    'Newa': 'Newa',
+    'Nkoo': 'Nko',
+    'Nshu': 'Nushu',
+    'Ogam': 'Ogham',
+    'Olck': 'Ol_Chiki',
+    'Orkh': 'Old_Turkic',
+    'Orya': 'Oriya',
+    'Osge': 'Osage',
+    'Osma': 'Osmanya',
+    'Ougr': 'Old_Uyghur',
+    'Palm': 'Palmyrene',
+    'Pauc': 'Pau_Cin_Hau',
+    'Perm': 'Old_Permic',
+    'Phag': 'Phags_Pa',
+    'Phli': 'Inscriptional_Pahlavi',
+    'Phlp': 'Psalter_Pahlavi',
+    'Phnx': 'Phoenician',
+    'Plrd': 'Miao',
+    'Prti': 'Inscriptional_Parthian',
+    'Qaac': 'Coptic',
+    'Qaai': 'Inherited',
+    'Rjng': 'Rejang',
+    'Rohg': 'Hanifi_Rohingya',
+    'Runr': 'Runic',
+    'Samr': 'Samaritan',
+    'Sarb': 'Old_South_Arabian',
+    'Saur': 'Saurashtra',
+    'Sgnw': 'SignWriting',
+    'Shaw': 'Shavian',
+    'Shrd': 'Sharada',
+    'Sidd': 'Siddham',
+    'Sind': 'Khudawadi',
+    'Sinh': 'Sinhala',
+    'Sogd': 'Sogdian',
+    'Sogo': 'Old_Sogdian',
+    'Sora': 'Sora_Sompeng',
+    'Soyo': 'Soyombo',
+    'Sund': 'Sundanese',
+    'Sylo': 'Syloti_Nagri',
+    'Syrc': 'Syriac',
+    'Tagb': 'Tagbanwa',
+    'Takr': 'Takri',
+    'Tale': 'Tai_Le',
+    'Talu': 'New_Tai_Lue',
+    'Taml': 'Tamil',
+    'Tang': 'Tangut',
+    'Tavt': 'Tai_Viet',
+    'Telu': 'Telugu',
+    'Tfng': 'Tifinagh',
+    'Tglg': 'Tagalog',
+    'Thaa': 'Thaana',
+    'Thai': 'Thai',
+    'Tibt': 'Tibetan',
+    'Tirh': 'Tirhuta',
+    'Tnsa': 'Tangsa',
+    'Toto': 'Toto',
+    'Ugar': 'Ugaritic',
+    'Vaii': 'Vai',
+    'Vith': 'Vithkuqi',
+    'Wara': 'Warang_Citi',
+    'Wcho': 'Wancho',
+    'Xpeo': 'Old_Persian',
+    'Xsux': 'Cuneiform',
+    'Yezi': 'Yezidi',
+    'Yiii': 'Yi',
+    'Zanb': 'Zanabazar_Square',
+    'Zinh': 'Inherited',
+    'Zyyy': 'Common',
+    'Zzzz': 'Unknown',
+}
+
+property_aliases = {
+    'AHex': 'ASCII_Hex_Digit',
+    'Alpha': 'Alphabetic',
+    'Bidi_C': 'Bidi_Control',
+    'CI': 'Case_Ignorable',
+    'CWCF': 'Changes_When_Casefolded',
+    'CWCM': 'Changes_When_Casemapped',
+    'CWL': 'Changes_When_Lowercased',
+    'CWT': 'Changes_When_Titlecased',
+    'CWU': 'Changes_When_Uppercased',
+    'Cased': 'Cased',
+    'DI': 'Default_Ignorable_Code_Point',
+    'Dash': 'Dash',
+    'Dep': 'Deprecated',
+    'Dia': 'Diacritic',
+    'Ext': 'Extender',
+    'Gr_Base': 'Grapheme_Base',
+    'Gr_Ext': 'Grapheme_Extend',
+    'Hex': 'Hex_Digit',
+    'Hyphen': 'Hyphen',
+    'IDC': 'ID_Continue',
+    'IDS': 'ID_Start',
+    'IDSB': 'IDS_Binary_Operator',
+    'IDST': 'IDS_Trinary_Operator',
+    'Ideo': 'Ideographic',
+    'Join_C': 'Join_Control',
+    'LOE': 'Logical_Order_Exception',
+    'Lower': 'Lowercase',
+    'Math': 'Math',
+    'NChar': 'Noncharacter_Code_Point',
+    'PCM': 'Prepended_Concatenation_Mark',
+    'Pat_Syn': 'Pattern_Syntax',
+    'Pat_WS': 'Pattern_White_Space',
+    'QMark': 'Quotation_Mark',
+    'RI': 'Regional_Indicator',
+    'Radical': 'Radical',
+    'SD': 'Soft_Dotted',
+    'STerm': 'Sentence_Terminal',
+    'Space': 'White_Space',
+    'Term': 'Terminal_Punctuation',
+    'UIdeo': 'Unified_Ideograph',
+    'Upper': 'Uppercase',
+    'VS': 'Variation_Selector',
+    'WSpace': 'White_Space',
+    'XIDC': 'XID_Continue',
+    'XIDS': 'XID_Start',
+}
+
+_data = (
+    'c-rjU2Yim_*TC`nF>3FvMiezm>=ndbMW`7o_9~)g2Og_7L0h$>TC>&A8Z|?0rJ*fqhN4<jYO'
+    'l!qyWHoJ+wFNWR9pSO`F!5*$NQ%u<9Y7uy3RS*Ifh{v9vFr|e1R1(UgH0d4cT!Lr;sX<VWdV'
+    'tV#An*v-kxmGxKLi#s^D{f+z|<bVe8WBjO<+JHjyT;sG|Lb{Lzn9|z!B(qWWC;6{h>Df%6B8'
+    '1KSiq%`8e15ON%Zy4{uiBXt<iI{}R_yh~#nb0tbp*dP&0wy5<Q?VN%xP+^?nb7>&QzkOM)_S'
+    'OqRS3p?grf*wvnMLU8?Dh6?cj%=@W+(Ik>9J2F)E2+jK(BP!BkAgQY^zttio4VgZ0>m9oU6E'
+    '*oW_N1V?cKr*InQZ~+l;BsGi#NQh)eg)~Tq0w{=LD2|dSg)%6M^6)}MR6;e>LLJmY12jTov_'
+    'u=UMLTrCAPmPSjK*Y4!8A<AQY^zttisn=jrG`wo!EuF*oOlM!9j%L94_D*?!rjM*NX&5h!jY'
+    'LG)RX6D2QSxj*=*a^6)|p)IuH9LjyEL3$#XCv_mI!!C;KQD2&DgOvY49!$+8j*_ea5n1?_t#'
+    'AjH7<ye9B*o<$n6ML{12M~gTID(_Nfcr3#^K~L6(jYAgpdiY_3pG#^bx;=#&=k$l0<F*nZQ+'
+    'Mb=mLKX!X!+_R7}HCEW_7WjrG`w9oUII*oy=B2}f`erxA*CxPUPHiR&;@@P9~&G)RjYsEInL'
+    '3m-H=Cv<@m!!Zh@F$1%(3SVI(HeoY@u?u^#58vY_9L5nGMJO&H4A*cIj+BN`0hQ4j!!Z)0Fd'
+    'FY;0w&^9e1=6>jLitf4(!A(?8X6v;22II6h<n;sEs=4g}(S0GqDMqu^$I;97bwBCU#*r_TvC'
+    'TP$w<lFEoG;nxh3;!WV7fhjAE>$q2wotil?s!xjW%E4E=LcH;<+B27AePRNMNXoWTy0w-o65'
+    'Vvp#4`HO|eUOpg$6Xki`1{C-GVn$d_@Nhiqc7e<e>iapq4*tPxCeuECo4SgHk??FAl!nHg?|'
+    'GcC=5?{!5dXj9lha?0dV4T1Ys{ia2%(QEvsSVKs)$h2!>%i0x%1KSb-pX594Ll5cpsioVbAp'
+    'D4UJf80w-v#vuS3unD^ng8MMC^Zm-nmx~<mKuy#}1Nfi?TEZ8t&>C&f7VR(;POQcn?7&X^h{'
+    'HI6lL*5#+{7(J<TN)5dM$qo{V@drn2SJcMF{>>n~Ge#HxPh)dH8;#9{kY1kYNnON0@;dg?UZ'
+    'j)z|oMksq(22t3gZeb5)fFav>Dj3xLIL0F4**n(i}!ft$z5FEi#oJJ_x7UBDWS(uF*FpBcMK'
+    'o}mt@Z@tx70kd)7{yp;;E7_Gf&iRD7;+Zp+l5J=^846@5ENd-$HE;Li+LU)1c&ege#B2WhHH'
+    '3j3I7Jl!yAL)#7-Q*F@&PYQhvS|0w)gOdmO_lM8H_a`wZS_03Z0GHNM4h+=gShVI)Elq(T~G'
+    'f(P;;KZ?Q=Z^9pcAPo0le9rUm2tN<(!ah8Jag_JjJ^p(fgK?jK2kDR**--{%Q4y6;8Q!RhYN'
+    '&yl_!d7PAe?mxyYW3j5QePmGd=JInxHGX;Z68s00tubVdS3Ffi2jE-Pnr|9Kul?!%2kVS6sw'
+    'Z*~>nRP@854OR|II%wgn1epG-LDxoqOzz1#N#C;eJhY=r%P!eS@1p%0gKrBEA9>N)q-$x)0A'
+    '`}n62Ql*CHPnL--h~tMFdy5o8;4;e;P(-TWeCELIEn`_67n^`6P?fp@8Ug7z(h>P2lxmx@Cg'
+    '=T6~4lHY``WMFY&b{av0ud20wIz6YpaTR$>)4z)0*cUP59dK~j`P8I*$;Dxxx)p*iMbF@g|^'
+    '>$rhixQ}c}97ax*M`d`!iFMeB5FA2+qz?AY{7jG>>5&1Mkp-nu78Ot#b>M@R@IxSi@hdLjHj'
+    'HHaJ(NQ;v_L-$#x%^tTr5QpjO2V=IPn#NaUJ)NKLtM*l!sqRhcOIJEW>iFKoC~JNX35-Px!('
+    'g;}L}K5Q^I{IDa)jV+_PFd}}$Ih2S@Y;U0`M4x<!Gqc(gn2u_6J3~s_m>oC$H9V)|#F&K++7'
+    '>~)Af_a#aWeCD0gy9~Hbo^Y95GjxfX^;*DP!PpX93@c-<xv4OPz!ZX4-MdhMre)}XoF7Zf?n'
+    '{)02t{VMr*V|2RN}CAvmV~cLs;C2J3JNMn?WU_`nx_=mjU%BN%&OWO5iUBRdMi6SZJu=CzGL'
+    'Tt@^FW#K)5q)3kR$bd}9jM6BBa;Sh>@PRJ^u>{L-6vuELMpk}q@WDa^;Vz79{98zhGAN6h@I'
+    'f#5BLLH|1WU0NMs_|=Bt}vsLm8Au1$dznDx)@h;0r%=L05D~4@^M-reQi}A`r_EnuE_1K{<I'
+    '|AQ;yWfmylvJo50Yf<FepiRyXzct!bs!tit$MN3A;8jR|EziRSpH~x1Io(X6NKlDIvY(X&gA'
+    '_RXR47XtP<og33_@Wg$pd$uj2m;{U+hNRx(TCR{8e%M_AP}KAk1$+=;qNf+jN#X@Jg+D6>m+'
+    '_I2>X&}8gAkN!Vv)@$YJDO$>)JL&<Wk(j|Z#x^NkLpC;Tx4PK-kUW?_!RT#WA>MiF?T7JRTB'
+    'EI`IB7zbJ3Pym-;9OCOoC~m;`f%g>r@HUJe9Y#|$!(7ZmAU?rDe1^qXiZ8GN>#+eFu?gF;12'
+    '6r=YYfSd0vV7I*^vX~Q2~|VjT)$lTBwUgXpBXNdF|r6BRtzM@fbfF1Y!Y#V4P;HfDy{SiNwf'
+    ')m+=a6BQIV>AsA;^d*O*n@J3xUfDZ!BI*cz7jC+WH@eAL#Us)$`5tnfVR}qE?7#I24u?t6F{'
+    'N^xThYx(w7Jle^*<q}P;|l*ij6Zl@A|X7G3%QX8d65tKQ2-@S5@k^i<xv4%sETT+h1#ftx~P'
+    'ZOQ6D~Ngg4LxP0<`J&=S6Ah1O_;wrB@Gv`0sDLT7YEPrQkK=#Rm88$&P@!{EetOu!s0z^C{O'
+    '%di|95r%6p!g$WY6CWTDUt%SKu@xaWh+8oJ<h6(kh=0vtq=px~Q3pO~3_o;%ah>PuEr)RuR}'
+    'hA97`OQv;Ka`e#bt!yPZ)Q2rXw|K!w0_b!&n4h1%j{&#$CS0_xN-4hCc>iFowX1F$lmH2*L&'
+    'gV<$pz457G)Fx-Z5pJy#Tz&?cG9t<O%5xOWI=aqOyxwY{OZ{%1P&+xz}2jUq)ICF_Vzr*j}<'
+    '5wd-Yi#_dVzw%v66P=i9uFhTK*qy})cl%;_ZYw2HJ<)6&J60$+Vji1SdBF}joY|mZoAbM+K?'
+    '@<AzN3q-85tyX|Sa;WDBOYRR-H8L$*eSY-J4DVyNZbkY(JE<=Bwr(s<ci9@SE3uml+_Ife&v'
+    ';T6d8W3b#9uOc7vqW}t`5DMcp6oD*9Mllpe38*Eh6iTBE%Aq_ezzY>o36<fEDyWKT=2B+VfL'
+    'hLKp*HHG9$rU%G(bc6pb;A54KzVhG(&T=Kuh?d6<VVW+M*r&&>kJo5uMN(UC`BBPL1x6CDM2'
+    'ky&y}VTHcJlcnkf|9|JHDgD@EH;9b0jAsC9`7>Q9BjrYwZ(ijJ|Oiso$Ovi`#2s1GU^DrL^@'
+    'Cg>;Q+$R+Sc0WkhR^W@R+vkx!7^%mjn!C#wfF`bunED~iCx%(z4#9Mall+w4Ou=7StixeXs{'
+    'd^EJX&(kZ}}0LoGkYaRR5zrO1#a#*k&hIEVAN09hu~(qR0KOJFH5WEn87nvXN}h%#>ACT^LJ'
+    '5<}kl#sh@oAtKDTz2QJS#76=o#7jto#7KgqNQUG{fs{yv)JTK0NQd;ufQ-n5%*cYQcp2G{9X'
+    'XH_9>|4PkQ;fB7q228@}mF>q7Vw>H55Tnc%m4JqXf#s3l&irRZtbxPz$wD2X#>oucJO1pdmi'
+    'MhX_L7_`Gh>5B)I+Dkt?Wh9Uq{@j1Rn2oB*V9L3K#hT}MalQ@Ob2*nwk#V<IA^SFRtaS^}ac'
+    'U;0{T)`i>iW|6zTeyR}xQ}p^4@<!N7VXgi9nlG$(FI-64c*ZLJ@F=bp*Q-#AARu_`k_AtU?2'
+    'uzFy6*Hco*+s2!>)9oEVM~n1G3xgvpqK08GU+OveZK5FcR%KE_PU!fedJT+G9K1Y!X`!9skB'
+    '&#(xKu>?!849oF3zQ786i6E@RDtv{nu^MZz7VGd0)?))UViPuF3xcr?-(ov<U?+BAH}+sJ_T'
+    'fA1#{q=kAP(UN{D_}$7)NjvKjRpV;{;CP6iy=)XK)t3;2h550)E9s{D$9g372sNf8Z*@@F%X'
+    '}I&R=5Zs9iW;4bdrJ{}+(4-o+)A<qlMLwqDaLcD}TNQ@*%ieyNR6iA6wNR2c|i*!hj49JK~$'
+    'c!w=ikFcM*^vV|;elLu1-X$2dGRXpAwLSBAPS){UPBQSO=#wd{V*<}nM=8kaM_;d9EMY3^eP'
+    'r#7(Fo<Z(}wbIr#b!9|@2UFCh^UBMFis8ImIfQX&;nBMs6b9nvEMG9nW)BMY+PWn@Ek<Ume%'
+    'AQxUiZsb8;yo!9tj{+!&LMV*aPy|KciDD>@5-5pMD2*~Gi*hKB3h+WjR6=EVqYA2`8mglPYN'
+    '8fuqYmn#9$rU%G(bc6pb;A54KzVhG(&T=Kuh?d6<VVW+M*r&&>kJo5uMN(UC<TX&>cO{6K|p'
+    'ydZQ2g(HC!_ANpee24WBf<88cyckv#EU?_&ciQyQ5kr;*1cpqah7UM7;6EG2zFd0)2fT@^<>'
+    'G%L2Vjkur5DV}L7UENUhDBJ6C0L4OSdP!}1y<lo1Ysps;VXQN)mVeISch-09viR`o3I&M5R9'
+    '$ZhHtSQJFpYGup4`@7yIxX_TvD)M+gq$5Praq_z8z`1V`~Rj^Q{?;3Q7rG(vF(XYmWp;XE$j'
+    'S6swz_#KyU8CUQJt|AP7;u@~w25#aOZsQK_;vVkf0mAVR5$gS$llN#&GY6+~Z~5VgvhbE%oX'
+    ')}dp&R@yIk&M0z{d#05(HUtaqF-dTd>WNo7;^LOOEa+LUGZSqq~Eoxp=l9B~l|D(xWImQ4*z'
+    '44&~v6N~nptXn=+oh0*Ho6y|F|dvri&bVWCGM-TMGo9KnUcnke700Z$JhGPUqViZQ>eT>0aj'
+    'Kg?Lz(h>KWK2N-reYeV;{$w%k1zutV<u){Hs)Y1=3zbpu>hZ7AwI=tScJt`f~8o7<@g+5U<J'
+    'NJ5LRLpzQWg7jWt+{b@&GBu>l*g37fG6!Ptsz_!ir-13R$`yRip*u@B#2KMvq~gy0|!;RpPP'
+    'pKusQa1=k|7>?rvPT~|!BNS(F7Qf&;F5?RRz*Sr?Z02B%*Iegdt1RNVj%uim8mNg{sEs<Pi+'
+    'Xq+_0a$g;e$qKj5p8(P0<X^(E=^ui&kijHfW1>@I!laKu2^!XLLbVbVGOaKu^4hUg(YC7=e)'
+    '(h0%B)V=xxuFdh>y5tA?(QxJfun1<>203YHb%)rN(iCLJ9Imo@3br*T@D)J#e3ZNhgp|Hy9q'
+    '6mtjI7*--N})8$pe)LvJSxBo6;TP5;f*S&ifX8i8mNg{sEs<Pi+Xq+_0a$g;e$qKj5p8(P0<'
+    'X^(E=^ui&kijHfW1>@I!laKu2^!XLLbVbVGOaKu^4hUg(WJ@JC;~jd$=a-op?KgA>Cs0wXaB'
+    'qwzk*U@RtL5+-8`reYeV<0H(#$C!y(n2kA@i+PxjKrFx~Scp&Y85UtNmS8EC;Y$QzHP&D)*5'
+    'Mnh#|CV~CTzwQ1Y;|<;ahCSZtTHcsR20Xq6XkFj^HSMmYRTDxQ%<bzu3&dw}KzKOD;Zm`O~@'
+    'eDiQp5$e+Mr_*inh(dBG)&M`Q%!w7|6Z-?PT)*l^4Ni?v;_Pb#O=3q?}G5iqxjsz03FDo(mH'
+    '}O6Ku^vC-4<tV9FkXQdn!z9A51TRkZ8(k-IEx3!aKvF`L^hO0L-?Q>{4oyW5rAd*7Td8G`;M'
+    '470Tpmbie!=lc;z>TQ61{+zYRNa2%$KS%eaC+a5bJ86Br;hswyU+YEOOP{SrS5oX4-Yk%*ru'
+    '?n!NF*2L`Xkq3E^9|f=nd(k%u>nm!e<UMYwEqfqml_QyWy`WlVo(EW*mDeu@b7mQu&Gnfj7='
+    '5LtXBeE8njW=w4=rrg-uR<v5ngjh=*hVT#ZVd*;Dx!Ej|YfAhCud9xbrFdC?w|@nF7P$lxOB'
+    'VWa72#VR<H~_x3ocfw_r0@|ssQEg`soU*W%u{~jlC3fFN{)wEdN6Ft=Xg4cdu%tIjD)f{;D<'
+    'mZg(mYm#K{DO0R+~?lPNY1C8<YxF34D~i#j}3+yBitx4!tIX8Sdz8&__{j7z7+WysfXV1M_>'
+    'GipKus|APn~qjtCf1o1F$};VHGti?C8^nD^om3|>narFOZct!8;F#!2mRpuF}H@R}=+il_u1'
+    'G(rn>kk{n!XQ*x7gv~f0HO<yq=CcUHH9SCgl4q}Fw$~`Xg#ph{o4g5|ZMDc}r3U$4(%9D?S4'
+    '1USjd2I`#akHpoNJ7AEpftVYKJSLlA9Xg4sc>PM#r#5coR0;YJtyMYJd~Cr~$5kil~GJXec$'
+    'n&Cw1W@Q&01$Fv4mrJstSI7-4hrTHw4O>OT=tispWWUKYH*7Q2yZL94ai%C+$TL_im4IeavF'
+    'WRC#I-oPUqBr_t07hUkrbuk+->msnwY~vxr046)$T|ThhGVwW`d-4HmYUzRQuA9}YJMBLsQF'
+    'd3zF*@6PG&M|d-a;8YkWsz43=V<o0?yrXli>6*2YZmKvN`qnb!qsNX_m@EWio`VLdLuU@grf'
+    'HM>6W&1SB#zu^l0zzy8QZQPR@UVZk~HLcF)RLiQ?;zY6rSG3fss<k)}3vgf7WLLGTfe4n`Ri'
+    'ijc^1tizYlFx&e3I0#s<qts%v{S;!vh5unYFFz%+&{hxUk6FlLyG2^^WXW<1I0a_;?A4kPOL'
+    '@TWVbUV+6j&HQd2{JU}=ikd(FmRd}Kn{G|4E6uv?z&dVMl4EHQGumz+Bwi>GAb@(ld+)E6?J'
+    '9rmE5rmakh1FP#Z?GA`*otkI8d|j%3B@H`lRZgHYiiZr{g<d}XzxB*L#t|Lb08-QpkOR&Xje'
+    '%MZKZHt!{JZX(yAKT2jNfG%65r(dM_1|n%QTqjkVXhssz7>)VNkbRn(PQ*MXK=*Fa0HYe;<a'
+    '%rnnLO{=?_)Y#UZ`e6{9QiE!*Jyit=8Q~$dr@H2JGlHc!!GY9nYE4y5=@2+ES87XlV-L<-YD'
+    '>MPw$x8*OPx|%s%uGA;X|Gjk+q`M8qw^?XQ>sfDYc>_q*io?rB*b4YR+xwi+&g&HKQXDWT_R'
+    '6pN5Z#>ZpNQmRiw%7$`NPBk>isVh4`lI8NZCt%kI43~NZ2N)74hw6U)lt%ypN8c|gn+Chp#N'
+    '}(3&p`E2BGzi<V6T75FRMm!liK93nMJ1l7E;XX6CUiO0;Tua$sJEpSv~Ub-Ks`|z-l&4Aw%X'
+    '5wID@nJ1?Qxw#erlff%2#zHKC2r8sjk+^W4;k7KJye;4P^QbyW*m3^h^9P0i<cd@Qw|s>buW'
+    'rN&bg*{Ir1Yc1!WmRe4CHJtuZyQyn7RUwL}i`q<Glj(y-QPf`k)f!73Q_!`7sy48p)CR7Q+Q'
+    '7?aV_p*&SL0{a_&sZl+77AN*)26Y`=n+^%K6;pY&K#OzQcYzKsc)Kky{}ca^>Ywty)}-T3n6'
+    'VzgeTUQEJpw>}iM8sO^>-wS6yGjoP)i8ntJxQS*=gWNq3&sZARuy%OHX7>sq%GeOs^>D~$dX'
+    '6@ST7rb_Dd|d5XT<zKmRJ*2ooCLb*4WRGhTkn<!t2(wEaW!jkHEVG-YyaytYr1EIy=G1Kj)<'
+    'yfgteA!ot%Ak%h~6s^o&roXjh~LO`V0}<>GmQL`dwSCM^RpA`5aL5Axzw)hhz|Q2+%|#8SJa'
+    'YSp|^Lu%GWO0Akv`1#bT4UMZ+d!cI8F4=0;u1T$$>Y?#ptVwhJ!!>EIERL&5i%m`1v(}<bu+'
+    '^dk{6}liLZlYWUVC;^YR_^-@N-xBoCJ<XwPd<yh<`M_L39rb)zd)LlBv7!s+LRz7p%2p)*7;'
+    'y-W6YCt0{}>j(FJ^-Vu*&Et<MZzEx__?jJU5&q_(nSs$r2TWYB>Q$Y|_Qx-poSzA*9UQ%0A1'
+    '$9s#4W!m)L=v-ipsJPGYU>5K-_i>(zV!T4J^QL)r1aoZH7i@O$I?@8KjKNxJXM2I8Q!R3>xE'
+    'Yz&7~Kf>QNVrtuA`i?YH!(bEujQRFNKZBQQ#8K(-)QddBUt^o;w?(lahz3bQ6e)qYg5^@6J}'
+    'H6Sf8LVCcdo^FRMz1&m}w;Ss3OAW>_I8&K57q6ihilZ#bp#myO4MqzWwHG5X8e=d?YA*sX3v'
+    '-b{dYP3(DXhU-Y{pLP!XD(#!t)meEWOBzqXfz!OIFTFQj5?G&Cvqw(E%ON8NJXC30^j97D}N'
+    'sD!>aBQ5DssmSKdYmf;gD!V)aQa{P*m_#Id92d?6p^eR)e4uw$?rEvylrMBS?ig@z1c$zu<y'
+    'vT?A(yL16^0%Y$QnOdpNXgZIjWt-0jo6H>D7uWF5lWyG>Pycmm6LxDLnJq^a_pD!2g0QG@76'
+    'LihkhOxa1p=Z5-#J4%CDz(7!JfsZRRpZSaO$NVJ*Hv;WQ58HB0Vtge6zG23sU&c>v$1F>{ke'
+    'Q5+>v3Z)T>Ul31v*r?p1H>$YlO{06#bda7jD(6@h-l&Qis3|$euka1lV*|EeE4HOKbC0W}H_'
+    'b+D#+D3b4zdI)pdu=vGCs!_Sb-p{!CH7^;(3KvkuQ^(lPrp|D3{sHJz9IvR753PF0z{BAb-R'
+    'Ogh~!l^`a>!xyR;ci5d7ftC?H$L?u*~UNg(E607hvR%bJFhf}0i%!l|0GjKD9gL9IZ(;I8)t'
+    '<w3R!{~}$2hAR{V<o1ynfKHdob=!|j<Yzgde^d->bK}o+UQY?btM0-`a7zJ>}G61Ft*}bY{y'
+    'RQk{+|EU*df&HJyHzn$E-0Tlci3Cipk}E;XLkTF!cwT258Nc|&^9K1^iRa=NP>E+RFat)&NT'
+    'pwtrU-o5dqwo|V`6<w@B)>_X_QtLTFded%_HED;eMF*sIQ}v>KXz4{8-_ldIN;ExX{Vg?`1E'
+    'rVjNa+o`N!BvmBX*ChWe21d^PJRT>YlLiq{nMT+ZtCx);8ViwYk(@c9Pz%BQ0y)e(A-kdaml'
+    'VEur*S)wPmUqUg2SL3*nWm$h)C)I{pFaHp(=-%0P(v(hV7^+t_nsfDZ}y;18+O=Jh@i8@@?L'
+    'fzx^kgdn5wdS#c)Q&fFQOl@%lxAkF%!*PdjWQ^Uawso7O7)sL8t+?b8?C)dcVbtnsMp-evgT'
+    'TAAFZ{H_O*Aithw`2n>|PU(wQ}d8KkDLq|_8PvGfl8I*K*<N2xJXy+xB{j_hTf+C`0_>LF@f'
+    '!>wz#>M5#f3H2JD&9;W?o}up6a@|YRDZNAWvq<+4O(3<2QLXho(O-Iuj&QTquaFwXsMdVzT3'
+    '=Rrkp6%lEo;B4TE{z5>!|J&sMxaV1!{kms@|Yi<t#r;Y9LiFPNN9tQBQL(p?Yl2_B3k=)w8!'
+    'hhRR(5Ra+Q_Ym40166!rj;U#7d&F#`NGgN8{RSlsbHH1Z^hOn{p&KxN<gs%1`=jHB!sv)%RQ'
+    'OekA3hP_;Dlx4g)O(p*(u>o+hq)rXHg(OP@sQW4^t$v^HG0w`QuTy96VI%PQ#~M6ZJE8NVQO'
+    '0sLvN`iQ#}h+jhN~&sCo&0k<zRMYb3Q`@285~JE<D5TJX2kf(?^Bm31$*0o$afpekn2wPAXX'
+    'RZ42Y`b!VN5tcpH9_*JrR!ADxd#tjkBs~UCTlQR+q-Y|Z^a8AC*?ZZ0{khs>samhLQtK7fUQ'
+    '5+}t&(1V*1gtNsr^#D0bT96sz?o(yS<mH4O2Y=pW1_EdU6j|A+y>0Pw%}d%bu&c?74LBKfU)'
+    '-wP4oTuX0lRRT;IUH((>no=n$*>Al&ktmfWK_XyN`G;d39Kv#P;)hn=A6ukj;jaY3<4?ydlP'
+    'SuF1+Ay`ZQ$6@@_AqO@%JejQ>iI}dz3FmiNA=X3yU}6HchTEU?E!npjDe9Djfq%>6{vcM*TE'
+    'sP*r5z6pce*UAVy)dtKM-j>=~ze#i_ePE2KA^s{IN>i1d0>ch1zEBHcSnm2a0f%spfe%N?L#'
+    'x!co)y_Ubs08n>ly2xHi^~w)RYWA-8mmczA$s&8b>z?eYx4OTj7rGC70bfhcau3$>f~m|q3w'
+    '14LVBM2Dwe;eyDYf^iclNO?=9*^hk*#`R`&w%1y`=}XuBF#C<ss7JSUszg%H6MHmYQze!&vt'
+    'oP94F&uj-Per>*Xh+C`pGx_7DSS?Vp%5>;!edyM+<9`?2L_S8K*b<a-KqqBS_^DgA?nIn5_s'
+    '@|Bs*&=&d>Ry$)hotTuse42okU|>WBQQ*Q0_vWAy7$^2a(BW{avkbU{<vIbt$$+V@-)}XvT_'
+    'ISf~<|+tN{ZYPu57Qp1=on?_cSWxr%S?*Z4;6s%^v;+~BoyFNt{vX|TLjuB-o_*T}HsX6&V%'
+    'yjI>$VZJ6xqPz5f*S*<~N$+$u`=hV)41Y)N7><WeF7s<sU(@(pW^eF0_#H-G_Wt<{;{$}VS9'
+    'qxMD#Z-rqhe-n?SiNcA2fm=oEVRl2rh2+&MvL?2GUzueNW!TcuaJdYozL(>><6ATSzVU+fvJ'
+    '|dkNpS)Np5$UctI{TlWk$WDTt&wc5j^Ry$C70EZ<td;a=K&tIpd*Y7<k_|v_7buG49bDK)-w'
+    'd&QYdh@E+vhJ;`UW;Ct%-5po73(WKT2)WfpK?a_B2{;GXY`Kj(W!fLs-BYSS)+PKevU5?gq4'
+    '<Fl0{Hd_muq8VWdDi^$bE~euh=h1Wi$bJxD3khYu?AUi6N5)K)-k?~L&>gGHa2)l2|&cjzUa'
+    '8HqBRvtu$M6aR5$WW~!U4=;G53fdGgd$(ufHJ@E#PsJ>EU5Y(4KbID0iH_)m6nriz@rCqAF2'
+    'JWy5N*&FLogH-crAOOVk$F+I47eyyPzhYTP+NgyRws|2Y!;={P>X!$x#r6(4E(A5A?*F=!M?'
+    's1Ap|zTj+=W7?96=&F{o6{ECbC4Zq_OF5?RRz*U4{6ko__ypJ&$i*Xo_37CjUn2ae1z*J1bb'
+    'bNph@eyX=W6Z?QIELdmfp9!TZoc<<kQc8aAM&Gs+QXw6nxh3;!WXU3T7Gs(_!%WdG9*U|q(m'
+    'yDMjE75_lJ=YnUEP-kQFa`nm_v-@bEP6uvA87e#Ti)8f8!x<xn0K;Dw5)q+XlwMio>=HB?6p'
+    ')J7fnq7_=B4cej|lJFWzii)U&HfRe!v`0sDiZJi~s%L5zUL#qN9XU`Q6%e2AMFMr78ZRL!k|'
+    '70BB0F**7hWl1-YNcEjlA$MKjzEwF>}HL<>X_>EAr&WP9h&WxqR$w^07VSW2+RpJaUcv@}4M'
+    'Urqv(6clF-GOTF(6v(~w_ymuDh6LX}2u|#@wu9LMy)j|)I8bn=t=xgb<H9m^i*>#!8l!QG_G'
+    '9*{CnIx8`XH$8|UZ}U_j<mW9t!6mgmb>+OR+FC5q+(cluhduW7OPm*K$%^n_DX*yHD}-qmfV'
+    'H9>v}_G!>HJa-W#deFbQ}@q(gdSu*5_{@DqNP*)4VDuBYlPrta*k*o9g%d&}KPbyrfY`K4qg'
+    'ii%C>JN?IH)`@;rs#t}ZU843{IphwbnmwZL{HqxxYLC?(LuB^I1G&4XW{!AEPXMRXg6+1P@z'
+    'papv%IGA!&6>c>NTsM`PJoF*cfkE)_`^%<}44rW*gEwps&1;;>l}0iM-a6%WK{K%+DsTeGhr'
+    '2=-vbNwV*1h!3T}e6b@dj3FIzhCAs^kdJ;U8yNfC0?qWYnY+;zh6x3{v{xWMr&DaQWaR;%8+'
+    '&ye3cMrG9%#BlW_pr6xDLf^20mI}jpw2<4GkYd^R%Mm5dog+T)RJe9UPJW^ix%?i=^(Q#x}%'
+    '58v{17v5+ETG%d;sNl1D_Yd3tZ04LKvsT&|Zq!_+gYgFLg;9X~yjV!qs^3z5B}ngOA5y=vBi'
+    '+AHOhJ8gQFf}VjeOzx_M$?Su2ayL!SIA|)f2;P@j1hr)LfQk|5nQ$sr;4OE@`paFh9hO+Y0o'
+    'xrhHFH460G7%O0d+@9@9A|9|F)JpT3h9ARu#FErF->%Bfa|7-l}pY^K7kp@>iGM`uYx)J}b|'
+    '%+>uhf^s7kEe1EwUbz6GYN62Li-JAYT=}F&P?ke4sp7QD}>m|J?YV<VsZmM^@?nR-_vT8=&m'
+    '}6$|a@_-5J-Z9Y9hBD6Gx<HkjM-ZEH0o})+S6o}H6(|uAvHYAJ<br><4lr0PU758?r{pp9;a'
+    'KrXWQfKkUh?Y818XK7WjMiI7e-JoCmVUQEP2fdmR1DX&TL5N1f4Pve!u;&0Z(F>~+*0$2;77'
+    'c4U^l_FviS)RMhUOE-HR^(;vuH6LEmL#Q>{$zG>}>~-|sLG1xlnrw>9Sk!CwL+Lr9dU>d`<$'
+    'dYt@u!~Q$Jz2;GIQ3N>dA0i?*8kUQe}DOmRn-pNe&N>eD>*Qo|?&X7UyL)&q>~AXL3gN*w<$'
+    'owa3?Im-ez(QP;x1M39_?SIgc-orz=8>&K8@KLceJrMhFGd#G%(_4L~>z5Gr}55FriYb#u4Y'
+    '|WM)I%*@Od*Zwzy>L{Gk?Qr-T6)^3*-NWr7LwY7>a&*W_4EtQ;l4C{)_Xa<cYDur))^*yN;U'
+    'g)C01GPuIV1@x8zQSnhC1*V%6nYq1XO*<e4#Eo*9{?wo}(?*2C*E3+zM8!W;x*0T$v@EW%=}'
+    'z?V3H5FEk}_z^$hhT5?5{PDmmcn?D`8(-rD&SEVu%5~U^ZMdUeq_6U9f<J=gS+q-@Md~c2AE'
+    'G1W40Ke^J`d#VqrRD*sDWCjUnuhKeFw`~Q_Y;xYp`B(TU*Ww?c_D9epbKX3bxvMTHUwxv?^u'
+    'mY1PNp(`u=$r<I<4AmhdiX@T%)#;bnKtDm{*#jJALYBs8R@2Wj^YMJ?Z+LDvjy@qb-y|uiT{'
+    'iSD(iV^AevYJsjOnSvMlo^h1OV1Y78^yk7);UKHi6yzpJ#Mz-6!lC*>mFO>1l1jg0GUCkdXl'
+    'KUwVw5NN_u{@x8%yy-dG)g>@~|trFW*TRn8p4TIHga-kNnSuYKKH(??=m6QA>YA+f|B^n0R!'
+    '#30<gH>@-HtTDIf-ZR}KCKqgZuef?o*k}A1(tA?X^y<BObhG!=9zLPO0@BM_KbQ0zD=T|@HJ'
+    'eY(-qW!`-OJ>h^fJjA!&srU=ZT)#mtS&-Du$@nAT^6m_XzQp-WhuKoLZYyPVStnMHema?W;2'
+    'LSj~!4Gv2&yu}F6_-&9U-ki;Z)&xgv=BS6LY^jfE8AgMj0x9l0!Od>VYN98`En&Hz~av;6j<'
+    'UsU{ADs)SX_@i!=rU+Dxe>KTZ74Hvbc|8Q6k|J+CB-w$WYKHj|I%z0btW$$)U0h8xA|y>w~E'
+    'E+9!%;FlF2M?PdS^bncOOvqt3|gW(m2SO{V)Sum&WQ8R2Swm%<X0$@$XLee9Z9YM%5gaTTNS'
+    'Nu+x5xt^7+>yr#s18bT2SV{K4?q)w4E@nLHxO!Z_gePYrxtooy`-WO)7OL~ReU@#Yo@FY1H|'
+    '(>~f-SRdRouy$<e!~^9^EXv-(^3q`(f#|!__QAr>a}f>s{8!S->jpre_zce1>}O={{ttUrKP'
+    '+$o@svS(+-2VxOTH)r?jZPqNQc*8N`fEJwqL>_MStCfR#Y2D{kbe`7h{=<kUUKeCUhj^B>9-'
+    '64<ZGeE!R^?O>!U-fxU@85J>)E)<o$M-S;5=#6tHnm8PW+(H^OOBM58OAyvse7JIvCJ?wEc-'
+    'jPuPcn=C}G*h>Aa=88OQpy;%XmcNdC$?V_5f8wdQs`WuN0E`y72fwDxohm;H}*-{T>BoM8w-'
+    'gxcSfFpL%@p4{gca=siZ=Sw|nSj9JsE{*KBYCm`CXK-pu{L<B|UF&RJeRo9nB6ihF%<XJl7c'
+    '+9bE&C<CPty6^K$&G2)xIaX+7Gqw`7h5jRC}|hW&-|&8F;EOhvVA+?^$^EnRcqrMVRWXQ8;p'
+    'j`J;rHN7S=OW7A*GJF#VUDQEQ27?Z%9SEJ|A6q0!~y05dYr}UP3$s+O|HKhNyAvN7ilSDp?)'
+    '!H1Y17cbJ+RRx!!!{-}N7Z}vshO<Or|<D>;<W#6pVKx{*W#48!t?6e8PmRy(e(p!*Y_dBl51'
+    '4GVxQ{&;AY-~A$O@`T*oH$MbA2;+3PRPX!f`4RR&An^`Vx&H=|taUF`jDbl)5Oo>uR*SF@Y%'
+    'tv2X@F48}Ji}X!5WFCyZU+*DvVD!CuJr5?T`}KN0jGhCd=f3E9FDE2k9A=yMqT<DRkJ6dfNS'
+    'Ebi-PaUL{6Np<9WM6(W83d~qvf83zBhQl*8lpP)E8cpKG^EsMQmp}JLKNtv-bDa_ev^7bFak'
+    'S2fT~q``yK%T<ysUTJ~g5?4<&q?$3Hw_l?&xou9E!oqF%8XP~}kr~CHm_?F)5={~sb`p3q&U'
+    'u%jdXUu!Zy+(UqQ(YG~Rqi=i``N3yjqI`LN2|{Gx^J=G<2r))w=Mk^^&Z4q`mQ#YdOdwFORt'
+    'Ugn1f#Hg5*BMv)*UWXNVBF$6&v&V6De5;-VhEf;{VDTZgRce|2A1T|cP%z3RF`r_>?nI$2$h'
+    ';FP-i{Wze`vN7!2zESS!?zG&~Jz%+~YwhQL&QeFL`?_1tD2AoKwEawCKMO=P<6OTca$EXu8c'
+    'QS3EUGTUaB<(kRbO4}{RdUIsp}VX-MBHq?EmSM`$4+SS=YCQN<P8bpSH5}omKY^bX{?5`paA'
+    'U$?N$Z`d*f<!`6M~|LR#^%`tpc_Kx;7PVXhR$ZKD%b?)YbM0ZA3dkM8iww^WjNxuR6+?!)E_'
+    'd_LT^?Vz3_S9=!56gTT`<c?+T#v`I+~qz~1*tdJ{o8fFcn{0HY;~VY=Z&gMJ-gd}(a+f5Iz;'
+    'M`be~(@?^^eXeq2{0eUd|^j>K>=FQJC*p1hCDOHlU%yU3gbZ@CAm>)?XrzRxA8)A5)7z54#f'
+    'Qn|0;s-LgB`y1-shOUG6mb#Ttxz7|V_m_0NzJ0cRp!CJwXsfGM{j$}c={~&;<v#BenbTrOKV'
+    '@C7uj=INF(Y*^!NW2?K+Ox#^**{^u&&qF^*Ax<Gp*{349Po&N}qWZt8*&S4_w!gTl+EV`#9?'
+    'Uvwbc>h}6xieC4BOjHP}_^_vcsc|qY)S8+z>)I9D(Ed7N&WiE}rXV5_MFixpw_L2HO-Je6xd'
+    '(!pjhSbHYe(P$F@05CWAGud%?X&*qUV-!v_mlcB-FMty>bxA%Zz8sHQoQ88uC*_PzPH=LHa|'
+    't(-|Zsz7Ic3SJ@3jXec<)|5JU20`d)^vm$&za_LKVn!P5WQTj~Q1xeuW0;B>!rUFW9j`#q)a'
+    'fvy(}wA6Y&nu{U#v~``TQ|>DskozxAsc-X<ufZwz%+|@hG8OBY=;9vIaOsZ`)A=a+{_yv<`@'
+    '_1ghQ1ecP3mCvJp@mw=hJ=P^*tLOsfSbdQB^KL*O?k}FH_g)rjq;Z^(7~y=MfpwS3}JU@o+I'
+    'GMBneV&-w7M+_%;DYOVK=0;N9IX_?!go>5Mz`_uP*Mm*>FJDXkfO*vqh%cJ|JT#)*SV9Dz~t'
+    '{aqo=K4O7noo7c)~{UcSswQ*k7mw~m-J_GcW>R*{2z6XUEdoUB=sFmnJ?v#`{mwJ7j4+)-}J'
+    'TJ58rI5<FM9A>-i{sq;6Q>6Lv~peSJSGK<>@yxevNtRjsLN9!Ye4iK3l<C-<^+9a*5<vx$&~'
+    '+j@?|a=B0Pc%FjHOVM=%hTNyL=S7}J{`IfsQ)81y4VCzMTt4;1$fv4v?Hjfj?mwAdRp;n~I3'
+    '(xkpKt_6@w4S@{W~sM&ezv)-EzkMQ|{%*G+(Rh`x8rTP&%m%(&uq~AFPbTYIOa-J<qG_?c3|'
+    'R_gLnAb$(3eDW5eDtncgUd$s>7d0~6r*Pidydmw9mR@bV$D0x~{=Uv@JzE-~m6WU&bx;{<4_'
+    'G(*Vb52XG*>@5H>05%I1)K;)ge^at*p{EQ=V7h+SN&R!Z63CL6nR&Be)W0hQ{Rfqr@G9i#^q'
+    '7X+?3vLM4L}_Qy&o9JgfRR@f=U)TcgUe-oaf<zEwXfqRP9zA+czute>|napo|IE9*Lp=arA`'
+    'BzGP4$Bj*X_S3lh?BAN7jZI#5lqLVK`p@Y+t$y9<eo3*-+uHY$>il^l*^~RbA7$Tm)5YucS@'
+    'XUX{$k!YgmdvB{D2>Gs$Lg-FHi$DB`5Sx=Y_ZZhw{SqpZh<ZC)Up+{qM&%Z*2ek|Lr`o{(9W'
+    'ylcU-*+RrWCmUD}%`o7vO_LSC~T6BBMNBQc-<{s0Yx3-^)?0IZI*}LhwufLktc6XjD;^rLpt'
+    'od*I*A>%zcy#rxkNXa|$eWk>2lD3bzJH#Uvxu%)sAQQBJkwT3YXAP&>oa4MkGDUIJI0UP`{+'
+    'FUHp?FB9`3uyv#T}6U0(g~&ZB>C%cFO(?W62@^{3)7|4^RY9)~%G<CZv!u4mBwkYf9KnQ5uX'
+    'h$@e7ef<PJV;=wC$lvS!Xpi^DwtT++dFns^ujKbT+UjET>+^9<U@Y_hIyU334nXe*V_FZO*P'
+    'qzd1w5|x_=oBPI?K;LrgZ}P9QwTL1>Bu;V_HXGKL^_D3hd9XXRR~P&mZ;glvonEPTK1a^zX;'
+    'C4&m|V^@7(UJbsS2s7r8FhoIkA(bXg9evYxNOVIC^=;{+5pZ{ci`AuT?dL7aCY4kesyy_X;?'
+    'XT>04*K57KV9#j?#8RLcWmn(^y~W?zjr-pWF5p)=azrCF2cS)_`B*P>@_&<>L&E}>F=taP~Y'
+    '#yNuJD2sqeuFoI<GNs-CsZ;_><UAF8*|->=x#T|9n&OTJ0hVOZaP*<)~rH@dowr}p%=Iu4yL'
+    ')4#f_>(KeI=T+Zf-^bbOJ?!txf4lxezfZ68x!zFwcIjgsU*c`LpY>m@6M1Ug|A*>E?9U;0uS'
+    '4DMSl5|cV-2`2{T3dE|NV6*_V17Wd>_A#Ua-0pckAin@1vW#6?HC*Z#fsHmp+?1?qaWNd7L+'
+    'w`WD?IQk`3B$+@L#6uIZs(kn8m^Gr;7Fj?chx)+nHcyCPNyt>!X2$>1vX_>F9>N>2wD}!P<|'
+    'HT^Lxo(*UqkbkW&{BRj)*hBBcYa2C?_9C;`qn*o)H66Wyyf}3N_v3n*)X@H_vL-rJ7ty`F|Q'
+    '>y_u*<LjDB9LdLiAjYKmn>%#Vpx?8?mD|BkT4kuzefvtjf-!oJT~f3nF%{fV9>6IC6GTEnhM'
+    'FR}3F5dU=*_pKjA+}GbSpXOQO=9^r^&G);Ao2z(vc+zLzCsuT^PgJvSnz`90s$NcSCHrUAzx'
+    '^)OKf^L(C#rR*qKkE?ehk(jr=_QBOyYB!T*T-0M-iXXaXDA#XFbcOhKsp&YNk&^IZx{z>z$-'
+    '$mNP}{_m}SWm3ls&b=_1mf$F0HViV6=j}30(TKgrgrQ=y@U3SP!KKuGSLS_hA*J*WrEn}M*<'
+    'SjjP_3Q!N^DDahum5I#TIHoxPcnO*mg;@pOM3t6o;|8J=Tqk!_QL69|6I~iXXb9-?6k~0+GF'
+    'V<d_ra&+2aqoPR&((t6Y|+_uuyOy{?PX`*JnoXn>^`v6^GF72jFr8R=O@)n!IueVJRN<`jKy'
+    'nGK<56<w2>$1;|<oUf&av8vCo=h0o=>AP+13nKS;f5lCSb3X69t-S}N&g1G{kk)*z?g?ql=Y'
+    '~gd?<%^Uby=RFXPxfZSl30|c8%^6XX)jpXF1&{?7nWny07+s?fKPb=(-!-8#<xwo^CNquege'
+    'yPv0+HVBOmmi>wdT`9+;`)%gx<{#5OQRovCyQ(Dh1QTu#V2h>M;Our{Rrqz57SG_%>i+k%CS'
+    'E?tSilg+G`I>6B)eebwTyxQ@TF*`?B)OG0mPY1Dot9Zw!Ipk6p_Umd5z;i$T7RnIhq?#e7TX'
+    'LfecrbBzE(4>Vp>mQjq9s;zQ4@xbeGq)=dX4AU)No$e5&rz8PmM#DoejHA6vgMRUfZ<(c0_d'
+    'UG=z$(S7S@%m?T>FFM|@>x)$!(?jBzs=i0ZE%kZS8ovy&&V`Y<pFJL^>%DZ{@?Sl_y332W&C'
+    'kT5j<1>Ipa)4TQpLCJ`FB0bMdwGH66e=5U1FMl^pjaHPMP(h@)){Dqnf3r>-}|pS?8T~oKwe'
+    '%?eS<`M_@gte__2}k}7gWjEXy}IG~!*<}Wkaf@EgQ<NCbR{JG3%8z{5czOl?>)A2)9cV0qzu'
+    'B*CpADPKEQ1V17J{l}DZ+A!!c0EJM+Kb(qKUMSD%Gl<!#Uy{RRPIs#miF2Eid1w_UsgYg`Z7'
+    'aizg4r$eyb<5-&CH$X_@t=d&sM}k2OxbMS99ViWkd_H}8y*J?2$D$SL#P)=95<>wTX>(%bXV'
+    'eIJ?ars6xH65ok!9cV?%EI3#B8a)e6_q12}8$)Kom6CaIJ~H!7_qY#|_`a+A8hQp?73qEdSM'
+    'L*7MKx5H*>EbK7n3?MJu6Pti-pP@V4WYe*AweHVpaF6dh+Xf*T?s*<UWqh%jx*4zMrG=Bc9T'
+    'GwYrPEh{`*v8BFf-g`s^Sd;34pFT@hBRdozHUK>?iMQ%%dj;^bCoF|K>-glm!llKDG<3H~n*'
+    '{Z((asEGsb+bC(SVr=VD$l5T+^V>*n&lTPv;3l~3)cB&bq`R@`m2T7GV@Q}3yiy8XWp;#{FB'
+    'cYKIj2|jQ{i5>kjqoAXQ_QT6*XfmHS3Lpj%r@>E@%Db_JOc=4yVx7q*`2dXB(anIjMsFR~VS'
+    'pv0x$wag39G3k*KbJlU@b`ooj>74N!Qa@<O{j1crSxMG>o_!9vz1O>%Kb}fr%u&rDx5k;R^T'
+    '@4p$8~JkdLLEAnD;#6{Bad$ek*Pc`G0;6c}+KS$nAA;|CM><D$W@G9OshjxSe%Axtg(BP0jx'
+    'L7w41fxL(i;GM{{~!~tX5*Q>Ct)^WDP0AoA1C7G-vnPtvj9^_T)h|EvZ>x-Y|UaNl;b(Ffl*'
+    'n5Tfx-2m^9Y3?rO}ECsUb5VS*72_jQp>CAc;`#JD?-g23glUhI}*oAzQ~MY^>Hy9&51d-`Rl'
+    'rWus`}*YB*KA>L%{s-r|3LPP>j{sd??c#$sN(Kl(ny-1d_a@6z+zuj8g=j=PFw`Jubq+l_9n'
+    'yPoT#>)z8Ly=BgOW4Y(s6wNI6dlSk0H#P4qmCSp4IpXR0K=!(RJum34%&2fTN8Vk0=0%w=Z='
+    'D@yt;>&_Hy<}|{&~!s*Y{uTbLaKB-#UNZey&&d5!{{I^?Z8Wx7^*mmVW=@occ=9%&AxBRXuC'
+    'Pe!pAayZI}1KpV{Pg%OPH_<%Fjhw;q&4#DxvIw4&jWWWFUchv*wI-uzC&*5^<*Pj1%m$%e;$'
+    '^Xy!$Wka5gS?~@BQg3f<R?|0uD9%Q<}G^iKFSmXM3bLWd!5^|-?_i|$^2FK<&phZ?0G4BzDV'
+    '~8u;*X?YQ9CS+ru%^&H8Q6Kj?V#<GAJj!+2m)B-3$0iO;!<L+R(5evVn6U!i7tPhH(HBsFJ9'
+    'N=>D~3`uVpl6EpAE%fL*f~0y3*}@pIwNPmaL(&U|qzMcO+Z!*NVR;o|H&m-o33nU0@CqdCZK'
+    '$>xuOgpnZ-fFUh(aig*H8o!4mXOSI7&c;#!I2JL(MYdeTwp^054QTB~*5(yXU;VQ5Dt9kh)O'
+    '=Dy&`$wNVH4@H*<F0UE*wjnEixpb46y8JeR7TEZ8t&>C&f7VY4N_UM3)=!DMbg05y*-{=kr;'
+    'TvzF7bH}#!tX|3yoG+~j{z8nK^Tm8@GjoN5DdjII58X}F$$yczLZ{%g9_(Q#xzXFhxiCHF$e'
+    'Q79}Dma7UEM?LX1UNqOMD-)=>ByUtooq0x;B7%CE5+Yp@pI$ojcS*3X^Tg+17d@30>S%<YFE'
+    '?R^Ys*P|W*25&oqx0WI8aEzbLEr)R&CveJq>lhLuH>5n-IEVAN0111mx0LZaF5xn+nBi{Ys@'
+    'W#TkgbGq6SvG3HHNg5F&;S78HF_z5oQ?Ja3CJyBY~RfgqM&AiID_JkqpU^0x6LSsgVY0kq+s'
+    'R0U41AnUMuq@iMX@J8~c=Jdg{oAUE<LFJ47H<VOJ%L?IN$Ybb)E@I)~bM+uaN7b>DMs-P;Wp'
+    '%!YR4(g&FUPpa2KttR9r!U?@KiLNjisAkz08=gdpwF=l-{N~5!cRDYqxc!ea2zLa5~pw)p*S'
+    'NwG=9N3oW}+Hii`LSzvB`v;|l)3Rq4BN4L2<Nu{*en`v`|8dow?@M+bC7Cv-*^bVWCGM-TMG'
+    'o9Kn!=mUTB#arly{uqFP7=*!i8}Hy<yoVteieYeKxa<=rV4|9-ipiLQ08GU+OveZK5FcR%KE'
+    '_PU!fedJT+G9K1Y!X`!9skB&#(xKu>?!849oF3zQ786nLyq1;@N;z_zGWRHP&D)*5Mnh#|CV'
+    '~CTzwQ1Y;Y%#dhq#PVB;N?7?2_!*|$^0|>!E9KsLy5kKKDj^HSM#xWen37o_!oJJ_l;4FT@I'
+    'h@A@{ECbC4Zq_OF5?RRz*U6dPh7)w+`vuT!fo8aUEITcJU}=eB0}}qVUO=XJj6!=B*aTdgv3'
+    'aKq-y3hk|Twhql;9k-XCd@R`r5JdSpOGWI|?SK~}tsY^nzYav&!>kPELMH}W7aUPV6SM*$Q>'
+    'Ar!`ID1xGv^U4^EjpDo#?YV^Why(Eu9|@2UFCh^UBMFisnd;+!6iA6wNR2c|i*!hj4C;)7Ov'
+    'sEZ$cmSd4cU<cIpKj^cm=tU2YK--@*zJ8pdbpNFkV9u6on^>p*TvQBub$)%AhRDp*$+U3l&i'
+    'bmEnylsETT+jvA<mTBwaWsEc}d9re)w4dH`EXpA?|1WnNl&Cvoa;fq#ijW%eDcJM=cbU;URL'
+    'T7YAS9C*n^gvI%iC*Z9KJZ6hyoG+~j{z8nK^Tm;@eba_dl-VD7zQVXV+2NG6h`BHjKNrp!+1'
+    '=<L`=eDOhEvqVj8C71AK^Cn1gwkk3cNICs>G2@fj9jF_vH{mSH(Q#}`<EFA;>5ScR|fHCAH{'
+    ')?yvL!Fp`KMiukNW^6$)wqhH;#dhq#PVB;N?7?2_!*|$^1Na^xIEX{|0YBm=9L5nG#m_i~<2'
+    'ZqnIEB*)#TlH%FF1$uxPV`A5x?PgT*75s!5_GaF#L&YxQ-jRiCeghJGhH`xQ_=2$3sM@_c3S'
+    'u)RwqIet4oRye;vEsNxQO=mvj@KLlZw#39y7974w*c1ir<sKgyE+TsqkCGOy^*QbgD_)8pMl'
+    '*9o-Bo5#yJ<{5v13IHCx}iIIpeNo$FZ9J*=!XFqC^?wn7=e)(h0%B)V=xxuFdh>y5tA?(QxJ'
+    'fun1<>203YHb%)rN(iCLJ9Ihc!in2$g#z$aLUPw^QRVKJ6qDVAY5KF1eWfiDq+l~{$Z@HJLr'
+    '4c1~EzQKBIz(#DsW^6$)wqhH;#dhq#PVB;N?7?2_!*|$^1Na^xIEX{|0YBm=9L5nG#m_i~<2'
+    'ZqnIEB*)#TlH%FA~?ej4Sv<;yc$1n{k{fsETT+jvA<mTBwaWsEc}d9re)w4dH`EXpA?|1WnN'
+    'l&Cvoa;fq#ijW%eDcJM=cbU;URLT7YAS9C*n^gvI%iCz+S8jcYdiBTAh_b~=zF%IJ~0TVF^l'
+    'Q9JWn2Kqbjt}r5KEe!qjG35)*%IH%jXcPUSCJ3-Q2+%|2!-()il8WpqXbH#6iTBE%Ay>~qXN'
+    '885tUFG-l&4AsD|pOftsj=+NguNsE5~49}UnDK4^r-cmqw)6wS~aEzlCasz)wbqYc`k9sJN9'
+    '9ncY-&>3CO72VJsJ<t<xq8ECj58lQ*co*+s2!_Fl;TVCD7=_VzA7dnbI1!UDS>lLOF%8r45o'
+    'X|H%)~6r#vIJWJj_QR7T^;s#HaWSi?A3=uoTPiC4#UTYp@pU@D0{u12$q4He(Bdu@&3!Ew*D'
+    'f_F%8XJrCkAj^HSMmbmAw#nHz%RlqC1C9WA=JX6ObRU9%{;*fs5&7i?6zd4@DBe;sY>AXQ%i'
+    'BC<Ec*|^wujshRdWnl{#uiI{L7(SK%6YsgnxO?+!WXU327c(E`YoXoI-@JPp%?n7`Y-fFKMc'
+    'S?48c%1F&rZ>3S%${(=Z)#F+YmD#=Fmu*U;y8eV%?G=V(`Xj`q=<8=f`Kp=vJP!4M3^WK5B~'
+    'hkZZzBIZG2(tF%penRgv`pZ6JknA(gJ!9Ttjy%^r<vHyy&n=zD(9fR_<+-Du6V|-OVOu`q4c'
+    '^mDUWEKbbomL1&+F%c^*L}lF8&^E{Jrk~So}RM?j9F+|2N|9&pY0(;_M;+Kzv=r)o;ed)#Kv'
+    'oadGu$imSWZ7wdg+TpT?vj{Z-?(c|Lh|C{miu?WD&2*eVJr>~Q9>~1&l^E+{I^SHQqT--b^Z'
+    'XOpme<9=Me^-3m9v44tiHHBM$HL0S#lm703!CI77B)K;v9OrLz}8C)%${f2Au+Mt5)<3^g2l'
+    'wH{Rd-W&m$IA@-N21UZi}PH73_zVsh5JnU1|#V{SS>_D{v$ZrNgQ4_>g?+laW>TU_kz1&Y0S'
+    'TJqBNJhQvJa$L+UF6Q>UV{UWeVr?%(tSzI|h1g?lH7)fa)|i^E2XPl$({&>2+|-Hew$+Iol{'
+    '%4&wmK0NgVXgO{!$MzO6oyEq#h);v9^9vH!@J_M&e>@FHVf@oGr$7Rbp&W)$#lnV{g6x;n<t'
+    '1Z+e#4o9F-2*qi?|#@@zSVsF-%+lPNc%<Xx`+V)AT?T{_jc1&VzF{x+Mb!_>ij!oCEMLUm2>'
+    'e7OxF3nHs(q56ew77U&Ts-c-5Rcm-wQ0MhHf`SvR-1M$E)EwLhl`8D#l_*`;&3ly9L|0ZBrY'
+    'x&7nh5R%f-dzo+U14jlXS-;=Y!O!+q!C-d0rcxCc@f7Z;a{i_68u<>KOUadEl-pK&>9pKgq2'
+    '?>fOUW5Y;q&gOh6GoMFhv$uOjyn!ZoSM_Gc1WZKQSNL3!i4T?;S@AN;!wcT1f;MPd#GI*}9i'
+    'GyoUC$yc_K^1kTA(F5q7za`Pwy{eUbmh%(vY*MPyERF9_`q3w@(u}S3u7TNM@UJ;wSy*I~C)'
+    '#TP(8Axb7padV()NnDhkKeTh~7;dfO4NcHqho$^uNMirmy$G_blgHo~I!`pZV3;7&A%Vf?}Q'
+    'U6|n+&l|%8;|<~yPKyH)f^T5HMc+;bc|xIikhb~)-q2;%~AOT3!|8)vLm56ALR`+m)YE>Wfu'
+    '2&{3`QN)J$%7^HB7xZR?zqA7qYpL=-c$^;{D@&qU8L(ep~`%X|_&e?-q4370t|dcKHto=7vx'
+    '+z>q{q`u4r(epp{%e)Ug-$T#!&~rSjvw<60X8!J$8NboZ=cptze@EEnbLe>-_8Gq&(HY&*TV'
+    '`#jIU7?fbARVp=4`0hxEU>TGxWR+J@;aOZGJ_NZ6>XK7OkFBp=Z&$nllmAY*{^5Vmm@Cvt?s'
+    'DS3>sy(DNM%$}?l8%rI4R9Kt=#c@6$DW7IycVV;Y54Z0_Qp3k6Xi0ZiuYF21bnHAc^HY0Sa%'
+    'vHF6cbD<+$qdkMqnLMa**4!m&oPMUTmn6Zz}@@-Jy+lrnJZwQCs5NiM?lXDC}Eoepl2KImHz'
+    '*FcHwW**WXL}`KuX%4P5l|x6cmLefo7@emx6N&;BbUef4!e{ff3e`nqp^Ntwl``{d7*e)zio'
+    'y?sWW?ptr~Q?L8d>-lnS=g7I~Ki}(M<Qm|r551?%M2o6VymiKzdakcS2+#FH@gnC_>3LH6`B'
+    'hWqlk2%aNi&;ko1TNC=h2jw`Oxp;y=;;5Q1l#>xo+m4=(#6)Zpa0h8=~id==mOcu7`e|>Ymz'
+    'aeq>wh<Y&AmgE_B2{fw&0TmbugKQHO0ufHEGjm9tpT4sqE(&t6@t#``0=B}U1NEdxuTFSm=5'
+    '&~i{Lo5WBa8>4rxtbvs)$B06K3ZpprF1bvtiEN<T!mm+J8#I(UC$6xYv{|!gS^O(0`Np-c*~'
+    '5jwrB@G^n^dA$lAO28E1^?*<zzG8j~;uQ!yP&u?#D*3SVIj*2~(x8Czr~*)HtCKFgZ^Jx<^h'
+    'PRp#a3o@%r%_vKNgh+-|NP~1JfPyH7;wXtyD1)*nk4iGztR>o@E!v@ri<xGFWTx3DjK*Y4!8'
+    'A<AQY^zttisn=jrEopXlnM^UhI=SNeB)iRA!-Fz%|^JnP_SjS^^|Q3Zz0Bq(cD|L@^XcNt8l'
+    ')+1pgI%ucI?I;bamp4MoKb}~b)3kJ&!wNV(237Cwjn1+uq6SFY~b1@HrScuQC1k14k>#@Z$l'
+    'kHpV#2)OGy;cYg;sWj`dvaD=3Zz6Dq(uP~M0wi`w;E`HR%nB^@RJ#CUEq&FmRW9-Fd0)Z4NI'
+    '{MUt=}a+h)CO!?)NWGvD@LugrcsiPH#`8E_X6hCgvVxj73i1yUjn(pqN2RYGN%5mys+P}j1j'
+    '^g$CeM+=!9*9A_Q9XAT2F$1%(3SVI(HeoY@u?rzGW9}$U;{w8P4L4If8awjD%(=?4j;K9sYY'
+    'fLojKXNVj|rHFPw^QRVX=!Db(;~49hP+|1jld!p)gWKzc;RpI_MR}47<&iz4Cq>z;PI<|Grs'
+    'v?)rSyNz2a@4d8?3Xn~gSMO*k`9L8fZ0<aRRum<a}1;N;gZP<z3ID(@{qvq!!BQm3v?DdDJd'
+    '=h4*d%Dk<I=9cw$nWDWj7*U;_|*9zr)3sj8F<S~K0owAZ}f#T2DACp86y<GBMkRoWR5&@XI1'
+    'm~@HU(-X7w#c5N^TXjFQtfyRR@jZ8QA5Q3ch}8~*BS11CO55cVPj$8pLw^Dl>O=AXM+f9i}h'
+    '9s!tzK&;3bIpfdOY`^;Ov7DWT{lyu7H}JqV>#qXpqP~lMa=T+W`|tkWJZDGeC#-$sPRjYtnv'
+    'YQDJhcJTF`E3g7>$~<(;rhTb9Mr;Rc#t`@vK6Cy5FCN*9Yps5B&?VzT+dzDD-4Mxx0m3$Gbh'
+    'z?KN}GU|*RrI0J!Lj3xLIL0F4**n(i}!ft$z5FEi#oR%P)ihDUR3$t-UhU*?i7#^rWyPlC}T'
+    'yIpt49td6jP(<qD26Erz&V5=XK}ubnDi;Xk6j2s;YH^CcKb}jdA3=GcjSB=)tsMeF`Q-SiSq'
+    'EqU^r#A;Q<_rX11X^Z@0scXl5K9kU59PaLRHfk63CB)^auT(A&k#!v^qyFIqpt>_c_#KW>?Q'
+    'sA2#P&iaXv1gVe)nc#tZ$d97S%{fVLO5E4gOvEtUQ}N)>S&xtKIbj#};el%KcbDhjJ^nt9-F'
+    'rH2oc(@e%%Kd*q9Q7xGQ3e0)ldU9W$xk+2nc5%h28ibAqWePjFo1U7>1g|*aThC4R699127Q'
+    'ba9Cm*Td)ngu@@mYgrhiylPcbUUvUvvWhUdp2(wr;IZ_}W@}mO0PzjaM06u67C+<suX?!F?N'
+    'tD491Yj-#u>c`Zvmc%D_<aQ8pu}DtNP%h|yoP%4iEqw^bYdRnV>@=^uoSb-Lm-y9=nJU|UGu'
+    '{eozUkm_K8$Qvt>Asd!rfr&@GYsxRENZeF=$?1W8dEWl#=YsEEpFhUS=$#Rx(uuHy!7;Xbk@'
+    'aTqyK9+lw@C)QyjLU1UFIWtqu$V`t6$c!u~EweJ~zy~eihd>0&49!cpEd{})Q4Y<}0{t);(='
+    'Zcru@pg4JX|OF)BQB>B{yesdZIl1QaX%baAKLv=u~-!Agq$Y<NWYU6&Y*ug})`{HXcFv4xzX'
+    '$#me^Co(<60#f;B^F_`fgg5MB^d#RtE@mU(R;bV#M4T@&gXDH6#rW94DMY^<6&j58|48~#{#'
+    '$z(3U>@dU8G>xHLc?$`tvM?+0TLnwQXvh}p#Tb^7>c7LN};^OA}gV?WyWX?)IuH9lQ^Xh8l^'
+    'MiRGp+q+}-Ta)@WmyLD~UM1YxC%nWUSr*~M(q-3Y-k_4hM4j4u(C!JJvT&dtnHRkZGIW@!!h'
+    'z!!e#1!oLqnXX4L_DVtg%PwY{dZLyT%iCw1dSy2IY+OeK5@q38fuu-|^vHlr$P7;uLur&jIX'
+    '5#>YrzM;2*eUBli8`(nW^Wcct5JysXj57ow^V~xSQ3y1ds$tvzaqht+P~X!Uw(Jj{q!nGh0<'
+    '%BuIqBNQz|H%~`8@rm7Eo;fF5hitgxvDVXkJ*6K_IVi`hnM9yBli=do*4hY6IL|~R&TId6R4'
+    '1g2W^YXbD<?qWSg`y?R3kJ1nn#KL)dhqq49sJM(y|D$s*ozSSAu;q@auGns(rdy8zG#IG=!n'
+    '4>f`Fc8UzXW&VW6JOh8>IPmie&fEb(}Cso>5S^FqL3xeSnGQWSCeAcv8AB_9`WpcA^m9}iZU'
+    'jc0qpA4A~8I0Rr8=4^a&_N>qMymzJ0|CSW{=R*N>Mwf$;xq#koasZd)f`Fb$TN9zUA(sZ4!w'
+    '+x&@M6!ERC6E?9EpCW?!;r}1&2p-BG0hyNDf5B_q|aU4d8=-vu182*peH$hX}b85&Emc_!Sp'
+    '%8CP%>VTh1R5<9T#qM1|CeXr}u{9PaTqAmQ;_cHHOIIi&d$YqKINC*$)LT=<iUgSf56hH}-L'
+    '|K$Wc~pQGs-hZdp*HHEF6!ZR)Q1lm;SDrFQ#3~lw1h8Op*7l|E!x2k?a>jP&>3CP6K|p)`eQ'
+    'KO#t;m}FgP(D6EFu0@F_mSGAzeNgyEXHSQ5rw0iO5(f%p<D5sa+}!9m;#GcTd6zy-v=#{Lan'
+    '@J1c@pfUW=MH<H(z2z`Y;tIkLt}d?J=4*fxKO+>E5r#iu++l4&YSe}geBp<&2*3&iVbvY;B2'
+    '1He{5g8V9|JHLL*T?11mFt<VFQA(6CpT;P+UY9Zp+1*>G%Nq5QcmA&C4~Ri{f!!j%Sox8_)1'
+    'Yj&<=24}5YUo)LsIm-zEL{QkXokCIvS(#3zA)6%)BsWHe&?M@h(gL0L7IvGXo$(nPr*J-F+Q'
+    '+Nz=O+_Tf)Y?+dp>j%RrJm!j<d!zN$QA9d<cN;osN{yuNp2_tj-+OeNY{m^Tu(LBLLJnTI*~'
+    '?b>>}qgTyj1eEjgT>*d@6fU00%VH|Hd0qv}f>$;{l1my29X4O`tw3(3KB!U)O1Y_{c2bY033'
+    '90iBlCvqiTwwy>!)InXTUulZwk`w7<$%SnEzxM7r%*v|k<M?6dMi8k%hL%P`U}k_JhK@l(A1'
+    'p*fF(?V?0R#mDL==z^l<ts5luikike0A8C>w|OySUeu?d>^J42rM!AD?Tz`aYM=jGQy)Ui-J'
+    '#3UJo3S<gClYTjiZ4(J)jY4Biu^=!l6Sw^IFhGCyww8KC>yD)i~-PYN}KJ3Q<J)=00@y}-xV'
+    'b+<1`;0;IHM`=GujvxY*}+(h!+X{l!i_pJFnJu)b2q(q>9My!S9FVKZ~d6&*D@iq_SD@y^bl'
+    '9i-0qc!yL#WjuHN@UXcJ2h+?^NN4PTzvd*G(`9etg>Z@cGRS@T8->1~^yc7_oCNMjGqhg|Cc'
+    '576H33GL0=xuWr9<L;Hlrw3X}d!C!ETv4E&XLKCBPSe};*VC-zr>B|F9;V&9l>CyvUZkC0GC'
+    'e?(V=}!x>7B*E<dvj1)+f2s>q&u>NR15I`>BjDRM(!5$uSku9Mc@_y}0vC?jDM}cQPPA??ie'
+    'g8}!1syH{f8prYgGk;K*usqX4=oYjlz(&GpV(6hJ)_xj0G1?o|l-b6xs5_S(_S%4nIvFw3+5'
+    'OMVy^7`p5NWRP6Q!qV(umHUQ=>Z(XAy+RTwjMyec=Q0|S-%o0yPo++VP=45{N=&UGkqn5A`I'
+    'cEhU(U{em#uDC_m5i<{93dM{BCj#3S^XSe}K?bh`FT>dvA0dj^dyk7k}h<9dc0kI9&Vg@>HW'
+    '>Zy?ixsV41P!NSt1SL+yFYngyYQ8IzFIqCw$ujZCkx7oZe4&tiMRhg%{Fof)^B$7>iZd6ssA'
+    'eMTUh(~rQ#aW#lUKL%=~+Xr<<Ec9jGH?@{wUgCan9Q=;F6xZng84Vy6$sjv->#5O1?SP91D}'
+    '*TZPpD_OGqy<Ns#O_np8Qe1mWC9lm!S4}9INeP+G=>@y3Ldo%mX<X*JNd;815N&dSHhNX=Eb'
+    'BCRWyJ$U!gy0Eu#3$HiJ%^a*kKb_xKFz;1)ZClNyGc&m<Q&a&h)<t4BJ_E~&a=IMVVY|jYdw'
+    'F+^F(`e*8F&4@@i}Jxx>z>?Y5pj?3~(Z&8c0$W&G}XF1eoEnt7h77RU39zg(Mnu1QReZH@K('
+    'V{&Y}TsgMWnqxbsIX3e=l$ab_xIQo0`8E5w$<DF0(;Qo8bU{~ro=VC*+gd+4wp~_^%{-q;p6'
+    '#4Ir^S|I3)lQwpyxGzxwdvzt}PnRVMsi4ZEG~gw%N+D+0S=&p6#@sJe$u?o-NXqUu&wlHF@r'
+    'PNT2&8x7HcGHNQ46f%!H2dC`7OJgCo!cAo8$=Go+VF+!ggqtH5mIW~W}HS?V5FTa+|%CLo?c'
+    'pUdU>^xf+>v`1QbExFk8X!uaALH6DdHEmCpPA>|4(O^mw2^*tXmWS#>DzdYLNo?qyynu*;yW'
+    'v!W^!p2HILT9Pae%YH%II9@c|sf5q(ZJIW+ru*_}W0mp2Qsa%S?pTqmBnGM_$Ahgi?i=6Tu9'
+    'jhS4&JU_41J2&Pz+T_JryPlgR_vO>)-Uuu2CHHOu?Gd$~k4>)YX51HAozG}B^bTQ5bkTg*07'
+    'P5)E_q%*iqCKoXY~0!C_f*SkQ!-_4!0sZZbMGojzTD$|JvS{J5Wsbzl0(j5r{+s*S^wW`JMe'
+    'QXLMgkZ1<z>yjbT_PG2D@@?xehA@?`ZAis52Qtok7MpY{xHqN?3X+Hb<%Zp9M2bvf2l|u#ox'
+    '-qqhlN*z~SPXpAockbIreDjCb+-B;1GEp4V+Mb=^iI_<y;Buee(VmbKO*_CZki91KFJ=<he^'
+    'NWXZ(iC_<g3+FDa|}ur`_xi`M&CCI@!H%70bTyqBHtYJ;BWZRNJ)Udsub!v*bsBqYBjcfIb%'
+    '6Pn{XYu)!siu_hF6i+~YYq93Hs{PLQ{rjJDT$10q{QF<~H*)8;A{rygPkzgOE(>$rS-Vf4sp'
+    '6CCN^E{BA{o!Dn$3#wlg~2!Cdp@oxbj(jtbEpFE1$IodlQ+{>U@*uwA!F2qBXDO&S}X&#oG{'
+    '~IW3dVT8j^K*rK~%=P#$_?%zpHs~@5<QS(|`u}%AWCa)Etd95~@*NWD>R-k;APy2x;pJj4cr'
+    'ax%svht#+mCtIXxvZg@$J*q|V@dz8z2>b3xcY?de3ei8gp#X@Ky52uC4Ivlny-@n;U=qZxC@'
+    '7I1V>%DD!XqOpB&XJ%~74T@>9M<=BL8q$V-{Nq{&UW`;(HRYKSPb*1n|4OKrv$KRKvnntzgh'
+    '<3a5=`n11T+m&;YeA7xl`K7$tSCrgRC?c%<QkdqIzK&;J$<8T-Y5&n*F3I#GPvVr7OS1cqQQ'
+    'Bvmh)DtRMyCH*Lvu#0(N%LsrVlww`;PwdMS=Q|_2Q8?GX2Td{N#*&vhqbT6xGfZ*?FS#3CI('
+    '54v;4@eNdnFK_m2@sL2!g%MnFeIijYTBN}1lh|K-cGyh<oD7L<BeC`kb(XYLUb3yB{9*1!Rz'
+    'u_{nAK;&hint3+5rt0ZjA0m#S(uFt*m%Io868YSpW5V(;@Ph@`J}Rb@<~lKpR_>pNs>#7Zyw'
+    '3?yM3-4l9xBqywUaMX7t>^^yLHf<FB_5-#H$A_(1#1{q^JH>chMH>mi!)>1btqOn-g9mGO~m'
+    '&pDYB;HS?X+dcE`R`$p4zf0dewhWNDXC9~@Z!$qCGz%mdplXP6Wq-P8_9wCT$phURKj-SlC$'
+    '|6Y?yH;3P-5<duk~{e+}!_8?7eUI{ch6_PwM;Krtcl!``Ur-X-8`&X-ER@XRq~h|JwAaQ^ax'
+    'ax{1}NzDN7iZLR)veEZVwd(#n`QA+Cj((XQUgsXpSGECAZE}_|^2<;cQa%Gg->dc_WbY_s9S'
+    'u(SOZub6iQuLFvTKAmey5DT~ktK6w_lsk@ryLbWpIG|CIkZ3A(&_`J)a+EG_J0Rsie{n~VwG'
+    'm2r2kt;`@T_V9Y_B+wpmO!`krr6^o0ZUf&YnquYFHAzJ1@Mx+iS+dyB`??;U>w`@JD3KK;-4'
+    'h6lJZaEa;r2FlD8wEDn<@UCX%-2Gq4&ZX1rTv^S|nLhAynw>NAi%wXXxpVl{buZX`57_Pto0'
+    '(n-z5i?a$Y-^W{KIwjkxwPjz26(rKX&(rO<(x$?gzX3!2bHbJrdCW_4>ZC-^-1yzkB97`@4m'
+    '#zHV&&+&b1hTX#P<xn@G$_h<)Wq1Ded*-z=;Mxw6ko~-HP4#pCli6{NsL$UO6OD3>?D;d$m-'
+    'gmX{v$oYfY(>q6HuQ6Eb)%~vYwn{SwC<gjwfe8-Ug-+$znZ?Q-DfSSeby5RxECrJ&j{2&O;>'
+    '+)uVy?=fAzGVd!M12`84-EO~x~}erp-cc-FA`ta07j^w&QfZr#r`_cD{JUuycKrax-#S(?6R'
+    'T>VhVkT!GOtF-6s{oQ@g|62bt(EUfduV~+UjBj7jeZSG`Cp!Ja#P$(WxjtXZ=jyPsfBsy2bq'
+    'J;F^OebE2YMa-@w!Ol*CqE<GKDyOhDfVVu#{)X6<CGUx&Hh)bQM<Pz1ea1L;p+r_NsXM_7b#'
+    'j@09@i_9i4?-`;G@jpyFI)w*|2_U&!feS6z<-`>ufY~S9+f7!mh{3wt_d-p=GbMM}0ypEOlA'
+    'jmm?G3PFE?ZfMR6Ys<O-P?!f?Zfl-;l;WS?~n7%IQHS0zO=Xh&f9;N)cfxy;Vn$|_Tc@i_u#'
+    '#Nkr<1~n2Ck1{dj@);>C9#UZC?QId4jjOvr+4dj3=fWl;eYQN=oEs)jnQbEc%)uh#`#b<bXR'
+    '-Lu!<+p~95?b$oy?b*8_d-f(Ja?f75|LC5*UP-WL?-h)2?c00f2JG8gfQ2`3@1A`gy+4*ce6'
+    'kPfw;6vvkL_>+_VUSjpV^(`@7yoY-oD(QB=c236RW@eI0j(?mc`OX--EA_Li^^GwJ-h@hGH^'
+    'S;S+p^H2ahJ3LqS<&>6$`JAHJ!e}2-{KM!{G&s(|r=ObPH^X=GS_0iKIz4p`1p28ANM8g-3>'
+    'M(or`l28D>;9m*IwN8c7W>J7O8?+v?H}yNIb6_ZeaURfzMr(IoLz@GP!1KPFRS+!Ya<eO>n_'
+    'BH@hE!hXNTcBr{3TF#V>Fc=Ms@?xkIxoB~e;Gf0RRc{p=C0pEnw!k<P=PiCI{Hg;<PbSb;S-'
+    'f}=Qw)A$^hBnwlJuL&6tf&%D^ei)BsSdJCggS|L{Q<z+s*E{B81=e6aHe)NcV<&dw6P&~;oW'
+    '>b^fp76Md_{N;L~2B!25O=f+MpetMrV9bl>hx5C<gwpltm=!qH&398Hk6iIprOYp4V;$1S22'
+    '9QT58Ty=?d60X&F@a8h@&eT8o&zwmFE-+9nGH*(LtG_&l@O!*jX;Kp2W&SYY)@MhpkL3J83F'
+    ';`?MYAUJ|w2ryrgr;L;nWZl+H7zwA)ftQtbHy1F5p%^Et`Ku2<JFy^F;|?hXUr8R)ERTdX^i'
+    'Ce#XWmQ-ruHJJ3`G_kC};Mc7`stX4A;o&l<cRAQNx)ZIli9>)q^!LY(&z*`?v*_1J^g*yy7A'
+    'My$ImlJP~S@N-95vO^Jw<TX||Mt(w9H>Ub@WruGFhWeZ{FY`6XZdQK8SKot=>Q1%HnrR=&k9'
+    'm|e^To_S{}8)Sz<Jy9nYRIrPW|!y=j5Lqf+`3@O}_S8$iUZ{MR(DLNWLz{`I>|HbCDdWkp^w'
+    'i?n>bO9WoEqcOlu;@2!B&Dk`JDt0H_(FHB|@<<;3aCetsO{p9#Xv-p+x-YTOCLQz%syqOs{G'
+    'Ap8yWPP*onGlcZEQXGnjjgDAeUj(ozYEglban;S*4YM<L7ki1nK^Jj9z+}T(|t9vU#6;+H4W'
+    '!yRSk8~0HsSiyEtX1Z&fr$O9b(=OD;PFHA|RDvxFCM2|ww6ksi7aWS8FcE~8n#t=NtSG>d2M'
+    'Vw=0vck7;sR=OKl_DKZkOsCBH-W`I6^}kiCbiCi7rOxFy^Z4biXMJmaehtk4Nw#N;byxG4&c'
+    'T<vnV|?nRn6|m9DB*wG?uw)*?IrgorjX8kvojF5T1kg=^V~o!bsH7dFM5A^Y<`bGb@rwsTJ('
+    'py_5Og9W@JL=55Q}xGI_fiNshw1CHx>ZC>>YhxlBD4*b}k^j$k2HRm#qqXQ;l5*A|#F6w8VR'
+    '=mC4gL`F1u$*P&<<Aw~z!*%$G|a@Tyx01krcY)1CiV35M_=9>`k?^7&kE`9#d|RvFJUb{zy('
+    '}F5q@9Yf!4SmuV5tBV<UdV&nV9CvyylaZ7>R>k(<wmd5&Lu-RUFtAFsbq>ocRg4$WO2bBD*g'
+    'F3s$#47?^Yy7oP~U$5zr0U7bLzHZGvMze>}yk1-Dp0zZ*-KRxHWXpW*b^NgF^=q>1=5=glog'
+    'Bhp1m$#Qo~4Q7b^U;!*L6e!Ue~g#TizoZp)r~u%6h#g)7QH@JA5&Y*ZCIL>-@ND_JVo6M_GG'
+    'i?AN<|R?BF;?sHq8-R#$YJDv6RmS#Rp)>HPE+?&SPPa+ve^FDD7KO$7Ki)L?#zxR(O34H%>z'
+    'i%|ryVCdT`^V<%c>kE9dky4$q&B)}#?8E+n0)~L-d94c_mwfO_m$^)PkB)e)m^!mOuzEq8Mh'
+    '!SvLQS2Aq4qR00mJPMNwSx$??s_XdcFV2C_f19QU#-UUual&aSM{?8-)L((KAs&93aY$+9aK'
+    'yzEM%vn!ol*_0ldO^MGvV3S!f_ksV(?8;9!d3I&EmtFC)D>qSg#oW^mbWhgYOLgDBlzWw4hQ'
+    '-UUco~-e-x(HjZ`z$<G54oqyEkoTTO_lxMl&iqHJfrovnk(dCgpOzzn&Ahvnb}gC|5l0L6^2'
+    'NE7h#~&~@}4v}9BUYer>RAt$3E4HYk=^8YWRa@Lhmxu6*px$pgN%%Vj9%~=$=_wHp;ZhRKyM'
+    'OPMO<i9kFvPZKh?(E4AnmsZ1=cS=_hjkA<uKVWZ9<|)Vm8^)|3ze*hG#l)!h@BCM?>Y4{S7s'
+    '!(^Xba*JfBWz*2LV`JgN6IgY|x9E4`OFQtxA$42d*FBr{U>JpWEa;R$rcaJctrnK`&-zF44h'
+    '%E@~6YG%*K{~*0}ZdpdpQ02_DO^9=tD?Rd?WuHhNZ=Z;_PsH0N;_Vah_KA4=M7(_>-aZj;pN'
+    'O|lB#wO|GGlI{w^zj5E8?09_uyrIS6>c1AMV$9>=)^Ru6PFB&=b$17kZ-)`l28DV}Q4Z#M?v'
+    'S?IH2@ka&AYygek|9ujX4iMNNu+e7jn+C$RE+e6~*A@TN*{HOPjl)uhBBul(KB;FnpZx4yLh'
+    'a?I2kWBRUka&AYZtxzG`1G3-+fVklw`39~d;3eg{UzT15^sNrx4*>OU*hdA@%ES8B>PKhXwR'
+    '`G+M*U7L2a}{BpyW_v`1Y$hI)7$^&zuj8sG^u)VVQ@@D$`D`O`Y?p(C226Qa-=&CmsRqbr)@'
+    '8MHt*v_yBbLJ!=7p12p!;(zFc*66MM(lyDQKIsXp!)MYX#Yt?yDQv`PY{D6A#^>0AFR&F~Vj'
+    'I4~c6^N;IE$V51|Q;E?80~0jqhbHAkJYg&f_Coz{j{KW8QEH`|tzy<45i5N>BGw=cBOi5aeU'
+    '<VdtZ;?+Ezl>N^UFMI3XY5&!x*7T)}dzs|3a$AMk}=2#3!=Dbd1o<(zB&V&5SwP?ZLf8LsJ('
+    'TcwwF5e&ZMQh&0QH+r9m%l$!zF+FA)*OsBvU@|m&md<WhRlB&lgya~HP)Js(Mje)$@diG%*p'
+    '6ZogB-&jA(hgvgT$C4*K)lj2HOp1=jqG;WBTE`l8I7@-t6k6n}q(pSc>Fb+(4R8)mC(N6e0!'
+    'bXUv;KRaV&F3C@LA3y&K=5WZ|l%$-)A@@bYta%)7%6kH}eaS!1<%pK|1nMx^4}+IbC!X^<WS'
+    '`8+<gw4~xTxo5bM@S8p3MKkd<@3|JxANA=V%{d1a|2>k3|@T#dr-%FdFaTbu7gjScWlJj<Hy'
+    'Qar*VWiB%Yn)tHdn`TaK$?_m<wCYQNY{CUA-`Q3;qSf}TD8!#0cF%6qA9h)%&TQCz_F$>!;8'
+    '{07lJFs5=IWm{zfX*h7?`yAqz5Dc^w_pGLH+o*lIsLhu*YER^ejPvP&()q|BJ+BGwdR?~*=P'
+    '*<LdJIXb4GXiqL2*D5QMvt9L<peEszo|kt&5V3oo_K!%L$x@zUyCymV-d^tcZha6dBQ0c661'
+    '$c%@OC51C*<rdtDtSE<UD34oF0ohRzx8W}2KqcfvW#mE?<VGm+APm6>M_yFL?Wl%)sE!asAU'
+    '|rL0BWKjYM~Hnqc9>-1a(jpbyLVZYhH6GhWaRu1}K4sD2YZWg~lk2CMbiZ-h7$AWxmXAtn=o'
+    '~{A=gTJdAQ^i}H8`70?b9@hI*>dsM<>sEo%^1sxEIClH1w5ss%&6;GoYI-)u{Ap)II16@!PT'
+    '~Q0qpf<W865UY;Jx~`tQ4i0eK6;@6dZQuwpb`3_G5Vni`lBfZAPUiFhJm;ngU}p<(E`t*C5E'
+    '6ChUz>XIRl$QO-6m28bp1Enw&b7nu0ownvy!5no7>VsHx=~jGBfzi<*`?o0^U~hnk)`mzse('
+    'kD8G>pPEU|&ZwE?{EV7~x`=uUbul$7bqO^a^<C<%)TPwy)MeD$<jjqlL(bi(IjJkDxu~nCxv'
+    '8tEd8lis!KGxbF@MgeYpJ)(SsgW>oYzr9sOzZtsq3i)s2ivSsT-+<sGF#TOF8H2a#kqk>T*^'
+    'n=hx@(3(n(LT)=O*h|9Qy-|>U)=aS!71B0F4Q-gw?-!FrMo!=+V1v|e_hG-oc?EHRsKG=D`e'
+    '<9eJ4<YBna;E<(buV=k^&{$Qa=(Z=TJ9K8U#IS)zCqnj9YZ}p9ZNk(9Y_6?`X==dbv*Sjbpr'
+    'JWbt3hs+<BuOqrOEwE;$403F;K;XVkZ;C#mmHPf@2*PgAE+&rqjRKc~*1enFi{{gOIM&bFzu'
+    'sb5p)P|s55Qoo_jlXGwCd^!83E}(u-T}VAgT|_-kT}-_|T|&J`eOJ!OsY~UooVtwqBXzl)n^'
+    'RX%f2OXa{z6?PXX#m-^LE*(ww4-0eV=-Dl(;vC%9}%V1LjbT*Y8W_QOO)uZywb@Kaa|Xv`B_'
+    '@GAjz{ksKM20vVAKnUD&Zky>*%GS4a(Zb5EjMIK~BFm6R&WY>9DlF=!K{3wnBD1m|~i9#ra!'
+    'YGX*D1)LpCrjpKRl%JIMLC3_Ji<`{RZ$VuaF^WgL?z7y$(*hFsDTEkiH4|!MyQR(h}7IrGtC'
+    'V(*W6G`%?;h7bGT$4R|h<dC(ss8;t@QBc6b_(q9fX)6CTr@bdo(9hJhH4L3j~^@e-cH%NT-J'
+    'Fcc&3yza7-op$5!D&E8>jK^!3fYF$U*D(oi;4O^N9eA<}Zx*ItHr~b@yo0%zig}oZ`IwFcn4'
+    '$B>WQX2LEW#?COSW1vP&%7ziRP)KZy|Hax?&ri!FF`R4s_QUW*c;lnPja##a<jj4;)5Moo^='
+    'DtFQ1GzD94HMIU^FGdln5S^R=t_!WKe8~W*Nw2S$ioR#!9Bwr=x7$x#M=L6+5TV>{&J&Z1Bi'
+    '>`PC&!8Q;;Zbx)d-T9#=!wViEIObUo<MK;ccBlSl9~5-8vW1_{m}^n{LE8Zj=flckFXLSV--'
+    'HZYV5-r?8kdJfVDV?_wgw{z#*)|VXVgyY`{@$#4&8bacss3Y{6&Pij&xeQ`nBv*nu<HiO=yN'
+    'zQ8VgiQV|hnhTc<cOnSokR0Wa0u_)F6_E;eAvG!?4JsoosvsRgkzRU*$bfKUL{(%$HDpG0WR'
+    'Y2AxJ7!1$cmcChFZ84wUHf>xD9oX19g!T^^gnoksA$=2MrO7M#ziCxE)Q94^0t*DC9>o*>`}'
+    'uQ4q~h2rW<;El~umP!#vz4%~}k_#cX+HA>(<l*Iigg$Ga?526ena?Rs=GKfFVvUedbf1afV#'
+    'Xg^}8UO!|GN+H)Nxl!cZy;ZPkpH=TGCz5M{Jf<{>&@}==J<JY{Jc4S)*QcHyzlf+#5})8gZ`'
+    'd*e(m}9%#ojkoL9>CPn{><8+E>XuR+edKiQA7NWM-vx18bZ%vmBo=Q+GjB*8qu(byzE8@c}_'
+    '^9=d9ZAsvqK*{6EorEsbDKayM`Zo0$>O0hK)Tz|&)M?Zn)alfo)EU%gsWYj)sI#cOsk5nlsB'
+    '@@&sdK6QsPm}(sq?7=s0*YoL|sT7NL@r7L|sfBOkF~KPJUL@A=IVRq10v6=c&u7FHl!dhf!B'
+    'jhf`NkU!<<4zC>L^eVO_m^%d$`>ImxlawkLfa8h5TuA`2kuBX06-9Q~p-AH|%x{3M*bu)Dgb'
+    'qjSYbt`oobsP0f>UQdQ>JI7z>Q3rJ>W9=x)LqoKsJrDp2z3v23Ux2_ZR$tVcc>pzr&2$mPNV'
+    'LlPN(jt&Y&Kk&ZHis&Z2%wolQMNokKlLol8AJoku-NoliYRT|hlfT}VAaT}1tix|n*Bx<qo?'
+    ')OV?;sY|J6sLQCIQ<qb}pst{PNnJ_(in@yWHFdSj7oo0^86(v9sNYi8%DfTk`_%8VIeBTxN*'
+    '6#)6hti)LTwaAB#NL8ilVOUM@2mpLwyuS1C&5Rltd$xLSvLh6O=(yltmQoL^G7b-6)UdsDKu'
+    'zh?clZc7UN0?m=bTiz@gZLebiqx0wvZ5QO4LjuJ?Ll1PbCNQKf!jWS4svPg?Nkq+gM9_5h%6'
+    '_61XkqLJpGb$kqD&rPZK~{t!8^Ula!jT<SaT}^32dX0{B9IF;kQ+6T2elB4+Q^GY+>ScPhq?'
+    '$sJ>*Ay6hH$ML_-upBNRqs6hRXdMN`e2OV)f5KE+}j!V(<DyEuZSIErOBhUGYp6*z&F_zbIX'
+    '6030vYj7Ix;SAQ|bG(l)@BzNWI(&uo_!=8<78~&mHsM=r#&_6)@39r<unp(29T%_z7qJtU@F'
+    '9M{F8qky_z8RPGxp*ae1u=|F@Dqet&*wlg0bj|ad-xAq8rAeJ0_q9CZZ=M;aR+eUYLyDn4<Z'
+    '8$>{gPRP@I*48U}m3yT>Th?y9KSs0Ajcn)(g1amPI^YA?8;{`0hFf7DyEYkY|awp(ryo*<`6'
+    'eF+<Be5K>Vg*KFrQR=)I|Q#|jn1u=?EFBi!yv53U~Is1*oYz6grV4s=dlGZU@L}U8-`;$Uc?'
+    'T(gq?U9AL144!U*ifNbJF@*o#s42(RH|jK(K;9sBSG_G1hVU@Q(|96rUHIE3*yj0re`i8zW$'
+    'IEJ@yT;}!S1g79Kyp5B12d6L<r!fs@Fdd&`2EM>de2H233bXMw=HM*m;v3Avx0sLbumIm<A<'
+    'khD&SNnySaXD@U>)AZdc1=Tn2L><hE14`&6t5Ln2D{Jg>9IP?U;idn2Vj5hYv9yyRZPeu@HN'
+    '(2z#*@A7KeT#=H0gOR*2jupi5D04s11EAc5-;Sg5iFxKD*-osI>#WB2(<JSD-8h98r(H6Dv2'
+    'x_ApBJn8dpgrp1G1SB3sE-b4fG5xpPofc?LSsCQCg_N!=!7VAMl*E5-RO$ucm^%d4K2|ft<V'
+    'GapeOFdv-lr+p*4ErKJ>x;=!*x?4-cY09>Rc**XAcDLqP<g5R#)XQlJP@q9{_~4x~mgq(O0{'
+    'm7U#4hmuH-QpkYP$cQq?B(s{48FwNJ%HbB2M^;ooHdMr|xC_})3Adp#a-a%wA{4n0hTI589#'
+    'lmzsv$3`<90+KA8H^3HIW~+@PB93kj4'
+)
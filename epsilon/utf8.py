@@ -0,0 +1,120 @@
+# Epsilon
+# Copyright (C) 2018
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+from . import regex
+
+# Expressions over bytes, which lowered expressions belong to.
+octets = regex.expressions(((0, 0xff),))
+
+# The last code point of each UTF-8 encoded length but the longest.
+_LENGTHS = (0x7f, 0x7ff, 0xffff)
+
+def sequences(first, last):
+    """Generate the UTF-8 encodings of a range of code points.
+
+    The range is split so that each piece encodes to sequences of the
+    same length, which differ only within a range of each byte.
+    Surrogates have no encoding and are skipped.
+
+    :param first: the first code point.
+    :param last: the last code point.
+    :return: a generator of tuples of (first, last) byte ranges.
+    """
+    stack = [(first, last)]
+    while stack:
+        first, last = stack.pop()
+        if first <= 0xdfff and last >= 0xd800:
+            if last > 0xdfff:
+                stack.append((0xe000, last))
+            if first < 0xd800:
+                stack.append((first, 0xd7ff))
+            continue
+
+        split = next((bound for bound in _LENGTHS if first <= bound < last),
+                None)
+        if split is None:
+            # Split until the trailing bytes of first and last span whole
+            # continuation byte ranges, so the bytes vary independently.
+            for i in range(1, 4):
+                mask = (1 << (6 * i)) - 1
+                if first & ~mask != last & ~mask:
+                    if first & mask:
+                        split = first | mask
+                        break
+                    elif last & mask != mask:
+                        split = (last & ~mask) - 1
+                        break
+        if split is not None:
+            stack.append((split + 1, last))
+            stack.append((first, split))
+            continue
+
+        yield tuple(zip(chr(first).encode("utf-8"),
+                chr(last).encode("utf-8")))
+
+def lower(expr):
+    """Return the equivalent expression over UTF-8 encoded octets.
+
+    Each SymbolSet becomes the alternation of its encoded byte sequences
+    and the complement of an expression is restricted to valid UTF-8, so
+    an automaton of the result scans bytes with a 256 symbol alphabet.
+
+    :param expr: a regular expression over code points.
+    :return: a regular expression of the octets namespace.
+    """
+    lowered = {}
+    valid = octets.KleeneClosure(_symbolset(expr.SIGMA))
+
+    def visit(expr):
+        result = lowered.get(expr)
+        if result is not None:
+            return result
+
+        name = expr.__class__.__name__
+        if name == "SymbolSet":
+            result = _symbolset(expr)
+        elif name == "Complement":
+            result = octets.LogicalAnd(
+                    octets.Complement(visit(expr._expr)), valid)
+        elif name == "Repetition":
+            result = octets.Repetition(visit(expr._expr),
+                    expr._mincount, expr._maxcount)
+        else:
+            result = getattr(octets, name)(*map(visit, expr._args()))
+        lowered[expr] = result
+        return result
+
+    return visit(expr)
+
+def _symbolset(symbolset):
+    # Sequences sharing a leading byte range are factored into a trie,
+    # which keeps alternations small for classes with many ranges.
+    trie = {}
+    for first, last in symbolset.codepoints:
+        for sequence in sequences(first, last):
+            node = trie
+            for byterange in sequence:
+                node = node.setdefault(byterange, {})
+    # A set without encodings, such as surrogates only, matches nothing.
+    return _factor(trie) if trie else octets.SymbolSet()
+
+def _factor(trie):
+    # An empty node ends a sequence.
+    if not trie:
+        return octets.Epsilon()
+    return octets.LogicalOr(*(
+            octets.Concatenation(octets.SymbolSet((byterange,)), _factor(node))
+            for byterange, node in trie.items()))
@@ -14,7 +14,9 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
+import array
 import bisect
+import collections
 import functools
 import itertools
 import sys
@@ -34,10 +36,123 @@ def product_intersections(*sets):
     """
     return set(x[0].intersection(*x[1:]) for x in itertools.product(*sets))
 
-class IntegerSet(tuple):
-    """An immutable set of integers, represented as sorted tuple of disjoint,
-    non-contiguous ranges.
+def refine_partitions(*partitions):
+    """Return the coarsest common refinement of partitions of integers.
+
+    This yields the same blocks as the nonempty product_intersections()
+    of the partitions, but it never forms the cartesian product. Instead
+    the elementary intervals between block boundaries carry a block label,
+    and each block of each partition splits the labels it covers.
+    Skipping the block with most ranges in every partition, the cost is
+    proportional to the number of boundaries times the number of
+    partitions.
+
+    :param partitions: Iterables of disjoint IntegerSets, each covering
+    the same integers.
+    :return: A list of disjoint IntegerSets, ordered by least element.
     """
+    partitions = [[IntegerSet(block)._bounds for block in partition]
+            for partition in partitions]
+    points = sorted(set(itertools.chain.from_iterable(
+            bounds for partition in partitions for bounds in partition)))
+    index = {x: i for i, x in enumerate(points)}
+
+    # labels[i] is the block of the interval [points[i], points[i+1]).
+    labels = [None] * max(len(points) - 1, 0)
+    count = 0
+    for n, partition in enumerate(partitions):
+        largest = max(partition, key = len, default = None) if n else None
+        for bounds in partition:
+            if bounds is largest:
+                continue
+            split = {}
+            for k in range(0, len(bounds), 2):
+                for i in range(index[bounds[k]], index[bounds[k + 1]]):
+                    label = labels[i]
+                    if label not in split:
+                        split[label] = count
+                        count += 1
+                    labels[i] = split[label]
+
+    # Adjacent intervals with the same label are joined as they are added.
+    blocks = collections.OrderedDict()
+    for i, label in enumerate(labels):
+        if label is not None:
+            bounds = blocks.get(label)
+            if bounds is None:
+                blocks[label] = array.array("I", points[i:i + 2])
+            elif bounds[-1] == points[i]:
+                bounds[-1] = points[i + 1]
+            else:
+                bounds.extend(points[i:i + 2])
+    return [IntegerSet._from_bounds(bounds) for bounds in blocks.values()]
+
+# Boundary arrays list the first and one past the last integer of every
+# range. _MAX stands for infinity in complements.
+_MAX = 0xffffffff
+
+def _intersect(a, b):
+    """Intersect two boundary arrays.
+
+    Each range of the shorter array copies the boundaries of the other
+    which fall inside it, found by bisection, so most of the work is
+    done by slicing.
+    """
+    if len(a) > len(b):
+        a, b = b, a
+    bounds = array.array("I")
+    for k in range(0, len(a), 2):
+        first, end = a[k], a[k + 1]
+        i = bisect.bisect_right(b, first)
+        j = bisect.bisect_left(b, end, i)
+        if i & 1:
+            bounds.append(first)
+        bounds.extend(b[i:j])
+        if j & 1:
+            bounds.append(end)
+    return bounds
+
+def _complement(bounds):
+    """Complement a boundary array."""
+    if bounds and bounds[0] == 0:
+        bounds = bounds[1:]
+    else:
+        bounds = array.array("I", [0]) + bounds
+    if bounds and bounds[-1] == _MAX:
+        del bounds[-1]
+    else:
+        bounds.append(_MAX)
+    return bounds
+
+def _runs(mask):
+    """Return the boundary array of the set bits of an integer."""
+    bounds = array.array("I")
+    offset = 0
+    while mask:
+        zeros = (mask & -mask).bit_length() - 1
+        mask >>= zeros
+        ones = (~mask & (mask + 1)).bit_length() - 1
+        mask >>= ones
+        bounds.append(offset + zeros)
+        bounds.append(offset + zeros + ones)
+        offset += zeros + ones
+    return bounds
+
+@functools.total_ordering
+class IntegerSet:
+    """An immutable set of non-negative integers.
+
+    Integers below 256, which make up most character classes, are held
+    as the bits of an integer, so that their set operations are a few
+    word operations. Larger integers are held as a sorted array of the
+    boundaries of disjoint, non-contiguous ranges.
+
+    It behaves as a sorted sequence of (first, last) range pairs: it may
+    be iterated, indexed and measured, and it orders, prints and pickles
+    like a tuple of those pairs.
+    """
+
+    __slots__ = ("_low", "_tail", "_full", "_hash")
 
     def __new__(cls, iterable = ()):
         """Return a new set of integers.
@@ -48,40 +163,132 @@ class IntegerSet(tuple):
         last, the range is treated as empty.
         A bare integer, x, represents the range (x, x).
         """
+        if isinstance(iterable, cls):
+            return iterable
 
-        def canonical(iterable):
-            ranges = sorted(filter(lambda r: r[0] <= r[1],
-                    ((x, x) if isinstance(x, int) else (int(x[0]), int(x[1]))
-                        for x in iterable)))
-            if ranges:
-                r = ranges[0]
-                for s in ranges[1:]:
-                    if s[0] > r[1] + 1:
-                        yield r
-                        r = s
-                    else:
-                        r = (r[0], max(r[1], s[1]))
-                yield r
+        bounds = array.array("I")
+        ranges = sorted(filter(lambda r: r[0] <= r[1],
+                ((x, x) if isinstance(x, int) else (int(x[0]), int(x[1]))
+                    for x in iterable)))
+        for first, last in ranges:
+            if bounds and first <= bounds[-1]:
+                bounds[-1] = max(bounds[-1], last + 1)
+            else:
+                bounds.append(first)
+                bounds.append(last + 1)
+        return cls._from_bounds(bounds)
 
-        if isinstance(iterable, cls):
-            self = super().__new__(cls, iterable)
+    @classmethod
+    def _from_bounds(cls, bounds):
+        k = bisect.bisect_right(bounds, 256)
+        low = 0
+        for i in range(0, k - 1, 2):
+            low |= (1 << bounds[i + 1]) - (1 << bounds[i])
+        if k & 1:
+            low |= (1 << 256) - (1 << bounds[k - 1])
+            tail = array.array("I", [256]) + bounds[k:]
         else:
-            self = super().__new__(cls, canonical(iterable))
+            tail = bounds[k:]
+        self = cls._from_parts(low, tail)
+        self._full = bounds
+        return self
+
+    @classmethod
+    def _from_parts(cls, low, tail):
+        self = super().__new__(cls)
+        self._low = low
+        self._tail = tail
+        self._full = None
+        self._hash = hash((low, tail.tobytes()))
         return self
 
+    @property
+    def _bounds(self):
+        """The boundaries of all the ranges, computed when first needed."""
+        if self._full is None:
+            bounds = _runs(self._low)
+            tail = self._tail
+            if bounds and tail and bounds[-1] == tail[0]:
+                del bounds[-1]
+                bounds.extend(tail[1:])
+            else:
+                bounds.extend(tail)
+            self._full = bounds
+        return self._full
+
+    def __iter__(self):
+        # zip() draws first and then one past last from the same iterator.
+        bounds = iter(self._bounds)
+        return zip(bounds, map((-1).__add__, bounds))
+
+    def __len__(self):
+        return len(self._bounds) >> 1
+
+    def __bool__(self):
+        return bool(self._low or self._tail)
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return tuple(self)[i]
+        if i < 0:
+            i += len(self)
+        if not 0 <= i < len(self):
+            raise IndexError("IntegerSet index out of range")
+        return self._bounds[2 * i], self._bounds[2 * i + 1] - 1
+
+    def __eq__(self, other):
+        if not isinstance(other, IntegerSet):
+            return NotImplemented
+        return self._hash == other._hash and self._low == other._low\
+                and self._tail == other._tail
+
+    def __lt__(self, other):
+        if not isinstance(other, IntegerSet):
+            return NotImplemented
+        # Lexicographic order of the boundaries is that of the ranges.
+        return self._bounds < other._bounds
+
+    def __hash__(self):
+        return self._hash
+
+    def __repr__(self):
+        return repr(tuple(self))
+
+    def __reduce__(self):
+        return self.__class__, (tuple(self),)
+
+    @classmethod
+    def frombytes(cls, data):
+        """Return the set of integers serialized by tobytes()."""
+        bounds = array.array("I")
+        bounds.frombytes(data)
+        if sys.byteorder != "little":
+            bounds.byteswap()
+        return cls._from_bounds(bounds)
+
+    def tobytes(self):
+        """Serialize the set as its range boundaries, which are little
+        endian 32 bit integers.
+        """
+        bounds = array.array("I", self._bounds)
+        if sys.byteorder != "little":
+            bounds.byteswap()
+        return bounds.tobytes()
+
     def has(self, x):
         """Test for set membership.
 
         :param x: an integer
         :return: True if the integer is a member of the set.
         """
-        i = bisect.bisect(self, (x,))
-        return (i < len(self) and x == self[i][0])\
-                or (i > 0 and self[i-1][0] <= x <= self[i-1][1])
+        if x < 256:
+            return x >= 0 and (self._low >> x) & 1 == 1
+        return bisect.bisect(self._tail, x) & 1 == 1
 
     def cardinality(self):
         """Return the number of integers in the set."""
-        return functools.reduce(lambda l, r: l + r[1] - r[0] + 1, self, 0)
+        tail = self._tail
+        return bin(self._low).count("1") + sum(tail[1::2]) - sum(tail[::2])
 
     def isdisjoint(self, other):
         """Return True if the set has no integers in common with other."""
@@ -89,90 +296,48 @@ class IntegerSet(tuple):
 
     def issubset(self, other):
         """Test whether every integer in the set is in other."""
-        if not isinstance(other, self.__class__):
-            other = self.__class__(other)
-
-        i = iter(other)
-        r = next(i, None)
-        for s in self:
-            while r and r[1] < s[0]:
-                r = next(i, None)
-            if not r or s[0] < r[0] or s[1] > r[1]:
-                return False
-        return True
+        return not self.difference(other)
 
     def issuperset(self, other):
         """Test whether every integer in other is in the set."""
-        if not isinstance(other, self.__class__):
-            other = self.__class__(other)
-
-        i = iter(self)
-        r = next(i, None)
-        for s in other:
-            while r and r[1] < s[0]:
-                r = next(i, None)
-            if not r or s[0] < r[0] or s[1] > r[1]:
-                return False
-        return True
+        return not self.__class__(other).difference(self)
 
     def union(self, *others):
         """Return a new set with integers from the set and all others."""
-        return self.__class__(itertools.chain(self, *others))
+        low, tail = self._low, self._tail
+        for other in others:
+            other = self.__class__(other)
+            low |= other._low
+            if not tail:
+                tail = other._tail
+            elif other._tail:
+                tail = _complement(_intersect(
+                        _complement(tail), _complement(other._tail)))
+        return self._from_parts(low, tail)
 
     def intersection(self, *others):
         """Return a new set with integers common to the set and all others."""
-        intersection = self
+        low, tail = self._low, self._tail
         for other in others:
-            if not isinstance(other, self.__class__):
-                other = self.__class__(other)
-
-            ranges = []
-            i, j = iter(intersection), iter(other)
-            r, s = next(i, None), next(j, None)
-            while r and s:
-                x, y = max(r[0], s[0]), min(r[1], s[1])
-                if x <= y:
-                    ranges.append((x, y))
-                r = r if r[1] > y else next(i, None)
-                s = s if s[1] > y else next(j, None)
-            intersection = self.__class__(ranges)
-        return intersection
+            other = self.__class__(other)
+            low &= other._low
+            if tail:
+                tail = _intersect(tail, other._tail)
+        return self._from_parts(low, tail)
 
     def difference(self, *others):
         """Return a new set with integers in the set but not in the others."""
-        difference = self
+        low, tail = self._low, self._tail
         for other in others:
-            if not isinstance(other, self.__class__):
-                other = self.__class__(other)
-
-            ranges = []
-            i, j = iter(difference), iter(other)
-            r, s = next(i, None), next(j, None)
-            while r:
-                if s:
-                    if r[0] > s[1]:
-                        s = next(j, None)
-                    elif r[1] < s[0]:
-                        ranges.append(r)
-                        r = next(i, None)
-                    else:
-                        if r[0] < s[0]:
-                            ranges.append((r[0], s[0] - 1))
-                        if r[1] > s[1]:
-                            r = (s[1] + 1, r[1])
-                            s = next(j, None)
-                        else:
-                            r = next(i, None)
-                else:
-                    ranges.append(r)
-                    r = next(i, None)
-            difference = self.__class__(ranges)
-        return difference
+            other = self.__class__(other)
+            low &= ~other._low
+            if tail and other._tail:
+                tail = _intersect(tail, _complement(other._tail))
+        return self._from_parts(low, tail)
 
     def symmetric_difference(self, other):
         """Return a new set with integers in either the set or other,
         but not both.
         """
-        if not isinstance(other, self.__class__):
-            other = self.__class__(other)
+        other = self.__class__(other)
         return self.difference(other).union(other.difference(self))
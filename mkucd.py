@@ -14,36 +14,155 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
-import itertools
-import pprint
-import requests
+"""
+Generate epsilon/ucd.py from a local copy of the Unicode Character Database.
+
+Usage: python mkucd.py UCD_DIRECTORY > epsilon/ucd.py
+
+The directory is an unpacked UCD.zip, for example from
+https://www.unicode.org/Public/14.0.0/ucd/UCD.zip.
+"""
+
+import array
+import base64
+import collections
+import os.path
 import sys
+import zlib
 import epsilon.util
 
-ucd = "https://www.unicode.org/Public/10.0.0/ucd"
-
-def fetch(path):
-    properties = {}
-    response = requests.get(path)
-    response.raise_for_status()
-    for line in response.text.splitlines():
-        line = line.partition("#")[0]
-        fields = [s.strip() for s in line.split(";")]
-        if len(fields) > 1:
-            codepoints, name = fields[:2]
-            first, _, last = codepoints.partition("..")
-            first, last = int(first, 16), int(last, 16) if last else None
-            if name not in properties:
-                properties[name] = []
-            properties[name].append((first, last) if last else first)
-
-    # canonicalize
-    for name in properties:
-        properties[name] = epsilon.util.IntegerSet(properties[name])
-
-    return properties
-
-print('''# This file is derived from the Unicode Data Files, and is licensed
+def read(directory, name):
+    """Generate the fields of the data lines of a UCD file."""
+    with open(os.path.join(directory, name), encoding = "utf-8") as stream:
+        for line in stream:
+            fields = [s.strip() for s in line.partition("#")[0].split(";")]
+            if len(fields) > 1:
+                yield fields
+
+def version(directory):
+    """Return the Unicode version of the UCD, from the first line of
+    Scripts.txt, which is "# Scripts-VERSION.txt"."""
+    with open(os.path.join(directory, "Scripts.txt"),
+            encoding = "utf-8") as stream:
+        line = stream.readline().strip()
+    if not (line.startswith("# Scripts-") and line.endswith(".txt")):
+        raise ValueError("unrecognized Scripts.txt header: " + line)
+    return line[len("# Scripts-"):-len(".txt")]
+
+def codepoints(field):
+    first, _, last = field.partition("..")
+    return int(first, 16), int(last or first, 16)
+
+def properties(directory, name, binary = False):
+    """Return a dict of property values to IntegerSets.
+
+    :param binary: whether to skip the lines of non-binary properties,
+    which have a value field.
+    """
+    ranges = collections.defaultdict(list)
+    for fields in read(directory, name):
+        if not binary or len(fields) == 2:
+            ranges[fields[1]].append(codepoints(fields[0]))
+    return {value: epsilon.util.IntegerSet(ranges[value])
+            for value in ranges}
+
+def aliases(directory):
+    """Return the short to long name aliases of scripts and properties."""
+    scripts, binary = {}, {}
+    for fields in read(directory, "PropertyValueAliases.txt"):
+        if fields[0] == "sc":
+            scripts.update((alias, fields[2])
+                    for alias in [fields[1]] + fields[3:])
+    for fields in read(directory, "PropertyAliases.txt"):
+        binary.update((alias, fields[1]) for alias in [fields[0]] + fields[2:])
+    return scripts, binary
+
+def script_extensions(directory, scripts, script_aliases):
+    """Return a dict of scripts to the IntegerSets of their extensions.
+
+    Codepoints which are not listed have their script as their only
+    extension.
+    """
+    listed = collections.defaultdict(list)
+    for fields in read(directory, "ScriptExtensions.txt"):
+        for alias in fields[1].split():
+            listed[script_aliases[alias]].append(codepoints(fields[0]))
+    everything = epsilon.util.IntegerSet().union(*listed.values())
+    return {name: scripts.get(name, epsilon.util.IntegerSet())
+                .difference(everything).union(listed.get(name, ()))
+            for name in set(scripts).union(listed)}
+
+def case_folding(directory):
+    """Return the simple case folding, a dict of codepoints to codepoints."""
+    return {int(fields[0], 16): int(fields[2], 16)
+            for fields in read(directory, "CaseFolding.txt")
+            if fields[1] in ("C", "S")}
+
+# The properties are stored as the concatenated range boundaries of every
+# codepoint set, followed by the pairs of the case folding, compressed and
+# base85 encoded. The data is decompressed when it is first used, and
+# each set is decoded when first used.
+_loader = '''
+import array
+import base64
+import collections.abc
+import sys
+import zlib
+from . import util
+
+_bounds = None
+
+def _load(start, end):
+    global _bounds
+    if _bounds is None:
+        _bounds = zlib.decompress(base64.b85decode("".join(_data)))
+    return _bounds[start:end]
+
+class _Properties(collections.abc.Mapping):
+    """A read only mapping of property names to IntegerSets."""
+
+    def __init__(self, index):
+        self._index = index
+        self._sets = {}
+
+    def __getitem__(self, name):
+        codepoints = self._sets.get(name)
+        if codepoints is None:
+            codepoints = util.IntegerSet.frombytes(_load(*self._index[name]))
+            self._sets[name] = codepoints
+        return codepoints
+
+    def __iter__(self):
+        return iter(self._index)
+
+    def __len__(self):
+        return len(self._index)
+
+_folding = None
+
+def case_folding():
+    """Return the simple case folding, a dict of codepoints to codepoints."""
+    global _folding
+    if _folding is None:
+        pairs = array.array("I")
+        pairs.frombytes(_load(*_case_folding))
+        if sys.byteorder != "little":
+            pairs.byteswap()
+        _folding = dict(zip(pairs[::2], pairs[1::2]))
+    return _folding
+'''
+
+def emit(unicode, tables, script_aliases, property_aliases, folding):
+    """Print the ucd module.
+
+    :param unicode: the Unicode version of the tables.
+    :param tables: a list of (name, properties) pairs, where properties
+    maps property names to IntegerSets.
+    :param script_aliases: a dict of script aliases to script names.
+    :param property_aliases: a dict of property aliases to property names.
+    :param folding: a dict of codepoints to their simple case folding.
+    """
+    print('''# This file is derived from the Unicode Data Files, and is licensed
 # under the UNICODE, INC. LICENSE AGREEMENT - DATA FILES AND SOFTWARE.
 # A copy of the licence is shipped with this software and may also be
 # found online at http://unicode.org/copyright.html.
@@ -51,8 +170,73 @@ print('''# This file is derived from the Unicode Data Files, and is licensed
 # This file is automatically generated. *** DO NOT EDIT ***
 
 """
-Unicode 10.0.0 codepoint properties.
-"""
-''')
-print("general_categories =\\")
-pprint.pprint(fetch(ucd + "/extracted/DerivedGeneralCategory.txt"))
+Unicode {} codepoint properties.
+"""'''.format(unicode))
+    print(_loader)
+    print("version = {!r}".format(unicode))
+    print()
+
+    data = []
+    offset = 0
+    for name, properties in tables:
+        print("{} = _Properties({{".format(name))
+        for key in sorted(properties):
+            encoded = properties[key].tobytes()
+            print("    {!r}: ({}, {}),".format(
+                    key, offset, offset + len(encoded)))
+            data.append(encoded)
+            offset += len(encoded)
+        print("})")
+        print()
+
+    pairs = array.array("I", (x for item in sorted(folding.items())
+            for x in item))
+    if sys.byteorder != "little":
+        pairs.byteswap()
+    data.append(pairs.tobytes())
+    print("_case_folding = ({}, {})".format(offset, offset + len(data[-1])))
+    print()
+
+    for name, table in [("script_aliases", script_aliases),
+            ("property_aliases", property_aliases)]:
+        print("{} = {{".format(name))
+        for key in sorted(table):
+            print("    {!r}: {!r},".format(key, table[key]))
+        print("}")
+        print()
+
+    encoded = base64.b85encode(zlib.compress(b"".join(data), 9)).decode()
+    print("_data = (")
+    for i in range(0, len(encoded), 72):
+        print("    {!r}".format(encoded[i:i + 72]))
+    print(")")
+
+def main(directory):
+    scripts = properties(directory, "Scripts.txt")
+    script_aliases, property_aliases = aliases(directory)
+    binary = properties(directory, "PropList.txt", binary = True)
+    binary.update(properties(directory, "DerivedCoreProperties.txt",
+            binary = True))
+    tables = [("general_categories", properties(directory,
+                os.path.join("extracted", "DerivedGeneralCategory.txt"))),
+            ("scripts", scripts),
+            ("script_extensions",
+                script_extensions(directory, scripts, script_aliases)),
+            ("binary_properties", binary)]
+    folding = case_folding(directory)
+
+    # A truncated or mislaid file would silently leave a table empty.
+    for name, table in tables + [("script_aliases", script_aliases),
+            ("property_aliases", property_aliases),
+            ("case_folding", folding)]:
+        if not table:
+            raise ValueError("no {} in {}".format(name, directory))
+    emit(version(directory), tables, script_aliases,
+        {alias: name for alias, name in property_aliases.items()
+            if name in binary},
+        folding)
+
+if __name__ == "__main__":
+    if len(sys.argv) != 2:
+        sys.exit(__doc__.strip())
+    main(sys.argv[1])
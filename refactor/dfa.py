@@ -57,8 +57,8 @@ def ProductIntersect(a: util.IntegerSet, b: util.IntegerSet):
 def DerivClasses(state: regex.Expression):
     #log('state %s', state)
     if isinstance(state, regex.RegularVector):
-        classes = (DerivClasses(expr) for _, expr in state)
-        return filter(None, product_intersections(classes))
+        return util.refine_partitions(*(DerivClasses(expr)
+                                        for _, expr in state))
 
     elif isinstance(state, regex.Epsilon):
         return {regex.codespace}
@@ -77,24 +77,18 @@ def DerivClasses(state: regex.Expression):
 
     elif isinstance(state, regex.Cat):
         if Nullable(state._left):
-            return filter(
-                None,
-                ProductIntersect(DerivClasses(state._left),
-                                 DerivClasses(state._right)))
+            return util.refine_partitions(DerivClasses(state._left),
+                                          DerivClasses(state._right))
         else:
             return DerivClasses(state._left)
 
     elif isinstance(state, regex.Or):
-        return filter(
-            None,
-            ProductIntersect(DerivClasses(state._left),
-                             DerivClasses(state._right)))
+        return util.refine_partitions(DerivClasses(state._left),
+                                      DerivClasses(state._right))
 
     elif isinstance(state, regex.And):
-        return filter(
-            None,
-            ProductIntersect(DerivClasses(state._left),
-                             DerivClasses(state._right)))
+        return util.refine_partitions(DerivClasses(state._left),
+                                      DerivClasses(state._right))
 
     else:
         raise AssertionError(state)
@@ -53,6 +53,17 @@ class TestIntegerSet(unittest.TestCase):
         # Test that these computations are equivalent
         self.assertEqual(many, pair)
 
+    def test_refine(self):
+        a = util.IntegerSet([1, 2, 3])
+        b = util.IntegerSet([2, 3, 42])
+
+        left = {a, regex.codespace.difference(a)}
+        right = {b, regex.codespace.difference(b)}
+
+        refined = util.refine_partitions(left, right)
+        self.assertEqual(set(refined),
+                         set(filter(None, dfa.ProductIntersect(left, right))))
+
     def test_construction(self):
         for i in range(self.ITERATIONS):
             a = set(random.sample(range(self.RANGE), self.SAMPLES))
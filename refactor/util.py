@@ -15,6 +15,7 @@
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
 import bisect
+import collections
 import functools
 import itertools
 import sys
@@ -44,6 +45,54 @@ def canonical(iterable):
         yield r
 
 
+def refine_partitions(*partitions):
+    """Return the coarsest common refinement of partitions of integers.
+
+    This yields the same blocks as the nonempty product_intersections()
+    of the partitions, but it never forms the cartesian product. Instead
+    the elementary intervals between block boundaries carry a block label,
+    and each block of each partition splits the labels it covers.
+    Skipping the block with most ranges in every partition, the cost is
+    proportional to the number of boundaries times the number of
+    partitions.
+
+    :param partitions: Iterables of disjoint IntegerSets, each covering
+    the same integers.
+    :return: A list of disjoint IntegerSets, ordered by least element.
+    """
+    partitions = [list(partition) for partition in partitions]
+    points = sorted(set(itertools.chain.from_iterable(
+            (first, last + 1)
+                for partition in partitions
+                for block in partition
+                for first, last in block)))
+    index = {x: i for i, x in enumerate(points)}
+
+    # labels[i] is the block of the interval [points[i], points[i+1]).
+    labels = [None] * max(len(points) - 1, 0)
+    count = 0
+    for n, partition in enumerate(partitions):
+        largest = max(partition, key=len, default=None) if n else None
+        for block in partition:
+            if block is largest:
+                continue
+            split = {}
+            for first, last in block:
+                for i in range(index[first], index[last + 1]):
+                    label = labels[i]
+                    if label not in split:
+                        split[label] = count
+                        count += 1
+                    labels[i] = split[label]
+
+    blocks = collections.OrderedDict()
+    for i, label in enumerate(labels):
+        if label is not None:
+            blocks.setdefault(label, []).append(
+                (points[i], points[i + 1] - 1))
+    return [IntegerSet(ranges) for ranges in blocks.values()]
+
+
 class IntegerSet(tuple):
     """An immutable set of integers, represented as sorted tuple of disjoint,
     non-contiguous ranges.
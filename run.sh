@@ -61,6 +61,30 @@ demo() {
   cat README.md | python3 $out
 }
 
+bench-python-targets() {
+  ### Compare tokens per second of the table driven and direct coded scanners
+  mkdir -p _tmp
+  cli -o _tmp/bench_table.py examples/manual.epsilon
+  cli -t python-direct -o _tmp/bench_direct.py examples/manual.epsilon
+
+  python3 - <<'EOF'
+import sys
+import time
+sys.path.insert(0, "_tmp")
+import bench_table, bench_direct
+
+text = open("MANUAL.md").read() * 20
+for module in (bench_table, bench_direct):
+    best = float("inf")
+    for _ in range(5):
+        start = time.perf_counter()
+        count = sum(1 for _ in module.spans(module.example, text))
+        best = min(best, time.perf_counter() - start)
+    print("%-14s %8d tokens %8.3fs %10.0f tokens/s"
+        % (module.__name__, count, best, count / best))
+EOF
+}
+
 gen-png() {
   local name=${1:-manual}
   eps -t dot -o _tmp/$name.dot examples/$name.epsilon 